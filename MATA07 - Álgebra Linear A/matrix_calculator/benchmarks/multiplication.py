@@ -0,0 +1,57 @@
+"""
+Compara o tempo do produto de matrizes entre o algoritmo ingênuo (laço i-j-k, lendo e escrevendo
+cada elemento através da matriz) e o kernel atual da classe Matrix.
+
+Uso (a partir do diretório matrix_calculator):
+    python -m benchmarks.multiplication [--sizes 64 128 256 512] [--naive-limit 128]
+"""
+
+from matrix import Matrix
+import argparse, random, time
+
+def naive_multiply(x, y):
+    """
+    Produto de matrizes pelo laço i-j-k, acumulando cada termo diretamente na nova matriz.
+    """
+    rows, inner = x.get_order()
+    columns = y.get_order()[1]
+    new_matrix = Matrix(rows, columns)
+
+    for row in range(rows):
+        for column in range(columns):
+            for index in range(inner):
+                new_matrix[row: column] += x[row: index] * y[index: column]
+    return new_matrix
+
+def measure(function, *args):
+    """
+    Retorna o tempo, em segundos, de uma chamada da função.
+    """
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description = "Benchmark do produto de matrizes.")
+    parser.add_argument("--sizes", type = int, nargs = "+", default = [64, 128, 256, 512])
+    parser.add_argument("--naive-limit", type = int, default = 128, help = "maior ordem medida com o algoritmo ingênuo")
+    parser.add_argument("--seed", type = int, default = 0)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    print("{:>6} | {:>12} | {:>12} | {:>8}".format("ordem", "ingênuo (s)", "kernel (s)", "speedup"))
+
+    for size in args.sizes:
+        x = Matrix(size, size, [random.uniform(-1, 1) for index in range(size * size)])
+        y = Matrix(size, size, [random.uniform(-1, 1) for index in range(size * size)])
+
+        kernel_time = measure(x.__mul__, y)
+
+        if size <= args.naive_limit:
+            naive_time = measure(naive_multiply, x, y)
+            print("{:>6} | {:>12.3f} | {:>12.3f} | {:>7.1f}x".format(size, naive_time, kernel_time, naive_time / kernel_time))
+        else:
+            print("{:>6} | {:>12} | {:>12.3f} | {:>8}".format(size, "-", kernel_time, "-"))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""
+Mede o tempo das principais operações da classe Matrix, da leitura e escrita de arquivos de matrizes
+e da execução de scripts de instruções, em várias ordens de matrizes. Os resultados podem ser salvos
+em JSON e comparados com um resultado salvo anteriormente (baseline), indicando as regressões.
+
+O benchmark não utiliza o terminal da aplicação nem a rede. Os arquivos são criados em um diretório temporário.
+
+Uso (a partir do diretório matrix_calculator):
+    python -m benchmarks.suite [--sizes 16 64 128] [--repeat 3] [--cases add multiply ...]
+                               [--backend python] [--numeric float] [--output resultado.json]
+                               [--baseline baseline.json] [--tolerance 0.25] [--min-seconds 0.001]
+
+O código de saída é 1 caso alguma operação esteja mais lenta que o baseline além da tolerância.
+"""
+
+from interpreter import Application
+from interpreter.executor import Executor
+from interpreter.file import load_matrices, save_matrices
+from matrix import Matrix, get_backend, get_numeric_mode, set_backend, set_numeric_mode
+import argparse, json, os, platform, random, sys, tempfile, time
+
+def get_values(size, seed):
+    """
+    Retorna os valores (reais, entre -1 e 1) de uma matriz quadrada, sempre os mesmos para a mesma semente.
+    """
+    generator = random.Random(seed)
+    return [generator.uniform(-1, 1) for index in range(size * size)]
+
+def get_matrix(size, seed = 0):
+    """
+    Cria uma nova matriz quadrada. Como os resultados ficam salvos na matriz, cada medição usa uma matriz nova.
+    """
+    return Matrix.from_buffer(size, size, get_values(size, seed))
+
+def get_matrix_dicts(size):
+    """
+    Retorna duas matrizes no formato usado pelos arquivos de matrizes.
+    """
+    return [{"name": name, "order": [size, size], "values": get_values(size, seed)} for seed, name in enumerate("AB")]
+
+def get_script(size, filename):
+    """
+    Retorna as linhas de um script de instruções que carrega duas matrizes e realiza operações com elas.
+    """
+    return [
+        "load " + filename,
+        "C = A + B",
+        "D = A * B",
+        "E = A t",
+        "F = A * 2",
+        "G = (A * B)^t + inv(A) * 2",
+        "use C",
+        "L1 += 2L2",
+        "L2 <> L{}".format(size),
+        "L1 *= 3",
+        "E1,1 + E2,2 * 2",
+        "prop D",
+        "rank A"
+    ]
+
+def run_getitem(matrix):
+    size = matrix.get_order()[0]
+
+    for row in range(size):
+        for column in range(size): matrix[row: column]
+
+def run_setitem(matrix):
+    size = matrix.get_order()[0]
+
+    for row in range(size):
+        for column in range(size): matrix[row: column] = row - column
+
+def setup_file(directory, size, extension):
+    filename = os.path.join(directory, "matrices_{}{}".format(size, extension))
+    save_matrices(filename, get_matrix_dicts(size))
+    return (filename,)
+
+def setup_script(directory, size):
+    filename = setup_file(directory, size, ".mbin")[0]
+    return (Executor(Application()), get_script(size, filename))
+
+def run_script(executor, lines):
+    # Executa o script da mesma forma que o comando "execute", porém sem mostrar as saídas no terminal.
+    for instruction in executor.compile_instructions(lines):
+        instruction.execute()
+
+# Cada caso é uma tupla (preparação, execução). A preparação recebe o diretório temporário e a ordem
+# e retorna os argumentos da execução, que é a única parte medida.
+cases = {
+    "construction": (lambda directory, size: (size, get_values(size, 0)), lambda size, values: Matrix(size, size, values)),
+    "getitem": (lambda directory, size: (get_matrix(size),), run_getitem),
+    "setitem": (lambda directory, size: (get_matrix(size),), run_setitem),
+    "add": (lambda directory, size: (get_matrix(size, 0), get_matrix(size, 1)), lambda x, y: x + y),
+    "multiply": (lambda directory, size: (get_matrix(size, 0), get_matrix(size, 1)), lambda x, y: x * y),
+    "transpose": (lambda directory, size: (get_matrix(size),), lambda matrix: matrix.transpose()),
+    "determinant": (lambda directory, size: (get_matrix(size),), lambda matrix: matrix.get_determinant()),
+    "inverse": (lambda directory, size: (get_matrix(size),), lambda matrix: matrix.get_matrix_inverse()),
+    "power": (lambda directory, size: (get_matrix(size),), lambda matrix: matrix ** 5),
+    "str": (lambda directory, size: (get_matrix(size),), str),
+    "save_text": (lambda directory, size: (os.path.join(directory, "save.txt"), get_matrix_dicts(size)), save_matrices),
+    "load_text": (lambda directory, size: setup_file(directory, size, ".txt"), lambda filename: list(load_matrices(filename))),
+    "save_binary": (lambda directory, size: (os.path.join(directory, "save.mbin"), get_matrix_dicts(size)), save_matrices),
+    "load_binary": (lambda directory, size: setup_file(directory, size, ".mbin"), lambda filename: list(load_matrices(filename))),
+    "execute": (setup_script, run_script)
+}
+
+def measure(case, size, repeat, directory):
+    """
+    Retorna o menor tempo, em segundos, entre as execuções de um caso.
+    """
+    setup, function = cases[case]
+    times = []
+
+    for index in range(repeat):
+        args = setup(directory, size)
+
+        start = time.perf_counter()
+        function(*args)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def run(case_names, sizes, repeat):
+    """
+    Executa os casos em todas as ordens, retornando um dicionário {caso: {ordem: segundos}}.
+    """
+    results = dict()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for case in case_names:
+            results[case] = dict()
+
+            for size in sizes:
+                results[case][str(size)] = measure(case, size, repeat, directory)
+                print("{:>14} | {:>6} | {:>10.4f}".format(case, size, results[case][str(size)]), flush = True)
+    return results
+
+def compare(results, baseline, tolerance, min_seconds):
+    """
+    Compara os resultados com o baseline, retornando a lista de regressões (caso, ordem, razão).
+    Apenas os casos e ordens presentes nos dois resultados são comparados. Tempos do baseline menores
+    que min_seconds são muito afetados por ruído, então são mostrados, mas não indicam regressões.
+    """
+    regressions = []
+    print("\n{:>14} | {:>6} | {:>10} | {:>10} | {:>7}".format("caso", "ordem", "baseline", "atual", "razão"))
+
+    for case, times in results.items():
+        for size, seconds in times.items():
+            old_seconds = baseline.get(case, {}).get(size)
+            if not old_seconds: continue
+
+            ratio = seconds / old_seconds
+            regression = ratio > 1 + tolerance and old_seconds >= min_seconds
+            if regression: regressions.append((case, size, ratio))
+
+            print("{:>14} | {:>6} | {:>10.4f} | {:>10.4f} | {:>6.2f}x{}".format(case, size, old_seconds, seconds, ratio, "  REGRESSÃO" if regression else ""))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description = "Benchmark da biblioteca de matrizes e do interpretador.")
+    parser.add_argument("--sizes", type = int, nargs = "+", default = [16, 64, 128])
+    parser.add_argument("--repeat", type = int, default = 3, help = "número de execuções de cada caso (é usado o menor tempo)")
+    parser.add_argument("--cases", nargs = "+", choices = list(cases), default = list(cases))
+    parser.add_argument("--backend", choices = ["numpy", "python"], default = None)
+    parser.add_argument("--numeric", choices = ["exact", "float"], default = None)
+    parser.add_argument("--output", help = "arquivo JSON no qual os resultados serão salvos")
+    parser.add_argument("--baseline", help = "arquivo JSON, salvo com --output, com o qual os resultados serão comparados")
+    parser.add_argument("--tolerance", type = float, default = 0.25, help = "aumento relativo de tempo tolerado antes de indicar uma regressão")
+    parser.add_argument("--min-seconds", type = float, default = 0.001, help = "tempos do baseline abaixo desse valor não indicam regressões")
+    args = parser.parse_args()
+
+    if args.backend: set_backend(args.backend)
+    if args.numeric: set_numeric_mode(args.numeric)
+
+    results = run(args.cases, args.sizes, args.repeat)
+
+    if args.output:
+        info = {"python": platform.python_version(), "platform": platform.platform(), "backend": get_backend(), "numeric": get_numeric_mode(), "repeat": args.repeat}
+
+        with open(args.output, "w") as file:
+            json.dump({"info": info, "results": results}, file, indent = 4)
+
+    if args.baseline:
+        with open(args.baseline) as file: baseline = json.load(file)["results"]
+
+        regressions = compare(results, baseline, args.tolerance, args.min_seconds)
+        print("\n{} regressão(ões) encontrada(s).".format(len(regressions)))
+        if regressions: sys.exit(1)
+
+if __name__ == "__main__":
+    main()
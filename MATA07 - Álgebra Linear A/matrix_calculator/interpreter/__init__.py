@@ -1,7 +1,23 @@
-from matrix import Matrix
+from matrix import Matrix, get_backend, get_backends, get_numeric_mode, get_numeric_modes, set_backend, set_numeric_mode
+from matrix.errors import BackendNotAvailableError as MatrixBackendNotAvailableError
+from .batch import run_in_parallel
 from .executor import Executor
 from .terminal import Terminal
-from .file import load_instructions, load_matrices, save_matrices
+from .file import load_instructions, load_matrices, save_instructions, save_matrices
+
+class BackendNotAvailableError(Exception):
+    def __init__(self, backend_name):
+        self.__backend_name = backend_name
+
+    def __str__(self):
+        return "O backend \"{}\" não está instalado.".format(self.__backend_name)
+
+class BackendNotExistsError(Exception):
+    def __init__(self, backend_name):
+        self.__backend_name = backend_name
+
+    def __str__(self):
+        return "O backend \"{}\" não existe. Use: {}.".format(self.__backend_name, " | ".join(get_backends()))
 
 class MatrixNotExistsError(Exception):
     def __init__(self, matrix_name):
@@ -14,9 +30,28 @@ class NoMatrixInUseError(Exception):
     def __str__(self):
         return "Nenhuma matriz está sendo utilizada no momento."
 
+class NoSnapshotNameError(Exception):
+    def __str__(self):
+        return "Informe o nome do snapshot."
+
+class NumericModeNotExistsError(Exception):
+    def __init__(self, mode_name):
+        self.__mode_name = mode_name
+
+    def __str__(self):
+        return "O modo numérico \"{}\" não existe. Use: {}.".format(self.__mode_name, " | ".join(get_numeric_modes()))
+
+class SnapshotNotExistsError(Exception):
+    def __init__(self, snapshot_name):
+        self.__snapshot_name = snapshot_name
+
+    def __str__(self):
+        return "O snapshot \"{}\" não existe.".format(self.__snapshot_name)
+
 class Application(object):
     
     __matrices = dict()
+    __snapshots = dict()
     __current_matrix_name = None
     __finish = False
 
@@ -44,17 +79,21 @@ class Application(object):
             self.__terminal.output(error, error = True, error_line = n_line)
             return False
 
-    def execute_instructions(self, filename, encoding = None):
-        line_count = 0
-        
-        for instruction in load_instructions(filename, encoding = encoding):
-            line_count += 1
+    def execute_instructions(self, filename, encoding = None, jobs = 1):
+        # Todas as instruções do arquivo são analisadas antes da execução, de forma que
+        # cada linha é analisada uma única vez e apenas executada dentro do laço.
+        instructions = self.__executor.compile_instructions(load_instructions(filename, encoding = encoding))
+
+        # Com mais de um processo, as operações pesadas independentes são calculadas em paralelo,
+        # mas as instruções continuam sendo executadas (e mostradas) na ordem do arquivo.
+        if jobs > 1: instructions = run_in_parallel(instructions, self, jobs)
 
-            # Se não houver instrução, o programa prossegue para a próxima.
-            if not instruction: continue
-            
-            instruction = self.__terminal.input(instruction)
-            if not self.execute(instruction, line_count): break
+        for instruction in instructions:
+            self.__terminal.input(instruction.text)
+            if not self.execute(instruction, instruction.n_line): break
+
+    def get_backend(self):
+        return get_backend()
 
     def get_number_of_matrices(self):
         return len(self.__matrices)
@@ -69,10 +108,34 @@ class Application(object):
     def get_matrix_in_use(self):
         try: return self.get_matrix(self.__current_matrix_name), self.__current_matrix_name
         except: raise NoMatrixInUseError
+
+    def get_numeric_mode(self):
+        return get_numeric_mode()
+
+    def get_snapshots(self):
+        return self.__snapshots.copy()
    
     def load_matrices_from_file(self, filename, encoding = None):
         for matrix in load_matrices(filename, encoding = encoding):
-            self.__matrices[matrix["name"]] = Matrix(*matrix["order"], matrix["values"])
+            if not "elements" in matrix:
+                self.__matrices[matrix["name"]] = Matrix.from_buffer(*matrix["order"], matrix["values"])
+                continue
+
+            # Matrizes esparsas são criadas a partir dos seus elementos não nulos.
+            new_matrix = Matrix(*matrix["order"])
+
+            for row, column, value in matrix["elements"]:
+                new_matrix[row: column] = value
+            self.__matrices[matrix["name"]] = new_matrix
+
+    def restore_snapshot(self, snapshot_name):
+        if not snapshot_name: raise NoSnapshotNameError
+        if not snapshot_name in self.__snapshots: raise SnapshotNotExistsError(snapshot_name)
+
+        # As matrizes do snapshot são copiadas novamente, para que ele possa ser restaurado mais de uma vez.
+        matrices, self.__current_matrix_name = self.__snapshots[snapshot_name]
+        self.__matrices.clear()
+        self.__matrices.update({name: matrix.copy() for name, matrix in matrices.items()})
 
     def run(self):
         self.__finish = False
@@ -83,16 +146,46 @@ class Application(object):
             self.__terminal.update()
             self.execute(self.__terminal.input()) 
 
+    def save_instructions(self, filename, instructions, encoding = None):
+        save_instructions(filename, instructions, encoding = encoding)
+
     def save_matrices(self, filename, encoding = None):
-        matrices = [{"name": name, "order": matrix.get_order(), "values": matrix.to_list()} for name, matrix in self.__matrices.items()]
+        matrices = []
+
+        # Matrizes esparsas são salvas apenas com os seus elementos não nulos.
+        for name, matrix in self.__matrices.items():
+            if matrix.is_sparse(): matrices.append({"name": name, "order": matrix.get_order(), "elements": matrix.get_non_zero_elements()})
+            else: matrices.append({"name": name, "order": matrix.get_order(), "values": matrix.to_list()})
         save_matrices(filename, matrices, encoding = encoding)
 
+    def save_snapshot(self, snapshot_name):
+        if not snapshot_name: raise NoSnapshotNameError
+
+        # As cópias compartilham os elementos com as matrizes atuais, de forma que o snapshot é salvo
+        # sem percorrer os elementos. Uma matriz só é copiada de fato quando ela (ou a sua cópia) é alterada.
+        matrices = {name: matrix.copy() for name, matrix in self.__matrices.items()}
+        self.__snapshots[snapshot_name] = (matrices, self.__current_matrix_name)
+
+    def set_backend(self, backend_name):
+        if not backend_name in get_backends(): raise BackendNotExistsError(backend_name)
+
+        try: set_backend(backend_name)
+        except MatrixBackendNotAvailableError: raise BackendNotAvailableError(backend_name)
+
     def set_config(self, name, value):
         self.__terminal.set_config(name, value)
 
     def set_matrix(self, matrix_name, matrix):
         self.__matrices[matrix_name] = matrix
 
+    def set_numeric_mode(self, mode_name):
+        if not mode_name in get_numeric_modes(): raise NumericModeNotExistsError(mode_name)
+        set_numeric_mode(mode_name)
+
+        # As matrizes existentes são convertidas para o novo modo: frações no modo exato e floats no outro.
+        for name, matrix in self.__matrices.items():
+            self.__matrices[name] = matrix.to_exact() if mode_name == "exact" else matrix.to_float()
+
     def stop(self):
         self.__finish = True
     
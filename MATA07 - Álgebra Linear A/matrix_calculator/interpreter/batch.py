@@ -0,0 +1,162 @@
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from matrix import get_backend, get_numeric_mode, set_backend, set_numeric_mode
+from .executor import CompiledInstruction, Executor
+from .parser import get_nodes
+
+__all__ = ("get_dependencies", "run_in_parallel")
+
+# Operações pesadas, calculadas em outros processos quando um script é executado com mais de um processo.
+heavy_matrix_operators = ["**", "inv", "adj", "cof"]
+heavy_expression_nodes = ["mul", "pow", "inv", "adj", "cof"]
+
+class WorkerCore(object):
+    """
+    Núcleo usado pelos executores nos processos de trabalho. Possui apenas as matrizes
+    lidas pela instrução e registra as matrizes que ela salvou.
+    """
+    def __init__(self, matrices):
+        self.__matrices = matrices
+        self.__changes = dict()
+
+    def get_changes(self):
+        return self.__changes
+
+    def get_matrix(self, matrix_name):
+        return self.__matrices[matrix_name]
+
+    def get_numeric_mode(self):
+        # O modo numérico do processo já foi definido por evaluate, com o mesmo modo do núcleo principal.
+        return get_numeric_mode()
+
+    def set_matrix(self, matrix_name, matrix):
+        self.__changes[matrix_name] = matrix
+
+class ComputedInstruction(CompiledInstruction):
+    """
+    Instrução já calculada em outro processo. Ao ser executada, apenas salva as matrizes
+    resultantes e retorna a saída, ou lança o erro ocorrido durante o cálculo.
+    """
+    def __init__(self, instruction, core, output = None, changes = None, error = None):
+        super().__init__(instruction.text, instruction.n_line)
+        self.__core, self.__output, self.__changes, self.__error = core, output, changes, error
+
+    def execute(self):
+        if self.__error is not None: raise self.__error
+
+        for matrix_name, matrix in self.__changes.items():
+            self.__core.set_matrix(matrix_name, matrix)
+        return self.__output
+
+def evaluate(instruction, matrices, backend_name, numeric_mode):
+    """
+    Executa uma instrução em um processo de trabalho, retornando a sua saída e as matrizes salvas.
+    """
+    set_backend(backend_name)
+    set_numeric_mode(numeric_mode)
+    core = WorkerCore(matrices)
+
+    output = Executor(core).execute(instruction)
+    return output, core.get_changes()
+
+def get_dependencies(instruction):
+    """
+    Retorna uma tupla (lidas, salvas, pesada) com os nomes das matrizes lidas e salvas por uma instrução
+    e se ela é uma operação pesada. Caso não seja possível saber quais matrizes a instrução altera
+    (ex: load, use, operações elementares), as matrizes salvas são None.
+    """
+    instruction = instruction.get_instruction()
+
+    # Instruções que não foram reconhecidas não alteram nenhuma matriz, apenas geram um erro.
+    if instruction is None: return set(), set(), False
+    operation = instruction["operation"]
+
+    if operation == "matrix":
+        reads = {name for name in (instruction["x"], instruction["y"]) if name.isalpha()}
+        heavy = instruction["operator"] in heavy_matrix_operators or (instruction["operator"] == "*" and instruction["y"].isalpha())
+        return reads, {instruction["var"]}, heavy
+
+    if operation == "expression":
+        nodes = list(get_nodes(instruction["expression"]))
+        reads = {node[1] for node in nodes if node[0] == "matrix"}
+        return reads, {instruction["var"]}, any(node[0] in heavy_expression_nodes for node in nodes)
+
+    # O comando "prop" apenas lê a matriz, mas pode calcular o determinante e produtos.
+    if operation == "application" and instruction["command"] == "prop":
+        return {instruction["args"]}, set(), True
+
+    # Operações aritméticas apenas leem a matriz em uso.
+    if operation == "arithmetic": return set(), set(), False
+    return set(), None, False
+
+def run_in_parallel(instructions, core, jobs):
+    """
+    Função geradora que retorna as instruções na mesma ordem, para serem executadas pelo núcleo. As instruções
+    pesadas são calculadas antecipadamente em até N processos, assim que as matrizes que elas leem estiverem
+    prontas, e são retornadas como ComputedInstruction. As demais são retornadas sem alteração.
+
+    Como as instruções são executadas em ordem pelo núcleo, a saída e os erros são os mesmos da execução
+    sequencial. Após um erro, o núcleo interrompe o laço e os cálculos restantes são cancelados.
+    """
+    writers, barrier = dict(), None
+    dependencies = []
+
+    # Para cada instrução, obtém a última instrução anterior que salvou cada matriz lida e a última que pode ter alterado qualquer matriz.
+    for index, instruction in enumerate(instructions):
+        reads, writes, heavy = get_dependencies(instruction)
+        dependencies.append((instruction, heavy, {name: writers.get(name) for name in reads}, barrier))
+
+        if writes is None: barrier = index
+        else: writers.update({name: index for name in writes})
+
+    futures = dict()
+    pending = [index for index, (instruction, heavy, reads, barrier) in enumerate(dependencies) if heavy]
+
+    def get_result(index):
+        # Retorna as matrizes salvas por uma instrução pesada já calculada (sem erro), ou None.
+        future = futures.get(index)
+        if future is None or not future.done() or future.exception() is not None: return None
+        return future.result()[1]
+
+    def submit(current):
+        # Envia aos processos as instruções pesadas cujas matrizes lidas já estão prontas. As instruções
+        # anteriores à atual já foram executadas, então as suas matrizes estão no núcleo.
+        matrices = core.get_matrices()
+
+        for index in pending[:]:
+            instruction, heavy, reads, barrier = dependencies[index]
+            if barrier is not None and barrier >= current: continue
+
+            inputs = dict()
+
+            for name, writer in reads.items():
+                if writer is None or writer < current: inputs[name] = matrices.get(name)
+                elif get_result(writer) is not None: inputs[name] = get_result(writer).get(name)
+                else: break
+
+            else:
+                pending.remove(index)
+
+                # Caso alguma matriz não exista, a instrução é executada normalmente, gerando o erro esperado.
+                if any(matrix is None for matrix in inputs.values()): continue
+                futures[index] = pool.submit(evaluate, instruction.text, inputs, get_backend(), get_numeric_mode())
+
+    pool = ProcessPoolExecutor(max_workers = jobs)
+
+    try:
+        for index, (instruction, heavy, reads, barrier) in enumerate(dependencies):
+            submit(index)
+
+            if not index in futures:
+                yield instruction
+                continue
+
+            # Enquanto a instrução atual não estiver pronta, envia as que forem ficando prontas.
+            while not futures[index].done():
+                wait([future for future in futures.values() if not future.done()], return_when = FIRST_COMPLETED)
+                submit(index)
+
+            try: instruction = ComputedInstruction(instruction, core, *futures.pop(index).result())
+            except Exception as error: instruction = ComputedInstruction(instruction, core, error = error)
+            yield instruction
+
+    finally: pool.shutdown(cancel_futures = True)
@@ -2,9 +2,29 @@ from ..parser import parse_instruction
 from .application_operation import ApplicationOperationExecutor
 from .arithmetic_operation import ArithmeticOperationExecutor
 from .elementary_operation import ElementaryOperationExecutor
+from .expression_operation import ExpressionOperationExecutor
 from .matrix_operation import MatrixOperationExecutor
 
-__all__ = ("Executor",)
+__all__ = ("CompiledInstruction", "Executor")
+
+class CompiledInstruction(object):
+    """
+    Instrução já analisada, associada ao executor responsável por ela. Caso a análise
+    tenha falhado, o erro é guardado e lançado somente quando a instrução for executada.
+    """
+    def __init__(self, text, n_line = None, executor = None, instruction = None, error = None):
+        self.text, self.n_line = text, n_line
+        self.__executor, self.__instruction, self.__error = executor, instruction, error
+
+    def execute(self):
+        if self.__error is not None: raise self.__error
+        return self.__executor.execute(self.__instruction)
+
+    def get_instruction(self):
+        """
+        Retorna o dicionário da instrução analisada, ou None caso a análise tenha falhado.
+        """
+        return self.__instruction if self.__error is None else None
 
 class Executor(object):
     def __init__(self, core):
@@ -13,18 +33,35 @@ class Executor(object):
         self.__application_op_executor = ApplicationOperationExecutor(core)
         self.__arithmetic_op_executor = ArithmeticOperationExecutor(core)
         self.__elementary_op_executor = ElementaryOperationExecutor(core)
+        self.__expression_op_executor = ExpressionOperationExecutor(core)
         self.__matrix_op_executor = MatrixOperationExecutor(core)
-        
-    def execute(self, instruction):
-        """
-        Executa uma instrução.
-        """
-        instruction = parse_instruction(instruction)
-        
-        options = {
+
+        self.__executors = {
             "application": self.__application_op_executor,
             "arithmetic": self.__arithmetic_op_executor,
             "elementary": self.__elementary_op_executor,
+            "expression": self.__expression_op_executor,
             "matrix": self.__matrix_op_executor
         }
-        return options[instruction["operation"]].execute(instruction)
+
+    def compile(self, instruction, n_line = None):
+        """
+        Analisa uma instrução e retorna um objeto CompiledInstruction, pronto para ser executado.
+        """
+        try: instruction_dict = parse_instruction(instruction)
+        except Exception as error: return CompiledInstruction(instruction, n_line, error = error)
+        return CompiledInstruction(instruction, n_line, self.__executors[instruction_dict["operation"]], instruction_dict)
+
+    def compile_instructions(self, instructions):
+        """
+        Analisa uma sequência de instruções (ex: linhas de um arquivo), ignorando as linhas vazias,
+        e retorna uma lista de objetos CompiledInstruction com o número da linha de cada um.
+        """
+        return [self.compile(instruction, n_line) for n_line, instruction in enumerate(instructions, 1) if instruction]
+
+    def execute(self, instruction):
+        """
+        Executa uma instrução, que pode ser uma string ou um objeto CompiledInstruction.
+        """
+        if not isinstance(instruction, CompiledInstruction): instruction = self.compile(instruction)
+        return instruction.execute()
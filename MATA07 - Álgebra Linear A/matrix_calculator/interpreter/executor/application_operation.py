@@ -1,11 +1,38 @@
 from .docs import command_list_string
 from .operation_errors import *
+from decimal import Decimal
+from fractions import Fraction
+from matrix.errors import InconsistentSystemError as MatrixInconsistentSystemError
 import re
 
 class ApplicationOperationExecutor(object):
     def __init__(self, core):
         self.__core = core
 
+    def __format_scalar(self, value):
+        # Escreve o escalar no formato aceito pelas operações elementares, sem notação científica.
+        if isinstance(value, complex):
+            real = self.__format_scalar(value.real) if value.real != 0 else ""
+            return "({}{}{}i)".format(real, "-" if value.imag < 0 else ("+" if real else ""), self.__format_scalar(abs(value.imag)))
+
+        # Frações (modo exato) são escritas como "numerador/denominador", aceito pelas operações de linhas.
+        if isinstance(value, Fraction): return str(value)
+        if isinstance(value, float) and value.is_integer(): return str(int(value))
+        if isinstance(value, float): return format(Decimal(repr(value)), "f")
+        return str(value)
+
+    def __get_echelon_form_string(self, matrix_name, reduced = False, log = False, log_filename = None):
+        matrix, steps = self.__core.get_matrix(matrix_name).get_echelon_form(reduced = reduced)
+        instructions = [self.__get_step_instruction(step) for step in steps]
+
+        # O registro das operações começa selecionando a matriz, para que possa ser executado com o comando "execute".
+        if log_filename:
+            self.__core.save_instructions(log_filename, ["use " + matrix_name] + instructions)
+
+        string = "Forma Escalonada Reduzida:\n" if reduced else "Forma Escalonada:\n"
+        if log and not log_filename: string = "Operações Elementares:\n" + ("\n".join(instructions) or "Nenhuma") + "\n\n" + string
+        return string + str(matrix)
+
     def __get_matrix_list_string(self, matrices):
         # Verifica se há matrizes. Se não, retorna uma mensagem diferente.
         if not matrices:
@@ -17,28 +44,91 @@ class ApplicationOperationExecutor(object):
             string += "\n- {} <{},{}>".format(name, *matrix.get_order())
         return string
 
+    def __get_null_space_string(self, null_space):
+        if null_space is None: return "O núcleo da matriz possui apenas o vetor nulo."
+        return "Base do Núcleo (uma coluna por vetor):\n" + str(null_space)
+
+    def __get_snapshot_list_string(self, snapshots):
+        # Verifica se há snapshots. Se não, retorna uma mensagem diferente.
+        if not snapshots:
+            return "Nenhum snapshot disponível. Use o comando \"snapshot <nome>\"."
+
+        string = "Lista de Snapshots:"
+
+        for name, (matrices, matrix_name) in snapshots.items():
+            string += "\n- {} <{} matrizes>".format(name, len(matrices))
+        return string
+
     def __get_matrix_properties_string(self, matrix):
+        properties = matrix.get_properties()
+
+        # Determinante e traço só existem para matrizes quadradas.
+        determinant = str(properties["determinant"]).replace("(","").replace(")","").replace("j","i") if properties["square"] else "N/D"
+        trace = str(properties["trace"]).replace("(","").replace(")","").replace("j","i") if properties["square"] else "N/D"
+
         string = "Propriedades da Matrix:"
-        string += "\n- Anti-hermitiana: " + str(matrix.is_skew_hermitian())
-        string += "\n- Anti-simétrica: " + str(matrix.is_skew_symmetric())
-        string += "\n- Coluna: " + str(matrix.is_column())
-        string += "\n- Complexa: " + str(matrix.is_complex())
-        string += "\n- Determinante: " + (str(matrix.get_determinant()).replace("(","").replace(")","").replace("j","i") if matrix.is_square() else "N/D")
-        string += "\n- Diagonal: " + str(matrix.is_diagonal())
-        string += "\n- Escalar: " + str(matrix.is_scalar())
-        string += "\n- Identidade: " + str(matrix.is_identity())
-        string += "\n- Hermitiana: " + str(matrix.is_hermitian())
-        string += "\n- Linha: " + str(matrix.is_row())
-        string += "\n- Normal: " + str(matrix.is_normal())
-        string += "\n- Nula: " + str(matrix.is_null())
-        string += "\n- Ortogonal: " + str(matrix.is_orthogonal())
-        string += "\n- Quadrada: " + str(matrix.is_square())
-        string += "\n- Simétrica: " + str(matrix.is_symmetric())
-        string += "\n- Traço: " + (str(matrix.get_trace()).replace("(","").replace(")","").replace("j","i") if matrix.is_square() else "N/D")
-        string += "\n- Triangular Inferior: " + str(matrix.is_lower_triangular())
-        string += "\n- Triangular Superior: " + str(matrix.is_upper_triangular())
+        string += "\n- Anti-hermitiana: " + str(properties["skew_hermitian"])
+        string += "\n- Anti-simétrica: " + str(properties["skew_symmetric"])
+        string += "\n- Coluna: " + str(properties["column"])
+        string += "\n- Complexa: " + str(properties["complex"])
+        string += "\n- Determinante: " + determinant
+        string += "\n- Diagonal: " + str(properties["diagonal"])
+        string += "\n- Escalar: " + str(properties["scalar"])
+        string += "\n- Identidade: " + str(properties["identity"])
+        string += "\n- Hermitiana: " + str(properties["hermitian"])
+        string += "\n- Linha: " + str(properties["row"])
+        string += "\n- Normal: " + str(properties["normal"])
+        string += "\n- Nula: " + str(properties["null"])
+        string += "\n- Ortogonal: " + str(properties["orthogonal"])
+        string += "\n- Quadrada: " + str(properties["square"])
+        string += "\n- Simétrica: " + str(properties["symmetric"])
+        string += "\n- Traço: " + trace
+        string += "\n- Triangular Inferior: " + str(properties["lower_triangular"])
+        string += "\n- Triangular Superior: " + str(properties["upper_triangular"])
         return string
 
+    def __get_solution_string(self, args):
+        names = args.split()
+        if len(names) != 2: raise NoMatricesError(2)
+
+        matrix_a, matrix_b = self.__core.get_matrix(names[0]), self.__core.get_matrix(names[1])
+        if matrix_a.get_order()[0] != matrix_b.get_order()[0]: raise SystemOrderError
+
+        try: solution, null_space = matrix_a.solve_system(matrix_b)
+        except MatrixInconsistentSystemError: raise InconsistentSystemError
+
+        if null_space is None: return "Solução:\n" + str(solution)
+        return "O sistema possui infinitas soluções.\n\nSolução Particular:\n{}\n\n{}".format(solution, self.__get_null_space_string(null_space))
+
+    def __get_step_instruction(self, step):
+        # Converte uma operação elementar do escalonamento para a sintaxe das operações de linhas.
+        operator, row1 = step[0], step[1]
+
+        if operator == "<>": return "L{} <> L{}".format(row1, step[2])
+
+        # Divisões exatas são escritas como o produto pela fração inversa, já que a divisão de uma linha
+        # de inteiros por um inteiro resulta em números de ponto flutuante fora do modo exato.
+        if operator == "/=" and isinstance(step[2], Fraction): return "L{} *= {}".format(row1, self.__format_scalar(1 / step[2]))
+        if operator == "/=": return "L{} /= {}".format(row1, self.__format_scalar(step[2]))
+
+        scalar, row2 = step[2], step[3]
+
+        # Escalares reais negativos são escritos com o operador de soma.
+        if not isinstance(scalar, complex) and scalar < 0: operator, scalar = "+=", -scalar
+        return "L{} {} {}L{}".format(row1, operator, self.__format_scalar(scalar) if scalar != 1 else "", row2)
+
+    def __parse_log_arg(self, string):
+        result = re.findall(" --log(=[^ ]+|)$", string)
+        if not result: return string, False, None
+        return re.sub(" --log(=[^ ]+|)$", "", string), True, result[0][1:] or None
+
+    def __parse_jobs_arg(self, string):
+        result = re.findall(" --jobs[= ]([0-9]+)", string)
+        jobs = int(result[0]) if result else 1
+
+        if jobs < 1: raise JobsNumberError
+        return re.sub(" --jobs[= ][0-9]+", "", string), jobs
+
     def __parse_file_args(self, string):
         result = re.findall(" --encoding=([a-zA-Z0-9-]+)$", string)
         encoding = result[0] if result else None
@@ -66,8 +156,19 @@ class ApplicationOperationExecutor(object):
 
         # Carrega instruções de um arquivo e as executa.
         elif command == "execute":
+            args, jobs = self.__parse_jobs_arg(args)
             filename, encoding = self.__parse_file_args(args)
-            self.__core.execute_instructions(filename = filename, encoding = encoding)
+            self.__core.execute_instructions(filename = filename, encoding = encoding, jobs = jobs)
+
+        # Altera o backend utilizado nas operações de matrizes. Sem argumentos, mostra o backend em uso.
+        elif command == "backend":
+            if not args: return "Backend em uso: {}".format(self.__core.get_backend())
+            self.__core.set_backend(args)
+
+        # Altera o modo numérico (frações ou ponto flutuante). Sem argumentos, mostra o modo em uso.
+        elif command == "numeric":
+            if not args: return "Modo numérico em uso: {}".format(self.__core.get_numeric_mode())
+            self.__core.set_numeric_mode(args)
 
         # Altera a configuração de imprimir a matriz na tela.
         elif command == "show":
@@ -86,6 +187,32 @@ class ApplicationOperationExecutor(object):
             matrix = self.__core.get_matrix(args)
             return self.__get_matrix_properties_string(matrix)
 
+        # Salva todas as matrizes em um snapshot. Sem argumentos, mostra a lista de snapshots.
+        elif command == "snapshot":
+            if not args: return self.__get_snapshot_list_string(self.__core.get_snapshots())
+            self.__core.save_snapshot(args)
+
+        # Restaura as matrizes salvas em um snapshot.
+        elif command == "restore":
+            self.__core.restore_snapshot(args)
+
+        # Imprime a forma escalonada (ou escalonada reduzida) de uma matriz e, opcionalmente, as operações realizadas.
+        elif command in ["ref", "rref"]:
+            matrix_name, log, log_filename = self.__parse_log_arg(args)
+            return self.__get_echelon_form_string(matrix_name, reduced = command == "rref", log = log, log_filename = log_filename)
+
+        # Imprime o posto de uma matriz.
+        elif command == "rank":
+            return "Posto da Matriz: {}".format(self.__core.get_matrix(args).get_rank())
+
+        # Imprime uma base do núcleo de uma matriz.
+        elif command == "nullspace":
+            return self.__get_null_space_string(self.__core.get_matrix(args).get_null_space())
+
+        # Resolve o sistema AX = B.
+        elif command == "solve":
+            return self.__get_solution_string(args)
+
         # Define uma matriz a ser usada nas operações elementares.
         elif command == "use":
             self.__core.use_matrix(args)
@@ -1,52 +1,34 @@
 from .operation_errors import *
+from fractions import Fraction
 
 class ArithmeticOperationExecutor(object):
     def __init__(self, core):
         self.__core = core
 
-    def __get_element_position(self, element):
-        row, column = element[1:].split(",")
-        return int(row), int(column)
-
     def __get_matrix_in_use(self):
         return self.__core.get_matrix_in_use()[0]
-     
-    def __replace_matrix_elements(self, expression, elements):
-        # Obtém a matriz em uso para substituir a representação
-        # dos elementos pelos seus respectivos valores.
-        matrix = self.__get_matrix_in_use()
-        
-        for element in elements:
-            row, column = self.__get_element_position(element)
 
-            # Obtém o valor a partir da posição do elemento.
-            try: value = matrix.get(row, column)
-            except: raise ElementPositionError((row, column))
+    def __get_result(self, value):
+        # As divisões entre inteiros geram frações, que são convertidas para float fora do modo exato.
+        if isinstance(value, Fraction) and self.__core.get_numeric_mode() != "exact": value = float(value)
 
-            # Formata o valor caso ele seja complexo.
-            if isinstance(value, complex):
-                value = "complex({},{})".format(value.real, value.imag)
+        # Remove os parênteses do número complexo e troca a letra "J" por "I".
+        return str(value).replace("(","").replace(")","").replace("j","i")
 
-            # Insere o valor na expressão.
-            expression = expression.replace(element, str(value))
-            
-        return expression
-    
     def execute(self, instruction: dict):
         """
-        Obtém um dicionário {"expression": ..., "elements": [...]}
+        Obtém um dicionário {"expression": ...}, com a expressão já compilada,
         e retorna o resultado do cálculo da expressão.
         """
-        expression = instruction["expression"]
-        elements = instruction["elements"]
-        
-        # Substitui os E(posição) pelos seus respectivos valores.
-        expression = self.__replace_matrix_elements(expression, elements)
+        matrix = self.__get_matrix_in_use()
+
+        def get_element(row, column):
+            # Os elementos são lidos diretamente da matriz em uso.
+            try: return matrix.get(row, column)
+            except: raise ElementPositionError((row, column))
 
         # Realiza o cálculo.
-        try:
-            result = str(eval(expression))
-            result = result.replace("(","").replace(")","").replace("j","i")
-            return "Resultado: " + result
-        except:
-            raise ExpressionSyntaxError
+        try: result = instruction["expression"](get_element)
+        except ZeroDivisionError: raise ZeroScalarDivisionError
+        except (ArithmeticError, TypeError, ValueError): raise ExpressionSyntaxError
+        return "Resultado: " + self.__get_result(result)
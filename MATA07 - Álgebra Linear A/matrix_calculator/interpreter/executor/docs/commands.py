@@ -1,17 +1,26 @@
 __all__ = ("commands", "help_string")
 
 commands = [
+    ("backend [numpy | python]", "Define o backend das operações de matrizes"),
     ("clear", "Apaga o histórico de instruções"),
     ("delete <matrix>", "Deleta uma matriz"),
-    ("execute <arquivo.ext> [--encoding]", "Carrega um arquivo de instruções e as executa"),
+    ("execute <arquivo.ext> [--encoding] [--jobs N]", "Carrega um arquivo de instruções e as executa"),
     ("exit", "Encerra o programa"),
     ("help", "Mostra uma lista com todos os comandos do terminal"),
     ("list", "Mostra uma lista com todas as matrizes"),
     ("load <arquivo.ext> [--encoding]", "Carrega um arquivo contendo matrizes"),
     ("log <true | false>", "Mostra os comandos anteriores"),
+    ("nullspace <matrix>", "Mostra uma base do núcleo da matriz"),
+    ("numeric [exact | float]", "Define o modo numérico: frações exatas ou ponto flutuante"),
     ("prop <matrix>", "Mostra uma lista com todas as propriedades da matriz"),
+    ("rank <matrix>", "Mostra o posto da matriz"),
+    ("ref <matrix> [--log[=arquivo.ext]]", "Mostra a forma escalonada da matriz"),
+    ("restore <nome>", "Restaura as matrizes salvas em um snapshot"),
+    ("rref <matrix> [--log[=arquivo.ext]]", "Mostra a forma escalonada reduzida da matriz"),
     ("save <arquivo.ext> [--encoding]", "Salva as matrizes em um arquivo"),
     ("show <true | false>", "Mostra a matriz que está sendo utilizada"),
+    ("solve <matrix> <matrix>", "Resolve o sistema AX = B"),
+    ("snapshot [nome]", "Salva as matrizes em um snapshot (sem nome, lista os snapshots)"),
     ("use <matrix>", "Define uma matriz para ser utilizada")
 ]
 commands.sort()
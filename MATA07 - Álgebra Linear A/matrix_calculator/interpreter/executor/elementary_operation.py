@@ -1,5 +1,6 @@
 from ..parser import parse_complex_value
 from .operation_errors import *
+from fractions import Fraction
 
 class ElementaryOperationExecutor(object):
     def __init__(self, core):
@@ -9,7 +10,14 @@ class ElementaryOperationExecutor(object):
         if scalar == 0: raise ZeroScalarError(mult = mult)
            
     def __convert_to_number(self, string):
-        return parse_complex_value(string) if "(" in string else float(string)
+        # Inteiros e frações (ex: "1/3") são mantidos exatos, assim como nos arquivos de matrizes, para que
+        # os registros de escalonamento de matrizes de inteiros e frações sejam reaplicados sem arredondamentos.
+        # Uma fração com denominador zero (ex: "1/0") gera o mesmo erro de uma divisão por zero.
+        if "/" in string:
+            try: return Fraction(string)
+            except ZeroDivisionError: raise ZeroScalarError(mult = False)
+        if "(" in string: return parse_complex_value(string)
+        return int(string) if string.lstrip("+-").isdecimal() else float(string)
 
     def __get_matrix_in_use(self):
         return self.__core.get_matrix_in_use()[0]
@@ -0,0 +1,86 @@
+from fractions import Fraction
+from matrix import Matrix
+from .operation_errors import *
+
+class ExpressionOperationExecutor(object):
+
+    def __init__(self, core):
+        self.__core = core
+
+    def __check_square(self, matrix):
+        # Essa operação só pode ser realizada com matrizes quadradas.
+        if not matrix.is_square(): raise MatrixOrderError(matrix.get_order())
+
+    def __get_scalar(self, scalar):
+        # As divisões da expressão geram frações, que são convertidas para float fora do modo exato.
+        if isinstance(scalar, Fraction) and self.__core.get_numeric_mode() != "exact": return float(scalar)
+        return scalar
+
+    def __evaluate(self, node, results):
+        # Cada nó é calculado uma única vez, mesmo que apareça mais de uma vez na expressão.
+        if node in results: return results[node]
+        kind = node[0]
+
+        if kind == "matrix":
+            result = self.__core.get_matrix(node[1])
+
+        # Combinação linear (somas, subtrações e produtos por escalar), calculada em uma única passagem.
+        elif kind == "sum":
+            terms = [(self.__get_scalar(scalar), self.__evaluate(term_node, results)) for scalar, term_node in node[1]]
+
+            if any(matrix.get_order() != terms[0][1].get_order() for scalar, matrix in terms):
+                raise MatrixOrderError(add_operation = True)
+            result = Matrix.linear_combination(terms)
+
+        elif kind == "mul":
+            matrix_x, matrix_y = self.__evaluate(node[1], results), self.__evaluate(node[2], results)
+
+            if matrix_x.get_order()[1] != matrix_y.get_order()[0]: raise MatrixOrderError(mult_operation = True)
+            result = matrix_x * matrix_y
+
+        elif kind == "pow":
+            exponent = node[2]
+
+            # Verifica se o expoente é um valor inteiro.
+            if isinstance(exponent, complex) or exponent != int(exponent): raise IllegalExponentError
+
+            matrix = self.__evaluate(node[1], results)
+            self.__check_square(matrix)
+            result = matrix ** int(exponent)
+
+        elif kind == "t": result = self.__evaluate(node[1], results).transpose()
+        elif kind == "c": result = self.__evaluate(node[1], results).conjugate()
+        elif kind == "ct": result = self.__evaluate(node[1], results).conjugate_transpose()
+
+        elif kind == "inv":
+            # Tenta obter a inversa.
+            try: result = self.__evaluate(node[1], results).get_matrix_inverse()
+            except: raise NonInvertibleMatrixError
+
+        elif kind in ["adj", "cof"]:
+            matrix = self.__evaluate(node[1], results)
+            self.__check_square(matrix)
+            result = matrix.get_adjugate_matrix() if kind == "adj" else matrix.get_cofactor_matrix()
+
+        elif kind == "minor":
+            matrix = self.__evaluate(node[1], results)
+
+            # Essa operação só pode ser realizada com matrizes de ordem maior ou igual a 2x2.
+            if min(matrix.get_order()) < 2: raise MatrixOrderError(matrix.get_order())
+            result = matrix.get_matrix_minor(node[2], node[3])
+
+        results[node] = result
+        return result
+
+    def execute(self, instruction: dict):
+        """
+        Obtém um dicionário {"var": ..., "expression": ...}, com o grafo da expressão,
+        e salva apenas a matriz resultante. As matrizes intermediárias não recebem nome.
+        """
+        expression = instruction["expression"]
+        matrix = self.__evaluate(expression, dict())
+
+        # Se a expressão for apenas uma matriz nomeada, uma cópia é salva, para que as duas não sejam o mesmo objeto.
+        # A cópia compartilha os elementos com a original, até que uma delas seja alterada.
+        if expression[0] == "matrix": matrix = matrix.copy()
+        self.__core.set_matrix(instruction["var"], matrix)
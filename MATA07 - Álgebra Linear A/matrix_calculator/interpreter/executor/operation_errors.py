@@ -32,10 +32,18 @@ class IllegalScalarError(Exception):
     def __str__(self):
         return "Não é possível realizar essa operação com um escalar."
 
+class InconsistentSystemError(Exception):
+    def __str__(self):
+        return "O sistema não possui solução."
+
 class InstructionSyntaxError(Exception):
     def __str__(self):
         return "A sintaxe dessa instrução está incorreta."
 
+class JobsNumberError(Exception):
+    def __str__(self):
+        return "O número de processos deve ser um inteiro maior que zero."
+
 class MatrixOrderError(Exception):
     def __init__(self, order = None, add_operation = False, mult_operation = False):
         self.__add_operation = add_operation
@@ -85,6 +93,10 @@ class SameRowError(Exception):
     def __str__(self):
         return "Essa operação não é válida se as linhas forem as mesmas."
 
+class SystemOrderError(Exception):
+    def __str__(self):
+        return "As duas matrizes do sistema devem possuir o mesmo número de linhas."
+
 class ZeroScalarDivisionError(Exception):
     def __str__(self):
         return "Não é possível dividir por zero!"
@@ -1,2 +1,2 @@
 from .matrix import load_matrices, save_matrices
-from .instruction import load_instructions
+from .instruction import load_instructions, save_instructions
@@ -0,0 +1,163 @@
+from .errors import *
+from array import array
+from fractions import Fraction
+import mmap
+import os
+import struct
+import sys
+
+__all__ = ("extensions", "is_binary_file", "load_matrices", "save_matrices")
+
+# Arquivos com essas extensões são salvos e carregados no formato binário.
+extensions = (".mbin",)
+
+# Formato do arquivo (little-endian):
+#
+#   Cabeçalho do arquivo: assinatura (6 bytes), versão (uint8) e número de matrizes (uint32).
+#   Cabeçalho da matriz: tamanho do nome (uint16), nome (UTF-8), linhas e colunas (uint32),
+#   tipo dos valores (uint8: 0 = float64, 1 = complex128) e armazenamento (uint8: 0 = denso, 1 = esparso).
+#   Matrizes esparsas possuem ainda o número de elementos não nulos (uint64).
+#
+# Os dados começam alinhados em 8 bytes. Matrizes densas possuem todos os valores, em ordem de linhas.
+# Matrizes esparsas possuem os índices (uint64, linha * colunas + coluna) e, em seguida, os valores.
+# Números complexos são armazenados como dois float64 (parte real e parte imaginária).
+signature = b"MATBIN"
+version = 1
+
+file_header = struct.Struct("<6sBI")
+name_header = struct.Struct("<H")
+matrix_header = struct.Struct("<IIBB")
+sparse_header = struct.Struct("<Q")
+
+FLOAT64, COMPLEX128 = 0, 1
+DENSE, SPARSE = 0, 1
+
+def is_binary_file(filename):
+    """
+    Verifica, pela extensão, se o arquivo deve estar no formato binário.
+    """
+    return os.path.splitext(filename)[1].lower() in extensions
+
+def get_padding(offset):
+    # Retorna quantos bytes faltam para que a posição esteja alinhada em 8 bytes.
+    return -offset % 8
+
+def to_little_endian(data):
+    # Converte um array para little-endian, caso a máquina seja big-endian.
+    if sys.byteorder != "little": data.byteswap()
+    return data.tobytes()
+
+def read_array(view, offset, typecode, length):
+    # Lê os valores de uma região do arquivo mapeado. Em máquinas little-endian, a região
+    # é interpretada diretamente, sem cópia intermediária, e convertida para lista de uma só vez.
+    size = length * array(typecode).itemsize
+
+    with view[offset: offset + size] as region:
+        if sys.byteorder == "little":
+            with region.cast(typecode) as values: return values.tolist(), offset + size
+
+        data = array(typecode, region)
+        data.byteswap()
+        return data.tolist(), offset + size
+
+def get_values_from_floats(floats, dtype):
+    # Junta as partes real e imaginária dos números complexos. Em uma matriz complexa, todos os valores
+    # permanecem complexos, mesmo sem parte imaginária, para que a matriz carregada continue complexa.
+    if dtype == FLOAT64: return floats
+    return [complex(real, imag) for real, imag in zip(floats[0::2], floats[1::2])]
+
+def get_floats_from_values(values, dtype):
+    # Separa as partes real e imaginária dos números complexos.
+    if dtype == FLOAT64: return array("d", [float(value) for value in values])
+    return array("d", [float(part) for value in values for part in (value.real, value.imag)])
+
+def read_matrix(view, offset):
+    # Lê uma matriz a partir de uma posição do arquivo, retornando-a e a posição da próxima matriz.
+    name_length, = name_header.unpack_from(view, offset)
+    offset += name_header.size
+
+    name = bytes(view[offset: offset + name_length]).decode("utf-8")
+    offset += name_length
+
+    rows, columns, dtype, storage = matrix_header.unpack_from(view, offset)
+    offset += matrix_header.size
+    float_count = 2 if dtype == COMPLEX128 else 1
+
+    if storage == DENSE:
+        offset += get_padding(offset)
+        floats, offset = read_array(view, offset, "d", rows * columns * float_count)
+        return {"name": name, "order": [rows, columns], "values": get_values_from_floats(floats, dtype)}, offset
+
+    length, = sparse_header.unpack_from(view, offset)
+    offset += sparse_header.size
+    offset += get_padding(offset)
+
+    indices, offset = read_array(view, offset, "Q", length)
+    floats, offset = read_array(view, offset, "d", length * float_count)
+
+    elements = [(*divmod(index, columns), value) for index, value in zip(indices, get_values_from_floats(floats, dtype))]
+    return {"name": name, "order": [rows, columns], "elements": elements}, offset
+
+def load_matrices(filename):
+    """
+    Função geradora para retornar matrizes de um arquivo binário. O arquivo é mapeado em
+    memória (mmap), de forma que apenas as regiões de cada matriz lida são carregadas.
+    """
+    if not filename: raise NoFilenameError
+    if not os.path.exists(filename): raise UserFileNotFoundError(filename)
+
+    with open(filename, "rb") as file:
+        try:
+            with mmap.mmap(file.fileno(), 0, access = mmap.ACCESS_READ) as mapped_file, memoryview(mapped_file) as view:
+                file_signature, file_version, count = file_header.unpack_from(view, 0)
+                if file_signature != signature or file_version != version: raise ValueError
+
+                offset = file_header.size
+
+                for index in range(count):
+                    matrix, offset = read_matrix(view, offset)
+                    yield matrix
+        except (ValueError, struct.error, UnicodeDecodeError): raise UserFileDecodingError
+
+def save_matrices(filename, matrices):
+    """
+    Função para salvar uma lista de matrizes em um arquivo binário. Frações não possuem
+    representação exata em float64, portanto matrizes com frações não podem ser salvas.
+    """
+    if not filename: raise NoFilenameError
+
+    # As matrizes são verificadas antes de o arquivo ser aberto, para que ele não seja sobrescrito parcialmente.
+    for matrix in matrices:
+        values = [value for row, column, value in matrix["elements"]] if "elements" in matrix else matrix["values"]
+        if any(isinstance(value, Fraction) for value in values): raise UnsupportedBinaryValueError(matrix["name"])
+
+    with open(filename, "wb") as file:
+        file.write(file_header.pack(signature, version, len(matrices)))
+        offset = file_header.size
+
+        for matrix in matrices:
+            name = matrix["name"].encode("utf-8")
+            sparse = "elements" in matrix
+
+            values = [value for row, column, value in matrix["elements"]] if sparse else matrix["values"]
+            dtype = COMPLEX128 if any(isinstance(value, complex) for value in values) else FLOAT64
+
+            header = name_header.pack(len(name)) + name + matrix_header.pack(*matrix["order"], dtype, SPARSE if sparse else DENSE)
+            if sparse: header += sparse_header.pack(len(values))
+
+            offset += len(header)
+            header += bytes(get_padding(offset))
+            offset += get_padding(offset)
+
+            data = b""
+
+            # Os índices das matrizes esparsas são gravados antes dos valores.
+            if sparse:
+                columns = matrix["order"][1]
+                data += to_little_endian(array("Q", [row * columns + column for row, column, value in matrix["elements"]]))
+
+            data += to_little_endian(get_floats_from_values(values, dtype))
+            offset += len(data)
+
+            file.write(header)
+            file.write(data)
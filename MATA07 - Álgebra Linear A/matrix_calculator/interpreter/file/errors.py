@@ -7,6 +7,14 @@ class UserFileDecodingError(Exception):
         return "Não foi possível descriptografar o arquivo."
         
 
+class UnsupportedBinaryValueError(Exception):
+    def __init__(self, name = None):
+        self.__name = name
+
+    def __str__(self):
+        name = " \"{}\"".format(self.__name) if self.__name else ""
+        return "A matriz{} possui frações, que não são suportadas pelo formato binário. Salve-a em um arquivo de texto.".format(name)
+
 class UserFileNotFoundError(Exception):
     def __init__(self, filename = None):
         self.__filename = filename
@@ -11,3 +11,12 @@ def load_instructions(filename, encoding = None):
     with open(filename, encoding = encoding) as file:
         for instruction in file:
             yield instruction.replace("\n", "").strip()
+
+def save_instructions(filename, instructions, encoding = None):
+    """
+    Função para salvar uma lista de instruções em um arquivo, uma por linha.
+    """
+    if not filename: raise NoFilenameError
+
+    with open(filename, "w", encoding = encoding) as file:
+        file.write("\n".join(instructions) + "\n")
@@ -1,62 +1,197 @@
 from ..parser import parse_complex_value
+from ..parser.errors import NoImaginaryPartError
+from . import binary
 from .errors import *
+from fractions import Fraction
 import os
+import re
 
 __all__ = ("load_matrices", "save_matrices")
 
-def get_matrix_from_string(string):
-    # Verifica se a linha está vazia.
-    string = string.replace("\n", "")
-    if not string: return None
-    
-    # Separa a linha em assinatura (nome, ordem) e valores.
-    signature, values = string.split(":", maxsplit = 1)
-    name, order = signature.upper().split(maxsplit = 1)
-    
-    # Obtém a ordem da matrix.
+def get_number_from_string(string):
+    # Converte a string para um número, real ou complexo.
+    return parse_complex_value(string) if "i" in string else float(string)
+
+def get_string_from_number(value):
+    # Converte o número para string. Números complexos são escritos no formato (x+yi).
+    if isinstance(value, complex): return "({}{}i)".format(value.real, ("+" + str(value.imag)) if value.imag >= 0 else value.imag)
+    return str(value)
+
+# Pattern de um número complexo (ex: "9+7i", "-i", "(3-4.5i)"). Números reais são convertidos diretamente por float().
+unsigned_pattern = "(?:[0-9]+(?:\\.[0-9]*)?|\\.[0-9]+)(?:[eE][-+]?[0-9]+)?"
+complex_regex = re.compile(
+    "\\s*\\(?\\s*(?:(?P<real>[-+]?{0})\\s*(?P<sign>[-+])\\s*(?P<imag>{0})?|(?P<imag_sign>[-+]?)\\s*(?P<imag_only>{0})?)\\s*[iI]\\s*\\)?\\s*".format(unsigned_pattern)
+)
+
+# Pattern de um elemento "linha,coluna=valor" seguido do seu separador. A quebra de linha finaliza a matriz.
+sparse_regex = re.compile("([^;\\n]*)([;\\n])")
+sparse_start_regex = re.compile("[ \\t\\r]*[0-9]+[ \\t\\r]*,[ \\t\\r]*[0-9]+[ \\t\\r]*=")
+values_start_regex = re.compile("[=\\n]|,[^,=\\n]*,")
+
+# Tamanho dos blocos lidos do arquivo. A memória utilizada, além das próprias matrizes, é limitada por esse tamanho.
+chunk_size = 1 << 16
+
+def get_number_from_token(token):
+    # Converte um valor para número. Valores reais são convertidos diretamente, as frações (ex: "1/3")
+    # pelo tipo Fraction e os complexos, pelo pattern.
+    if "/" in token: return Fraction(token.strip())
+    if not "i" in token: return float(token)
+    match = complex_regex.fullmatch(token)
+
+    # Valores em formatos não reconhecidos pelo pattern são convertidos da forma convencional.
+    if not match: return get_number_from_string(token)
+
+    if match.group("real") is not None:
+        imag = float(match.group("imag") or 1)
+        return complex(float(match.group("real")), -imag if match.group("sign") == "-" else imag)
+
+    imag = float(match.group("imag_only") or 1)
+    return complex(0, -imag if match.group("imag_sign") == "-" else imag)
+
+def get_signature_from_string(string):
+    # Obtém o nome e a ordem da matriz a partir da assinatura "NOME linha,coluna".
+    name, order = string.upper().split(maxsplit = 1)
     order = [int(v) for v in order.split(",", maxsplit = 1)]
 
-    # Verifica se o nome da matriz é válido e adiciona ao dicionário.
+    # Verifica se o nome da matriz é válido.
     if not name.isalpha(): raise ValueError("O nome \"{}\" para matriz não é permitido!".format(name))
-    matrix = {"name": name, "order": order, "values": list()}
-    
-    # Separa os valores pela vírgula e os converte para números, reais ou complexos.
-    for value in values.split(","):
-        matrix["values"].append(parse_complex_value(value) if "i" in value else float(value))
-    return matrix
-        
+    return name, order
+
+def read_signature(buffer, position):
+    # Lê a assinatura da próxima matriz, ignorando as linhas vazias. Retorna a matriz (ou None,
+    # caso a assinatura ainda não esteja completa no buffer) e a posição após os dois pontos.
+    while True:
+        colon, newline = buffer.find(":", position), buffer.find("\n", position)
+
+        if colon != -1 and (newline == -1 or colon < newline):
+            name, order = get_signature_from_string(buffer[position: colon])
+            return {"name": name, "order": order, "sparse": None}, colon + 1
+
+        if newline == -1: return None, position
+        if buffer[position: newline].strip(): raise ValueError("Linha sem a assinatura da matriz.")
+        position = newline + 1
+
+def read_values(matrix, buffer, position):
+    # Lê os valores da matriz presentes no buffer. Retorna se a matriz foi finalizada e a posição do próximo valor.
+    if matrix["sparse"] is None:
+        # Matrizes esparsas iniciam com "linha,coluna=". Só é possível decidir após um "=", duas vírgulas ou o fim da linha.
+        if not values_start_regex.search(buffer, position): return False, position
+        matrix["sparse"] = sparse_start_regex.match(buffer, position) is not None
+
+        if matrix["sparse"]: matrix["elements"] = list()
+        else: matrix["values"], matrix["index"] = [0,] * max(matrix["order"][0] * matrix["order"][1], 0), 0
+
+    # Os valores são lidos até o último separador presente no buffer. Um valor incompleto fica para o próximo bloco.
+    if matrix["sparse"]:
+        rows, columns = matrix["order"]
+        elements = matrix["elements"]
+
+        for match in sparse_regex.finditer(buffer, position):
+            element, separator = match.groups()
+            position = match.end()
+
+            element, value = element.split("=", maxsplit = 1)
+            row, column = [int(v) for v in element.split(",", maxsplit = 1)]
+
+            # Verifica se a posição do elemento existe na matriz.
+            if not (0 < row <= rows and 0 < column <= columns): raise ValueError("A posição {},{} não existe.".format(row, column))
+            elements.append((row - 1, column - 1, get_number_from_token(value)))
+
+            if separator == "\n": return True, position
+        return False, position
+
+    # Em matrizes densas, o trecho até o fim da linha (ou até a última vírgula do buffer) é separado de uma só vez.
+    end = buffer.find("\n", position)
+    finished = end != -1
+
+    if not finished: end = buffer.rfind(",", position)
+    if end == -1: return False, position
+
+    tokens = buffer[position: end].split(",")
+
+    # Caso algum valor não seja real, os valores são convertidos um a um.
+    try: numbers = list(map(float, tokens))
+    except ValueError: numbers = [get_number_from_token(token) for token in tokens]
+
+    # Valores além da ordem da matriz são ignorados.
+    values, index = matrix["values"], matrix["index"]
+    values[index: index + len(numbers)] = numbers[:max(len(values) - index, 0)]
+
+    matrix["index"] = index + len(numbers)
+    return finished, end + 1
+
+def get_matrix_from_state(matrix):
+    # Retorna a matriz lida no formato {"name": ..., "order": ..., "values" | "elements": ...}.
+    if matrix["sparse"]: return {"name": matrix["name"], "order": matrix["order"], "elements": matrix["elements"]}
+    return {"name": matrix["name"], "order": matrix["order"], "values": matrix["values"]}
+
+def read_matrices(file):
+    """
+    Função geradora que lê as matrizes de um arquivo de texto em blocos de tamanho fixo. Os valores são
+    reconhecidos diretamente no buffer e escritos no buffer da matriz, sem separar a linha em strings.
+    """
+    buffer, position, matrix, end_of_file = "", 0, None, False
+
+    while not end_of_file:
+        chunk = file.read(chunk_size)
+
+        # No final do arquivo, é adicionada uma quebra de linha para finalizar a última matriz.
+        if not chunk: chunk, end_of_file = "\n", True
+
+        # Apenas o trecho ainda não lido (no máximo, um valor incompleto) é mantido no buffer.
+        buffer, position = buffer[position:] + chunk, 0
+
+        while True:
+            if matrix is None:
+                matrix, position = read_signature(buffer, position)
+                if matrix is None: break
+                continue
+
+            finished, position = read_values(matrix, buffer, position)
+            if not finished: break
+
+            yield get_matrix_from_state(matrix)
+            matrix = None
+
 def load_matrices(filename, encoding = None):
     """
     Função geradora para retornar matrizes de um arquivo.
-    As matrizes do arquivo devem estar no formato "NOME linha,coluna: valor1, valor2, ..."
+    As matrizes do arquivo devem estar no formato "NOME linha,coluna: valor1, valor2, ..." ou, para
+    matrizes esparsas, "NOME linha,coluna: linha,coluna=valor; linha,coluna=valor; ..."
+
+    Arquivos com extensão binária (ex: ".mbin") são carregados no formato binário.
     """
     if not filename: raise NoFilenameError
     if not os.path.exists(filename): raise UserFileNotFoundError(filename)
 
+    if binary.is_binary_file(filename):
+        yield from binary.load_matrices(filename)
+        return
+
+    # Apenas os erros de leitura e conversão dos valores são tratados, para que GeneratorExit
+    # e KeyboardInterrupt continuem interrompendo o gerador. UnicodeDecodeError é um ValueError.
     with open(filename, encoding = encoding) as file:
-        for line in file:
-            try:
-                matrix = get_matrix_from_string(line)
-                if matrix: yield matrix
-            except: raise UserFileDecodingError
+        try: yield from read_matrices(file)
+        except (ValueError, ZeroDivisionError, NoImaginaryPartError): raise UserFileDecodingError
 
 def save_matrices(filename, matrices, encoding = None):
     """
-    Função para salvar uma lista de matrizes em um arquivo.s
+    Função para salvar uma lista de matrizes em um arquivo. Arquivos com extensão
+    binária (ex: ".mbin") são salvos no formato binário.
     """
     if not filename: raise NoFilenameError
-    
+    if binary.is_binary_file(filename): return binary.save_matrices(filename, matrices)
+
     with open(filename, "w", encoding = encoding) as file:
         # Percorre o dicionário de matrizes, salvando uma matriz em cada linha.
         for matrix in matrices:
             line = "{} {},{}: ".format(matrix["name"], *matrix["order"])
 
-            # Percorre os elementos da matrix, inserindo-os na string..
-            for value in matrix["values"]:
-                if isinstance(value, complex): value = "({}{}i)".format(value.real, ("+" + str(value.imag)) if value.imag >= 0 else value.imag)
-                else: value = str(value)
-                
-                line += value + ", "
+            # Matrizes esparsas são salvas apenas com os seus elementos não nulos (as posições começam de 1).
+            if "elements" in matrix:
+                elements = ["{},{}={}".format(row + 1, column + 1, get_string_from_number(value)) for row, column, value in matrix["elements"]]
+                file.write(line + "; ".join(elements) + "\n")
+                continue
 
-            # Escreve a linha no arquivo.
-            file.write(line[:-2] + "\n")
+            # Junta os elementos da matriz, separados por vírgula, e escreve a linha no arquivo.
+            file.write(line + ", ".join([get_string_from_number(value) for value in matrix["values"]]) + "\n")
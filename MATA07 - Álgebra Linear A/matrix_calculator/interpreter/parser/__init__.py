@@ -1,2 +1,4 @@
+from .arithmetic import compile_arithmetic
+from .expression import get_nodes, parse_expression
 from .numeric import parse_complex_value
 from .instruction import parse_instruction
@@ -0,0 +1,140 @@
+from .numeric import parse_complex_value
+from .patterns import arithmetic_token_pattern
+from .errors import *
+from fractions import Fraction
+from functools import lru_cache
+import operator
+import re
+
+__all__ = ("compile_arithmetic",)
+
+# Uma expressão aritmética é compilada uma única vez em uma árvore de funções. Cada função recebe outra
+# função, get_element(linha, coluna), que lê um elemento da matriz em uso, e retorna o valor do seu nó.
+# Assim, os elementos são lidos diretamente da matriz, sem substituições no texto da expressão nem eval.
+
+token_regex = re.compile(arithmetic_token_pattern)
+
+def divide(x, y):
+    # Divisões entre inteiros (ou frações) geram frações, para que sejam exatas no modo exato.
+    if isinstance(x, (int, Fraction)) and isinstance(y, (int, Fraction)): return Fraction(x) / y
+    return x / y
+
+binary_operators = {
+    "+": operator.add, "-": operator.sub, "*": operator.mul, "/": divide,
+    "//": operator.floordiv, "%": operator.mod, "**": operator.pow
+}
+
+def compile_constant(value):
+    return lambda get_element: value
+
+def compile_element(row, column):
+    return lambda get_element: get_element(row, column)
+
+def compile_binary(symbol, x, y):
+    function = binary_operators[symbol]
+    return lambda get_element: function(x(get_element), y(get_element))
+
+def compile_negative(x):
+    return lambda get_element: -x(get_element)
+
+class ArithmeticParser(object):
+    """
+    Analisador descendente recursivo de expressões aritméticas, com a mesma precedência do Python:
+    potência (**, associativa à direita), sinal (+ -), (* / // %) e, por fim, (+ -).
+    """
+    def __init__(self, expression):
+        self.__expression = expression
+        self.__tokens = self.__tokenize(expression)
+        self.__index = 0
+
+    def __tokenize(self, expression):
+        # Separa a expressão em tuplas (tipo, valor), ignorando os espaços.
+        tokens, position = [], 0
+        expression = expression.rstrip()
+
+        while position < len(expression):
+            match = token_regex.match(expression, position)
+            if not match: raise ExpressionSyntaxError(self.__expression)
+
+            complex_value, row, column, number, symbol = match.groups()
+
+            if complex_value: tokens.append(("number", parse_complex_value(complex_value)))
+            elif row: tokens.append(("element", (int(row), int(column))))
+            elif number: tokens.append(("number", float(number) if "." in number else int(number)))
+            else: tokens.append(("symbol", symbol))
+            position = match.end()
+        return tokens
+
+    def __peek(self):
+        return self.__tokens[self.__index] if self.__index < len(self.__tokens) else (None, None)
+
+    def __next(self):
+        token = self.__peek()
+        if token[0] is None: raise ExpressionSyntaxError(self.__expression)
+
+        self.__index += 1
+        return token
+
+    def __parse_expression(self):
+        node = self.__parse_term()
+
+        while self.__peek() in [("symbol", "+"), ("symbol", "-")]:
+            node = compile_binary(self.__next()[1], node, self.__parse_term())
+        return node
+
+    def __parse_term(self):
+        node = self.__parse_unary()
+
+        while self.__peek() in [("symbol", "*"), ("symbol", "/"), ("symbol", "//"), ("symbol", "%")]:
+            node = compile_binary(self.__next()[1], node, self.__parse_unary())
+        return node
+
+    def __parse_unary(self):
+        if self.__peek() == ("symbol", "-"):
+            self.__next()
+            return compile_negative(self.__parse_unary())
+
+        if self.__peek() == ("symbol", "+"):
+            self.__next()
+            return self.__parse_unary()
+        return self.__parse_power()
+
+    def __parse_power(self):
+        node = self.__parse_primary()
+
+        # O expoente pode possuir sinal, ex: 2 ** -1.
+        if self.__peek() == ("symbol", "**"):
+            self.__next()
+            return compile_binary("**", node, self.__parse_unary())
+        return node
+
+    def __parse_primary(self):
+        kind, value = self.__next()
+
+        if kind == "number": return compile_constant(value)
+        if kind == "element": return compile_element(*value)
+
+        if (kind, value) == ("symbol", "("):
+            node = self.__parse_expression()
+            if self.__next() != ("symbol", ")"): raise ExpressionSyntaxError(self.__expression)
+            return node
+
+        raise ExpressionSyntaxError(self.__expression)
+
+    def parse(self):
+        """
+        Retorna a função que calcula o valor da expressão.
+        """
+        node = self.__parse_expression()
+
+        if self.__peek()[0] is not None: raise ExpressionSyntaxError(self.__expression)
+        return node
+
+@lru_cache(maxsize = 1024)
+def compile_arithmetic(expression):
+    """
+    Compila uma expressão aritmética com elementos da matriz, ex: "E1,2 * 2 + (3-i)", retornando uma
+    função que recebe get_element(linha, coluna) e retorna o resultado. As expressões compiladas são
+    salvas pelo seu texto, de forma que expressões repetidas são analisadas uma única vez.
+    """
+    return ArithmeticParser(expression).parse()
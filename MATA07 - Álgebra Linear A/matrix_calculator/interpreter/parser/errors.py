@@ -1,10 +1,32 @@
+class ExpressionSyntaxError(Exception):
+    def __init__(self, expression):
+        self.__expression = expression
+
+    def __str__(self):
+        return "A sintaxe da expressão \"{}\" está incorreta.".format(self.__expression)
+
+class IllegalOperandError(Exception):
+    def __init__(self, operator):
+        self.__operator = operator
+
+    def __str__(self):
+        return "O operador \"{}\" não pode ser utilizado com esses operandos.".format(self.__operator)
+
 class NoImaginaryPartError(Exception):
-    def __init__(self):
+    def __init__(self, value):
         self.__value = str(value)
         
     def __str__(self):
         return "O valor \"{}\" não possui parte imaginária.".format(self.__value)
 
+class ScalarExpressionError(Exception):
+    def __str__(self):
+        return "A expressão deve resultar em uma matriz."
+
 class UnrecognizedSyntaxError(Exception):
     def __str__(self):
         return "Não foi possível reconhecer essa instrução."
+
+class ZeroScalarDivisionError(Exception):
+    def __str__(self):
+        return "Não é possível dividir por zero!"
@@ -0,0 +1,269 @@
+from .numeric import parse_complex_value
+from .patterns import expression_token_pattern
+from .errors import *
+from fractions import Fraction
+import re
+
+__all__ = ("get_nodes", "parse_expression")
+
+# Uma expressão é representada por um grafo de nós imutáveis (tuplas), no formato (tipo, ...):
+#
+#   ("number", valor)                 Escalar, usado apenas durante a análise.
+#   ("matrix", nome)                  Matriz nomeada.
+#   ("sum", ((escalar, nó), ...))     Combinação linear de nós, calculada em uma única passagem.
+#   ("mul", x, y)                     Produto de matrizes.
+#   ("pow", x, expoente)              Potência de uma matriz.
+#   ("t" | "c" | "ct", x)             Transposta, conjugada e transconjugada.
+#   ("inv" | "adj" | "cof", x)        Inversa, adjunta e cofatora.
+#   ("minor", x, linha, coluna)       Menor complementar.
+#
+# Como nós iguais são tuplas iguais, subexpressões repetidas são calculadas uma única vez.
+
+token_regex = re.compile(expression_token_pattern)
+
+# Operadores unários, que podem ser usados como função, ex: inv(A), ou após a matriz, ex: Ainv, A^t.
+unary_operators = {"t": "t", "c": "c", "ct": "ct", "tc": "ct", "inv": "inv", "adj": "adj", "cof": "cof"}
+
+# Transposição e conjugação, representadas como (transpor, conjugar).
+adjoint_operators = {"t": (True, False), "c": (False, True), "ct": (True, True)}
+
+def is_scalar(node):
+    return node[0] == "number"
+
+def make_sum(terms):
+    # Junta os termos que possuem o mesmo nó, somando os seus escalares. Os termos são
+    # ordenados para que somas com as mesmas parcelas, em qualquer ordem, sejam o mesmo nó.
+    scalars = dict()
+
+    for scalar, node in terms:
+        scalars[node] = scalars.get(node, 0) + scalar
+
+    # Uma soma com um único termo, multiplicado por 1, é o próprio nó.
+    if len(scalars) == 1 and list(scalars.values())[0] == 1: return list(scalars)[0]
+    return ("sum", tuple(sorted(((scalar, node) for node, scalar in scalars.items()), key = lambda term: repr(term[1]))))
+
+def get_terms(node):
+    return node[1] if node[0] == "sum" else ((1, node),)
+
+def scale(node, scalar):
+    if is_scalar(node): return ("number", node[1] * scalar)
+    return make_sum([(term_scalar * scalar, term_node) for term_scalar, term_node in get_terms(node)])
+
+def add(x, y, sub = False):
+    if is_scalar(x) and is_scalar(y): return ("number", (x[1] - y[1]) if sub else (x[1] + y[1]))
+    if is_scalar(x) or is_scalar(y): raise IllegalOperandError("-" if sub else "+")
+
+    # Somas são achatadas em uma única combinação linear, para que sejam calculadas de uma só vez.
+    return make_sum(list(get_terms(x)) + [(-scalar if sub else scalar, node) for scalar, node in get_terms(y)])
+
+def multiply(x, y):
+    if is_scalar(x): return scale(y, x[1])
+    if is_scalar(y): return scale(x, y[1])
+    return ("mul", x, y)
+
+def reciprocal(value):
+    # O inverso de um inteiro é mantido como fração, para que a divisão seja exata no modo exato.
+    return Fraction(1, value) if isinstance(value, (int, Fraction)) else 1 / value
+
+def divide(x, y):
+    if not is_scalar(y): raise IllegalOperandError("/")
+    if y[1] == 0: raise ZeroScalarDivisionError
+
+    if is_scalar(x): return ("number", x[1] * reciprocal(y[1]))
+    return scale(x, reciprocal(y[1]))
+
+def power(x, exponent):
+    if not is_scalar(exponent): raise IllegalOperandError("**")
+    if is_scalar(x): return ("number", x[1] ** exponent[1])
+    return ("pow", x, exponent[1])
+
+def adjoint(node, transpose, conjugate):
+    # Aplica a transposição e/ou conjugação, levando-as o mais próximo possível das matrizes nomeadas,
+    # cujas transpostas já ficam salvas. Assim, (A*B)^t é calculado como B^t*A^t, sem transpor o produto.
+    if not transpose and not conjugate: return node
+    kind = node[0]
+
+    # Duas transposições (ou conjugações) seguidas se anulam.
+    if kind in adjoint_operators:
+        inner_transpose, inner_conjugate = adjoint_operators[kind]
+        return adjoint(node[1], transpose != inner_transpose, conjugate != inner_conjugate)
+
+    if kind == "mul":
+        x, y = (node[2], node[1]) if transpose else (node[1], node[2])
+        return ("mul", adjoint(x, transpose, conjugate), adjoint(y, transpose, conjugate))
+
+    if kind == "sum":
+        return make_sum([(scalar.conjugate() if conjugate else scalar, adjoint(term_node, transpose, conjugate)) for scalar, term_node in node[1]])
+
+    if kind == "pow":
+        return ("pow", adjoint(node[1], transpose, conjugate), node[2])
+
+    return ("ct" if transpose and conjugate else ("t" if transpose else "c"), node)
+
+def apply_unary_operator(operator, node):
+    if is_scalar(node): raise IllegalOperandError(operator)
+    operator = unary_operators[operator]
+
+    if operator in adjoint_operators: return adjoint(node, *adjoint_operators[operator])
+    return (operator, node)
+
+class ExpressionParser(object):
+    """
+    Analisador descendente recursivo de expressões de matrizes. Precedência, da maior para a menor:
+    operadores pós-fixos (At, A^t, Ainv, Am(1,2)), potência (**), sinal (-) e, por fim, (* /) e (+ -).
+    """
+    def __init__(self, expression):
+        self.__expression = expression
+        self.__tokens = self.__tokenize(expression)
+        self.__index = 0
+
+    def __tokenize(self, expression):
+        # Separa a expressão em tuplas (tipo, texto).
+        tokens, position = [], 0
+        kinds = ("complex", "number", "name", "word", "symbol")
+
+        while position < len(expression):
+            match = token_regex.match(expression, position)
+            if not match: raise ExpressionSyntaxError(self.__expression)
+
+            kind = kinds[match.lastindex - 1]
+            tokens.append((kind, match.group(match.lastindex)))
+            position = match.end()
+        return tokens
+
+    def __peek(self, offset = 0):
+        index = self.__index + offset
+        return self.__tokens[index] if index < len(self.__tokens) else (None, None)
+
+    def __next(self):
+        token = self.__peek()
+        if token[0] is None: raise ExpressionSyntaxError(self.__expression)
+
+        self.__index += 1
+        return token
+
+    def __expect(self, symbol):
+        if self.__next() != ("symbol", symbol): raise ExpressionSyntaxError(self.__expression)
+
+    def __parse_integer(self):
+        kind, text = self.__next()
+        if kind != "number" or not text.isdigit(): raise ExpressionSyntaxError(self.__expression)
+        return int(text)
+
+    def __parse_expression(self):
+        node = self.__parse_term()
+
+        while self.__peek() in [("symbol", "+"), ("symbol", "-")]:
+            operator = self.__next()[1]
+            node = add(node, self.__parse_term(), sub = operator == "-")
+        return node
+
+    def __parse_term(self):
+        node = self.__parse_unary()
+
+        while self.__peek() in [("symbol", "*"), ("symbol", "/")]:
+            operator = self.__next()[1]
+            other = self.__parse_unary()
+            node = multiply(node, other) if operator == "*" else divide(node, other)
+        return node
+
+    def __parse_unary(self):
+        if self.__peek() == ("symbol", "-"):
+            self.__next()
+            return scale(self.__parse_unary(), -1)
+
+        if self.__peek() == ("symbol", "+"):
+            self.__next()
+            return self.__parse_unary()
+        return self.__parse_power()
+
+    def __parse_power(self):
+        node = self.__parse_postfix()
+
+        if self.__peek() == ("symbol", "**"):
+            self.__next()
+            return power(node, self.__parse_unary())
+        return node
+
+    def __parse_postfix(self):
+        node = self.__parse_primary()
+
+        while True:
+            kind, text = self.__peek()
+
+            # Operador após "^", que pode ser uma transposição/conjugação ou um expoente.
+            if (kind, text) == ("symbol", "^"):
+                self.__next()
+                kind, text = self.__peek()
+
+                if kind == "word" and (text in adjoint_operators or text == "tc"):
+                    self.__next()
+                    node = apply_unary_operator(text, node)
+                else: node = power(node, self.__parse_unary())
+
+            # Menor complementar, no formato m(linha,coluna).
+            elif (kind, text) == ("word", "m") and self.__peek(1) == ("symbol", "("):
+                self.__next()
+                self.__expect("(")
+                row = self.__parse_integer()
+                self.__expect(",")
+                column = self.__parse_integer()
+                self.__expect(")")
+
+                if is_scalar(node): raise IllegalOperandError("m")
+                node = ("minor", node, row, column)
+
+            # Operador unário após a matriz, como na sintaxe de uma única operação (ex: At, Ainv).
+            elif kind == "word" and text in unary_operators and self.__peek(1) != ("symbol", "("):
+                self.__next()
+                node = apply_unary_operator(text, node)
+
+            else: return node
+
+    def __parse_primary(self):
+        kind, text = self.__next()
+
+        if kind == "complex": return ("number", parse_complex_value(text))
+        if kind == "number": return ("number", float(text) if "." in text else int(text))
+        if kind == "name": return ("matrix", text)
+
+        if (kind, text) == ("symbol", "("):
+            node = self.__parse_expression()
+            self.__expect(")")
+            return node
+
+        # Operador unário usado como função, ex: inv(A).
+        if kind == "word" and text in unary_operators:
+            self.__expect("(")
+            node = self.__parse_expression()
+            self.__expect(")")
+            return apply_unary_operator(text, node)
+
+        raise ExpressionSyntaxError(self.__expression)
+
+    def parse(self):
+        """
+        Retorna o nó raiz da expressão.
+        """
+        node = self.__parse_expression()
+
+        if self.__peek()[0] is not None: raise ExpressionSyntaxError(self.__expression)
+        if is_scalar(node): raise ScalarExpressionError
+        return node
+
+def parse_expression(expression):
+    """
+    Analisa uma expressão de matrizes, ex: "(A*B)^t+inv(C)*2", e retorna o seu grafo.
+    """
+    return ExpressionParser(expression).parse()
+
+def get_nodes(node):
+    """
+    Função geradora que percorre todos os nós de um grafo de expressão, incluindo o próprio nó.
+    """
+    yield node
+
+    for item in node[1:]:
+        # Os termos de uma soma são tuplas (escalar, nó).
+        if node[0] == "sum": yield from (subnode for scalar, term_node in item for subnode in get_nodes(term_node))
+        elif isinstance(item, tuple): yield from get_nodes(item)
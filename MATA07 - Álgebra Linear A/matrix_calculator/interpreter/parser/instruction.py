@@ -1,30 +1,37 @@
-from .numeric import parse_complex_value
+from .arithmetic import compile_arithmetic
+from .expression import parse_expression
 from .patterns import *
 from .errors import *
 import re
 
+# Os patterns são compilados uma única vez, ao importar o módulo, e não a cada instrução.
+application_operation_regex = re.compile(application_operation_pattern)
+elementary_operation_regex = re.compile(elementary_operation_pattern)
+expression_operation_regex = re.compile(expression_operation_pattern)
+matrix_element_regex = re.compile(matrix_element_pattern)
+matrix_operation_regex = re.compile(matrix_operation_pattern)
+
 def parse_instruction(instruction):
     # Verifica se o comando refere-se à um comando da aplicação. 
-    result = re.findall(application_operation_pattern, instruction)
+    result = application_operation_regex.findall(instruction)
     if result: return {"operation": "application", "command": result[0][0], "args": result[0][1].strip()}
 
     # Verifica se o comando refere-se à uma operação de matriz.
-    result = re.findall(matrix_operation_pattern, instruction.replace(" ", ""))
+    result = matrix_operation_regex.findall(instruction.replace(" ", ""))
     if result: return {"operation": "matrix", "var": result[0][0], "x": result[0][1], "operator": result[0][2], "y": result[0][3]}
 
+    # Verifica se o comando refere-se à uma expressão com várias operações de matrizes.
+    result = expression_operation_regex.findall(instruction.replace(" ", ""))
+    if result: return {"operation": "expression", "var": result[0][0], "expression": parse_expression(result[0][1])}
+
     # Verifica se o comando refere-se à uma operação elementar.
-    result = re.findall(elementary_operation_pattern, instruction.replace(" ", ""))
+    result = elementary_operation_regex.findall(instruction.replace(" ", ""))
     if result: return {"operation": "elementary", "row1": result[0][0], "operator": result[0][1], "scalar": result[0][2], "row2": result[0][3]}
 
     # Verifica se o comando refere-se à uma operação de aritmética com elementos.
-    result = re.findall(matrix_element_pattern, instruction)
+    result = matrix_element_regex.findall(instruction)
     
     if result and all([char in " E,.0123456789+-/%*()i" for char in instruction]):
-        
-        # Converte os valores complexos, se houverem.
-        for complex_string in re.findall(complex_pattern, instruction):
-            complex_value = parse_complex_value(complex_string)
-            instruction = instruction.replace(complex_string, "complex({}, {})".format(complex_value.real, complex_value.imag))
-        return {"operation": "arithmetic", "expression": instruction, "elements": result}
+        return {"operation": "arithmetic", "expression": compile_arithmetic(instruction)}
     
     raise UnrecognizedSyntaxError
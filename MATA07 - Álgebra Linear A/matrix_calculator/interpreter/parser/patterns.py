@@ -3,6 +3,7 @@ integer_pattern = "-?[0-9]+"
 float_pattern = "-?[0-9]+\.[0-9]+"
 complex_pattern = "\((?:{0}|{1})?[\+-]?(?:{2}|{3})?i\)".format(float_pattern, integer_pattern, float_pattern[2:], integer_pattern[2:])
 numeric_pattern = "{0}|{1}|{2}".format(complex_pattern, float_pattern, integer_pattern)
+fraction_pattern = "-?[0-9]+/[0-9]+"
 
 # Patterns de elementos de uma expressão.
 elementary_operators_pattern = "\+=|\-=|\*=|/=|<>|=="
@@ -12,5 +13,12 @@ matrix_operators_pattern = "\+|-|\*\*|\*|/|tc|ct|c|t|adj|cof|inv|{0}".format(mat
 
 # Patterns de instruções do usuário.
 application_operation_pattern = "^([a-z]+)(\s.+|)"
-elementary_operation_pattern = "^L([0-9])({0})({1}|)L?([0-9]+|)$".format(elementary_operators_pattern, numeric_pattern)
+elementary_operation_pattern = "^L([0-9]+)({0})({1}|{2}|)L?([0-9]+|)$".format(elementary_operators_pattern, fraction_pattern, numeric_pattern)
 matrix_operation_pattern = "^([A-Z]+)=([A-Z]+|{1})({0})([A-Z]+|{1}|)$".format(matrix_operators_pattern, numeric_pattern)
+
+# Patterns de expressões de matrizes, com várias operações em uma mesma instrução.
+expression_operation_pattern = "^([A-Z]+)=(.+)$"
+expression_token_pattern = "({0})|([0-9]+\.[0-9]+|[0-9]+)|([A-Z]+)|([a-z]+)|(\*\*|[-+*/^(),])".format(complex_pattern)
+
+# Patterns de expressões aritméticas com elementos da matriz em uso.
+arithmetic_token_pattern = "\s*(?:({0})|E([0-9]+),([0-9]+)|([0-9]+\.[0-9]+|[0-9]+)|(\*\*|//|[-+*/%()]))".format(complex_pattern)
@@ -1,4 +1,15 @@
+from . import backend, numeric, sparse
+from .backend import get_backend, get_backends, set_backend
+from .elimination import decompose_lu, get_determinant_bareiss, get_determinant_bareiss_gaussian, get_determinant_from_lu, invert, invert_bareiss, invert_from_lu, is_gaussian_integer, reduce_rows, solve_lu, to_exact
 from .errors import *
+from .formatting import format_matrix, set_print_options
+from .multiplication import multiply, set_strassen_threshold
+from .numeric import get_numeric_mode, get_numeric_modes, set_numeric_mode
+from .properties import analyze
+from .sparse import set_sparse_options
+from fractions import Fraction
+from math import isfinite
+from operator import mul
 
 class Matrix(object):
     
@@ -10,77 +21,82 @@ class Matrix(object):
         # Inicializa os atributos privados do objeto.
         self.__complex_values = 0
         self.__non_zero_values = 0
-    
-        # Cria uma lista para armazenar os elementos da matriz.
-        self.__matrix = [[0,] * columns for i in range(rows)]
-        self.__rows, self.__columns = rows, columns
-    
-        # Adiciona os valores do iterável à matriz, se houverem.
-        for index in range(min(rows * columns, len(iterable))):
-            self[index] = iterable[index]
 
-    def __str__(self):
-        # Obtém o comprimento da maior string de elemento da matriz.
-        largest_string_length = 0
+        # Resultados calculados a partir dos elementos (ex: decomposição LU, transposta, determinante), descartados
+        # quando a matriz é alterada. A versão é incrementada a cada alteração da matriz.
+        self.__cache = dict()
+        self.__version = 0
+
+        # Cria um buffer contíguo, em ordem de linhas (row-major), para armazenar os elementos da matriz.
+        # O elemento (linha, coluna) se encontra no índice (linha * colunas + coluna) do buffer.
+        # Matrizes grandes e com poucos elementos não nulos são armazenadas em um dicionário
+        # {índice: valor}, somente com os elementos não nulos, e o buffer fica como None.
+        if sparse.should_be_sparse(0, rows * columns):
+            self.__values, self.__entries = None, dict()
+        else:
+            self.__values, self.__entries = [0,] * (rows * columns), None
 
-        for row, column, element in self:
-            element_string_length = len(str(element))
-            
-            if element_string_length > largest_string_length:
-                largest_string_length = element_string_length
+        # Cópias da matriz compartilham o mesmo armazenamento (copy-on-write), que só
+        # é copiado quando uma das matrizes que o compartilham é alterada.
+        self.__shared = False
 
-        element_format = "{:>" + str(largest_string_length) + "}"
-        string = ""
+        self.__rows, self.__columns = rows, columns
 
-        # Constrói a string a ser retornada, tratando linha por linha.
-        for row in range(self.__rows):
-            string += "|"
-            
-            for column in range(self.__columns):
-                element = self[row: column]
+        # Adiciona os valores do iterável à matriz, se houverem.
+        if len(iterable) > 0:
+            values = [iterable[index] for index in range(min(rows * columns, len(iterable)))]
 
-                # Remove os parênteses do número complexo e troca a letra "J" por "I".
-                if isinstance(element, complex):
-                    element = str(element).replace("(", "").replace(")", "").replace("j", "i")
+            # Verifica se o objeto iterável é formado apenas por números.
+            number_array, value_index, value_type = self.__is_number_array(values)
+            if not number_array: raise TypeError("Value must be a number (int, float or complex), not '{}'".format(value_type.__name__))
 
-                # Adiciona o elemento à linha da string.
-                string += element_format.format(element) + (" " if column != (self.__columns - 1) else "")
+            self.__load_values(values + [0,] * (rows * columns - len(values)))
 
-            # Finaliza a linha da string.
-            string += "|" + ("\n" if row != (self.__rows - 1) else "")
-        return string
+    def __str__(self):
+        # Cada elemento mostrado é lido diretamente do armazenamento, sem passar pelo protocolo de iteração.
+        if self.__entries is None: return format_matrix(self.__rows, self.__columns, self.__values.__getitem__)
+        return format_matrix(self.__rows, self.__columns, lambda index: self.__entries.get(index, 0))
 
     def __repr__(self):
         matrix_type = "Complex" if self.is_complex() else "Real"
         return "<{} Matrix : {},{}>".format(matrix_type, self.__rows, self.__columns)
     
     def __len__(self):
-        return len(self.__matrix)
+        return self.__rows
 
     def __contains__(self, value):
-        for row in self.__matrix:
-            if value in row: return True
-        return False
+        if self.__entries is None: return value in self.__values
+
+        # Em uma matriz esparsa, o zero está presente se nem todos os elementos estiverem no dicionário.
+        if value == 0 and len(self.__entries) < self.__rows * self.__columns: return True
+        return value in self.__entries.values()
+
+    def __get_index(self, position):
+        # Caso seja obtido um índice (valor inteiro), ele já é a posição do elemento no buffer.
+        if isinstance(position, int): return position
+        row, column = position.start, position.stop
 
-    def __get_row_and_column(self, position):
-        # Caso seja obtido um índice (valor inteiro), a linha e coluna do elemento serão calculados.
-        position = slice(*divmod(position, self.__columns)) if isinstance(position, int) else position
-        return position.start, position.stop
+        # Verifica se a linha e a coluna estão dentro da matriz, já que no buffer
+        # uma coluna excedente apontaria silenciosamente para a linha seguinte.
+        if not (0 <= row < self.__rows and 0 <= column < self.__columns):
+            raise IndexError("Matrix index out of range")
+        return row * self.__columns + column
 
     def __getitem__(self, position):
         """
         Param position: Deve ser um índice (inteiro) ou um slice [row: column]. (OBS: As posições aqui devem começar de 0)
         """
-        row, column = self.__get_row_and_column(position)
-        return self.__matrix[row][column]
+        if self.__entries is None: return self.__values[self.__get_index(position)]
+        return self.__entries.get(self.__get_index(position), 0)
 
     def __setitem__(self, position, value):
         """
         Param position: Deve ser um índice (inteiro) ou um slice [row: column]. (OBS: As posições aqui devem começar de 0)
         Param value: Deve ser um número (int, float, complex).
         """
-        row, column = self.__get_row_and_column(position)
-        old_value = self[row: column]
+        index = self.__get_index(position)
+        old_value = self[index]
+        self.__invalidate()
         
         # Verifica se o tipo dos valores para determinar ao final
         # se existem números complexos na matriz.
@@ -97,7 +113,20 @@ class Matrix(object):
 
         # Verifica se o valor é um número e o insere na posição especificada.
         if not self.__is_number(value): raise TypeError("Value must be a number (int, float or complex), not '{}'".format(type(value).__name__))
-        self.__matrix[row][column] = int(value) if not isinstance(value, complex) and int(value) == value else value
+        value = self.__normalize(value)
+        self.__detach()
+
+        if self.__entries is None:
+            self.__values[index] = value
+            return
+
+        # Em uma matriz esparsa, apenas os elementos não nulos são guardados.
+        if value != 0: self.__entries[index] = value
+        else: self.__entries.pop(index, None)
+
+        # Caso a matriz já possua muitos elementos não nulos, ela passa a ser densa.
+        if sparse.should_be_dense(self.__non_zero_values, self.__rows * self.__columns):
+            self.__values, self.__entries = self.__get_values(), None
 
     def __iter__(self):
         self.__iteration_index = 0
@@ -107,14 +136,16 @@ class Matrix(object):
         """
         Retorna uma tupla no formato (linha, coluna, valor).
         """
-        # Obtém a linha e coluna a partir do índice.
-        row, column = divmod(self.__iteration_index, self.__columns)
+        index = self.__iteration_index
+
+        # Verifica se o índice já excedeu o tamanho do buffer.
+        if index >= self.__rows * self.__columns: raise StopIteration
 
-        # Verifica se o número de linha já excedeu.
-        if row >= len(self): raise StopIteration
+        # Obtém a linha e coluna a partir do índice.
+        row, column = divmod(index, self.__columns)
         
         self.__iteration_index += 1
-        return row, column, self[row: column]
+        return row, column, self[index]
 
     def __eq__(self, matrix):
         # Verifica se o argumento é uma matriz.
@@ -124,23 +155,27 @@ class Matrix(object):
         # Verifica se a ordem das matrizes é a mesma.
         if self.get_order() != matrix.get_order(): return False
 
-        # Verifica se os valores são iguais.
-        for row, column, element in self:
-            if matrix[row: column] != element: return False
-        return True
+        # Matrizes que compartilham o mesmo armazenamento são iguais.
+        if (self.__values if self.__entries is None else self.__entries) is (matrix.__values if matrix.__entries is None else matrix.__entries): return True
+
+        # Verifica se os valores são iguais, comparando diretamente os buffers (ou os elementos não nulos).
+        if self.__entries is not None and matrix.__entries is not None:
+            return self.__entries == matrix.__entries
+        return self.__get_values() == matrix.__get_values()
 
     def __pow__(self, exponent):
-        if not isinstance(exponent, int): TypeError("Exponent must be an integer, not '{}'".format(type(value).__name__))
+        if not isinstance(exponent, int): raise TypeError("Exponent must be an integer, not '{}'".format(type(exponent).__name__))
         if not self.is_square(): raise MatrixOrderError("Must be a square matrix")
 
+        size = self.__rows
+
         # Se o expoente for zero, será retornado uma matriz identidade.
         if exponent == 0:
-            rows, columns = self.get_order()
-            identity_matrix = Matrix(*self.get_order())
+            return self.__from_values(size, size, [1 if index % (size + 1) == 0 else 0 for index in range(size * size)])
 
-            for i in range(rows):
-                identity_matrix[i: i] = 1
-            return identity_matrix
+        # Caso o backend NumPy esteja em uso, a potência é calculada por ele.
+        if self.__entries is None and backend.accepts(self.__values):
+            return self.__from_values(size, size, backend.power(self.__values, self.get_order(), exponent))
 
         # Se o expoente for menor que zero, a matriz a ser trabalhada será a inversa.
         if exponent < 0:
@@ -148,13 +183,28 @@ class Matrix(object):
             exponent *= -1
         else: matrix = self
 
-        # Obtém uma nova matriz, na qual será multiplicada pela base.
-        new_matrix = Matrix(*matrix.get_order(), matrix.to_list())
-        
-        # Multiplica a matriz por ela mesma (N - 1) vezes.
-        for i in range(exponent - 1):
-            new_matrix *= matrix
+        # Se a matriz for diagonal, basta elevar cada elemento da diagonal ao expoente.
+        if matrix.is_diagonal():
+            entries = {index: matrix[index] ** exponent for index in range(0, size * size, size + 1)}
+            return self.__from_entries(size, size, entries)
+
+        # O produto de matrizes triangulares do mesmo tipo é triangular, logo
+        # apenas a parte triangular precisa ser calculada em cada produto.
+        if matrix.is_upper_triangular(): multiply = lambda x, y: x.__mul_triangular(y, lower = False)
+        elif matrix.is_lower_triangular(): multiply = lambda x, y: x.__mul_triangular(y, lower = True)
+        else: multiply = lambda x, y: x * y
 
+        # Exponenciação por quadrados: a base é elevada ao quadrado a cada bit do expoente,
+        # sendo multiplicada ao resultado quando o bit é 1. São feitos O(log N) produtos.
+        new_matrix, base = None, matrix
+
+        while exponent:
+            if exponent & 1: new_matrix = base if new_matrix is None else multiply(new_matrix, base)
+            exponent >>= 1
+            if exponent: base = multiply(base, base)
+
+        # Caso o expoente seja 1, o resultado ainda é a própria matriz, que deve ser copiada.
+        if new_matrix is self: new_matrix = self.__copy()
         return new_matrix
 
     def __add__(self, matrix, *, sub = False):
@@ -166,12 +216,20 @@ class Matrix(object):
         if not self.get_order() == matrix.get_order():
             raise MatrixOrderError("Matrix must have the same order: {}x{}".format(*self.get_order()))
     
-        new_matrix = Matrix(*self.get_order())
+        # Caso as duas matrizes sejam esparsas, apenas os seus elementos não nulos são somados.
+        if self.__entries is not None and matrix.__entries is not None:
+            return self.__from_entries(*self.get_order(), sparse.add(self.__entries, matrix.__entries, sub = sub))
 
-        # Retorna uma nova matriz com as somas de seus elementos.
-        for row, column, element in self:
-            new_matrix[row: column] = element + matrix[row: column] * (-1 if sub else 1)
-        return new_matrix
+        x, y = self.__get_values(), matrix.__get_values()
+
+        # Caso o backend NumPy esteja em uso, a soma é calculada por ele.
+        if backend.accepts(x, y):
+            return self.__from_values(*self.get_order(), backend.add(x, y, self.get_order(), sub = sub))
+
+        # Retorna uma nova matriz com as somas de seus elementos, percorrendo os dois buffers de uma só vez.
+        if sub: values = [x_value - y_value for x_value, y_value in zip(x, y)]
+        else: values = [x_value + y_value for x_value, y_value in zip(x, y)]
+        return self.__from_values(*self.get_order(), values)
 
     def __sub__(self, matrix):
         return self.__add__(matrix, sub = True)
@@ -199,76 +257,262 @@ class Matrix(object):
         else: raise TypeError("Value must be a number (int, float or complex) or a Matrix object, not '{}'".format(type(value).__name__))
     
     def __mul_by_number(self, value, *, div = False):
-        new_matrix = Matrix(*self.get_order())
-        
+        value = self.__to_scalar(value, div = div)
+
+        # Caso a matriz seja esparsa, apenas os seus elementos não nulos são multiplicados.
+        if self.__entries is not None:
+            if div: entries = {index: element / value for index, element in self.__entries.items()}
+            else: entries = {index: element * value for index, element in self.__entries.items()}
+            return self.__from_entries(*self.get_order(), entries)
+
+        # Caso o backend NumPy esteja em uso, o produto é calculado por ele.
+        if backend.accepts(self.__values, [value]):
+            return self.__from_values(*self.get_order(), backend.multiply_by_number(self.__values, self.get_order(), value, div = div))
+
         # Retorna uma nova matriz com o produto de cada elemento pelo valor recebido.
-        for row, column, element in self:
-            if div: new_matrix[row: column] = element / value
-            else: new_matrix[row: column] = element * value
-        return new_matrix
+        if div: values = [element / value for element in self.__values]
+        else: values = [element * value for element in self.__values]
+        return self.__from_values(*self.get_order(), values)
 
     def __mul_by_matrix(self, matrix):
         # A ordem da nova matriz é (M linhas da primeira, N columnas da segunda).
-        new_matrix_rows, new_matrix_columns = matrix.get_order()
-        new_matrix = Matrix(self.__rows, new_matrix_columns)
-
-        # Retorna uma nova matriz com o produto das matrizes, no qual é uma soma
-        # das multiplicações zip(A1[row], A2[column]).
-        for row in range(self.__rows):
-            for column in range(new_matrix_columns):
-                for index in range(self.__columns):
-                    new_matrix[row: column] += self[row: index] * matrix[index: column]
-        return new_matrix
+        new_matrix_columns = matrix.get_order()[1]
+
+        # Caso uma das matrizes seja esparsa, apenas os pares de elementos não nulos são multiplicados.
+        if self.__entries is not None or matrix.__entries is not None:
+            entries = sparse.multiply(self.__get_entries(), matrix.__get_entries(), self.__columns, new_matrix_columns)
+            return self.__from_entries(self.__rows, new_matrix_columns, entries)
+
+        # Caso o backend NumPy esteja em uso, o produto é calculado por ele.
+        if backend.accepts(self.__values, matrix.__values):
+            values = backend.multiply(self.__values, matrix.__values, self.get_order(), matrix.get_order())
+            return self.__from_values(self.__rows, new_matrix_columns, values)
+
+        # Retorna uma nova matriz com o produto das matrizes, calculado a partir dos buffers.
+        values = multiply(self.__values, matrix.__values, self.__rows, self.__columns, new_matrix_columns)
+        return self.__from_values(self.__rows, new_matrix_columns, values)
+
+    def __mul_triangular(self, matrix, lower = False):
+        # Multiplica duas matrizes triangulares do mesmo tipo (ambas superiores ou ambas inferiores),
+        # calculando somente os elementos da parte triangular, a partir dos termos não nulos da soma.
+        size = self.__rows
+        x, y = self.__get_values(), matrix.__get_values()
+        values = [0,] * (size * size)
+
+        for row in range(size):
+            for column in (range(row + 1) if lower else range(row, size)):
+                indices = range(column, row + 1) if lower else range(row, column + 1)
+                values[row * size + column] = sum(x[row * size + index] * y[index * size + column] for index in indices)
+        return self.__from_values(size, size, values)
 
     def __check_diagonal(self, value = 1):
         # Um dos requisitos para a função retornar True é a matriz ser quadrada.
         if not self.is_square(): return False
-        
-        for row, column, element in self:
-            if (row == column and element != value) or (row != column and element != 0):
-                return False
-        return True
+
+        # Todos os elementos da diagonal devem ser iguais ao valor e os demais, nulos.
+        if any(self[index] != value for index in range(0, self.__rows * self.__columns, self.__columns + 1)): return False
+        return self.is_diagonal()
     
     def __check_symmetry(self, skew = False, conjugate = False):
         # Um dos requisitos para a função retornar True é a matriz ser quadrada.
         if not self.is_square(): return False
 
-        # Percorre a parte triangular superior da matriz.
-        for row in range(self.__rows):
-            for column in range(row, self.__columns):
-                # Obtém o valor da matriz. Caso pedido, o valor será conjugado.
-                value = self[column: row].conjugate() if conjugate else self[column: row]
+        # Percorre apenas os elementos não nulos da matriz, já que um par de posições
+        # (linha, coluna) e (coluna, linha) com elementos nulos sempre atende à condição.
+        for index, element in self.__iter_non_zero():
+            row, column = divmod(index, self.__columns)
+
+            # Obtém o valor da posição (coluna, linha). Caso pedido, o valor será conjugado.
+            value = self[column * self.__columns + row]
+            if conjugate: value = value.conjugate()
 
-                # Verifica se o valor na posição (linha, coluna), positivo ou negativo, dependendo
-                # do que for pedido, está presente na posição (coluna, linha).
-                if self[row: column] != value * (-1 if skew else 1): return False
+            # Verifica se o valor na posição (linha, coluna), positivo ou negativo, dependendo
+            # do que for pedido, está presente na posição (coluna, linha).
+            if element != value * (-1 if skew else 1): return False
         return True     
 
     def __check_triangular(self, lower = False):
         # Um dos requisitos para a função retornar True é a matriz ser quadrada.
         if not self.is_square(): return False
         
-        for row, column, element in self:
-            if ((row < column) if lower else (row > column)) and element != 0:
-                return False
+        for index, element in self.__iter_non_zero():
+            row, column = divmod(index, self.__columns)
+            if (row < column) if lower else (row > column): return False
         return True
 
     def __conjugate_transpose(self, conjugate = True, transpose = True):
-        new_matrix = Matrix(*self.get_order()[::-1])
+        values, columns = self.__values, self.__columns
+        order = self.get_order()
+
+        # Caso a matriz seja esparsa, apenas os seus elementos não nulos mudam de posição.
+        if self.__entries is not None:
+            entries = sparse.conjugate_transpose(self.__entries, *order, conjugate, transpose)
+            return self.__from_entries(*(order[::-1] if transpose else order), entries)
+
+        # Caso o backend NumPy esteja em uso, a operação é realizada por ele.
+        if backend.accepts(values):
+            return self.__from_values(*(order[::-1] if transpose else order), backend.conjugate_transpose(values, order, conjugate, transpose))
+
+        # Caso pedido a matriz transposta, cada coluna do buffer (obtida por um slice com passo
+        # igual ao número de colunas) se torna uma linha do novo buffer.
+        if transpose: values = [element for column in range(columns) for element in values[column::columns]]
+
+        # Caso pedido, os valores serão conjugados.
+        if conjugate: values = [element.conjugate() for element in values]
+        elif not transpose: values = values.copy()
+
+        return self.__from_values(*(order[::-1] if transpose else order), values)
+
+    def __copy(self):
+        # Retorna uma cópia da matriz que compartilha o armazenamento e os resultados salvos,
+        # sem percorrer os elementos. O armazenamento só é copiado quando uma das matrizes é alterada.
+        matrix = object.__new__(type(self))
+        matrix.__dict__.update(self.__dict__)
+        matrix.__cache = self.__cache.copy()
+
+        self.__shared = matrix.__shared = True
+        return matrix
+
+    def __detach(self):
+        # Copia o armazenamento, caso ele seja compartilhado com outra matriz, antes que ele seja alterado.
+        if not self.__shared: return
+
+        if self.__entries is not None: self.__entries = self.__entries.copy()
+        else: self.__values = self.__values.copy()
+        self.__shared = False
+
+    @classmethod
+    def __from_entries(cls, rows, columns, entries):
+        # Cria uma nova matriz a partir de um dicionário {índice: valor}, sem validar elemento por elemento.
+        matrix = cls(rows, columns)
+        matrix.__load_entries(entries)
+        return matrix
+
+    @classmethod
+    def __from_values(cls, rows, columns, values):
+        # Cria uma nova matriz a partir de um buffer de valores numéricos, sem validar elemento por elemento.
+        matrix = cls(rows, columns)
+        matrix.__load_values(values)
+        return matrix
+
+    def __get_lu(self, exact = False):
+        # Retorna a decomposição LU da matriz e se ela é exata, calculando-a somente se ela não estiver salva.
+        # Uma decomposição exata já salva também é utilizada quando não se pede aritmética exata.
+        if not exact and ("lu", True) in self.__cache: exact = True
+        key = ("lu", exact)
+
+        if not key in self.__cache:
+            self.__cache[key] = decompose_lu(self.__get_rows(), exact = exact)
+        return self.__cache[key], exact
+
+    def __to_inexact(self, values):
+        # Converte as frações de uma lista de valores para números de ponto flutuante.
+        return [float(value) if isinstance(value, Fraction) else value for value in values]
+
+    def __get_cached(self, key, function):
+        # Retorna um resultado salvo. Caso ele não exista, a função é chamada e o seu retorno é salvo.
+        if not key in self.__cache: self.__cache[key] = function()
+        return self.__cache[key]
+
+    def __get_determinant(self, exact = False):
+        # O determinante de uma matriz de ordem 1 é o próprio valor.
+        if self.__rows == 1:
+            return self[0] if self[0] != 0 else 0
 
-        for row, column, element in self:
-            # Troca a linha pela coluna e a coluna pela linha, caso seja pedido a matriz transposta.
-            if transpose: column, row = row, column
+        # Matrizes formadas apenas por inteiros são eliminadas de forma exata, assim como era pela expansão em cofatores.
+        values = self.__get_values()
+        exact = exact or all(type(value) is int for value in values)
 
-            # Insere na posição (linha, coluna) o valor. Caso pedido, será inserido o valor conjugado.
-            new_matrix[row: column] = element.conjugate() if conjugate else element
-        return new_matrix
+        # O determinante exato de matrizes reais é calculado pelo algoritmo de Bareiss, somente com inteiros.
+        if exact and not self.is_complex(): return get_determinant_bareiss(self.__get_rows())
+
+        # Matrizes complexas com partes real e imaginária inteiras também são eliminadas de forma exata.
+        if self.is_complex() and all(is_gaussian_integer(value) for value in values):
+            return get_determinant_bareiss_gaussian(self.__get_rows())
+
+        # Caso o backend NumPy esteja em uso, o determinante é calculado por ele.
+        if not exact and backend.accepts(values):
+            determinant = backend.determinant(values, self.get_order())
+            return determinant if determinant != 0 else 0
+
+        (rows, permutation, sign), exact = self.__get_lu(exact)
+        determinant = get_determinant_from_lu(rows, sign)
+        return determinant if determinant != 0 else 0
+
+    def __get_echelon_form(self, reduced = False, exact = False):
+        # Retorna o escalonamento (linhas, pivôs, passos) salvo. Matrizes com apenas inteiros e frações são escalonadas
+        # com frações, para que elementos nulos não sejam confundidos com resíduos de arredondamento. As demais são
+        # escalonadas em ponto flutuante, pois números quaisquer convertidos para frações possuem denominadores enormes.
+        exact = not self.is_complex() and (exact or self.__is_rational())
+        return self.__get_cached(("echelon", reduced, exact), lambda: reduce_rows(self.__get_rows(), reduced = reduced, exact = exact))
+
+    def __get_conjugate_transpose(self):
+        # Retorna a matriz transconjugada salva. Em matrizes reais, ela é a própria transposta.
+        if not self.is_complex(): return self.__get_transpose()
+        return self.__get_cached(("conjugate_transpose",), lambda: self.__conjugate_transpose())
+
+    def __get_product(self, conjugate = True, left = True):
+        # Retorna o produto salvo da matriz pela sua transposta (ou transconjugada), à esquerda ou à direita.
+        # Em matrizes reais, os produtos pela transconjugada e pela transposta são os mesmos.
+        conjugate = conjugate and self.is_complex()
+        other = self.__get_conjugate_transpose() if conjugate else self.__get_transpose()
+
+        key = ("product", "ct" if conjugate else "t", "left" if left else "right")
+        return self.__get_cached(key, lambda: (other * self) if left else (self * other))
+
+    def __get_transpose(self):
+        # Retorna a matriz transposta salva.
+        return self.__get_cached(("transpose",), lambda: self.__conjugate_transpose(conjugate = False))
+
+    def __get_entries(self):
+        # Retorna o dicionário {índice: valor} dos elementos não nulos. Caso a matriz seja esparsa, o próprio dicionário é retornado.
+        if self.__entries is not None: return self.__entries
+        return dict(self.__iter_non_zero())
+
+    def __get_values(self):
+        # Retorna o buffer da matriz. Caso a matriz seja esparsa, um novo buffer é construído.
+        if self.__values is not None: return self.__values
+        values = [0,] * (self.__rows * self.__columns)
+
+        for index, value in self.__entries.items():
+            values[index] = value
+        return values
+
+    def __get_rows(self):
+        # Retorna uma cópia do buffer da matriz em forma de lista de linhas.
+        values, columns = self.__get_values(), self.__columns
+        return [values[index: index + columns] for index in range(0, len(values), columns)]
+
+    def __iter_non_zero(self):
+        # Retorna um iterador de tuplas (índice, valor) dos elementos não nulos da matriz.
+        if self.__entries is not None: return iter(self.__entries.items())
+        return ((index, value) for index, value in enumerate(self.__values) if value != 0)
+
+    def __invalidate(self, determinant_factor = None):
+        # Incrementa a versão da matriz e descarta os resultados salvos. Caso seja informado o fator pelo qual
+        # o determinante foi multiplicado (operações elementares), os determinantes salvos são atualizados.
+        determinants = {key: value for key, value in self.__cache.items() if key[0] == "determinant"}
+
+        self.__version += 1
+        self.__cache.clear()
+
+        if determinant_factor is None: return
+
+        for (name, exact), determinant in determinants.items():
+            # Um determinante exato só continua exato se o fator também for.
+            if exact and not isinstance(determinant_factor, (int, Fraction)): continue
+
+            # Um determinante inteiro grande demais para ser multiplicado por um float é descartado.
+            try: determinant = self.__normalize(determinant * determinant_factor)
+            except OverflowError: continue
+
+            self.__cache[(name, exact)] = determinant if determinant != 0 else 0
 
     def __is_matrix(self, value):
         return isinstance(value, Matrix)
 
     def __is_number(self, value):
-        return type(value) in [int, float, complex]
+        return type(value) in [int, float, complex, Fraction]
 
     def __is_number_array(self, iterable):
         # Percorre o iterável, verificando se ele possui apenas elementos numéricos.
@@ -277,6 +521,86 @@ class Matrix(object):
             if not self.__is_number(value): return False, index, type(value)
         return True, None, None
 
+    def __is_exact(self, exact = False):
+        # Verifica se um cálculo deve ser exato: quando pedido ou, no modo exato, sempre que a matriz for real.
+        return exact or (numeric.is_exact() and not self.is_complex())
+
+    def __is_rational(self):
+        # Verifica se todos os elementos da matriz são inteiros ou frações.
+        return all(isinstance(value, (int, Fraction)) for index, value in self.__iter_non_zero())
+
+    def __map(self, function):
+        # Retorna uma nova matriz, com o mesmo tipo de armazenamento, aplicando a função aos elementos não nulos.
+        if self.__entries is not None: return self.__from_entries(*self.get_order(), {index: function(value) for index, value in self.__entries.items()})
+        return self.__from_values(*self.get_order(), [function(value) if value != 0 else 0 for value in self.__values])
+
+    def __load_entries(self, entries):
+        # Substitui os elementos da matriz a partir de um dicionário {índice: valor}, removendo os valores nulos.
+        self.__entries = {index: self.__normalize(value) for index, value in entries.items() if value != 0}
+        self.__values, self.__shared = None, False
+        self.__invalidate()
+
+        # Recalcula os contadores de elementos complexos e não nulos.
+        self.__complex_values = sum(1 for value in self.__entries.values() if isinstance(value, complex))
+        self.__non_zero_values = len(self.__entries)
+
+        # Caso a matriz possua muitos elementos não nulos, ela passa a ser densa.
+        if not sparse.should_be_sparse(self.__non_zero_values, self.__rows * self.__columns):
+            self.__values, self.__entries = self.__get_values(), None
+
+    def __load_values(self, values):
+        # Substitui o buffer da matriz, convertendo para inteiro os números reais e frações que não possuem parte decimal.
+        self.__values = [self.__normalize(value) for value in values]
+        self.__entries, self.__shared = None, False
+        self.__invalidate()
+
+        # Recalcula os contadores de elementos complexos e não nulos.
+        self.__complex_values = sum(1 for value in self.__values if isinstance(value, complex))
+        self.__non_zero_values = len(self.__values) - self.__values.count(0)
+
+        # Caso a matriz possua poucos elementos não nulos, ela passa a ser esparsa.
+        if sparse.should_be_sparse(self.__non_zero_values, len(self.__values)):
+            self.__entries, self.__values = dict(self.__iter_non_zero()), None
+
+    def __set_row_values(self, row, values):
+        # Substitui todos os elementos de uma linha, atualizando os contadores, sem descartar os resultados salvos.
+        start = row * self.__columns
+        values = [self.__normalize(value) for value in values]
+        old_values = [self[index] for index in range(start, start + self.__columns)]
+
+        self.__complex_values += sum(1 for value in values if isinstance(value, complex)) - sum(1 for value in old_values if isinstance(value, complex))
+        self.__non_zero_values += (len(values) - values.count(0)) - (len(old_values) - old_values.count(0))
+        self.__detach()
+
+        if self.__entries is None:
+            self.__values[start: start + self.__columns] = values
+            return
+
+        for index, value in enumerate(values, start):
+            if value != 0: self.__entries[index] = value
+            else: self.__entries.pop(index, None)
+
+        # Caso a matriz já possua muitos elementos não nulos, ela passa a ser densa.
+        if sparse.should_be_dense(self.__non_zero_values, self.__rows * self.__columns):
+            self.__values, self.__entries = self.__get_values(), None
+
+    def __normalize(self, value):
+        # Converte para inteiro os números reais e frações que não possuem parte decimal.
+        # No modo exato, os demais números de ponto flutuante são convertidos para frações.
+        if type(value) is float:
+            if value.is_integer(): return int(value)
+            return to_exact(value) if numeric.is_exact() and isfinite(value) else value
+
+        if type(value) is Fraction and value.denominator == 1: return int(value)
+        return value
+
+    def __to_scalar(self, value, div = False):
+        # No modo exato, os escalares de ponto flutuante (e os divisores inteiros) são convertidos para frações,
+        # para que os produtos e divisões não gerem números de ponto flutuante.
+        if not numeric.is_exact(): return value
+        if (type(value) is float and isfinite(value)) or (div and type(value) is int): return to_exact(value)
+        return value
+
     def __verify_position(self, position, row = True):
         # Verifica se a posição (linha ou coluna) é um inteiro maior que zero.
         if not isinstance(position, int):
@@ -310,10 +634,15 @@ class Matrix(object):
         if not self.__is_number(scalar):
             raise TypeError("Value must be a number (int, float or complex), not '{}'".format(type(scalar).__name__))
 
-        # Percorre a linha somando os seus elementos pelo elemento da outra na linha, na coluna correspondente. 
-        for column in range(self.__columns):
-           if div: self[row1: column] += self[row2: column] / scalar
-           else: self[row1: column] += self[row2: column] * scalar
+        # Soma os elementos da linha pelos elementos da outra linha, na coluna correspondente.
+        values, other_values = self.get_row(row1 + 1), self.get_row(row2 + 1)
+        scalar = self.__to_scalar(scalar, div = div)
+
+        if div: self.__set_row_values(row1, [x + y / scalar for x, y in zip(values, other_values)])
+        else: self.__set_row_values(row1, [x + y * scalar for x, y in zip(values, other_values)])
+
+        # Somar a uma linha o múltiplo de outra não altera o determinante.
+        self.__invalidate(determinant_factor = 1 if row1 != row2 else None)
 
     def conjugate(self):
         """
@@ -325,7 +654,30 @@ class Matrix(object):
         """
         Retorna a matriz transconjugada.
         """
-        return self.__conjugate_transpose()
+        return self.__get_conjugate_transpose().__copy()
+
+    def copy(self):
+        """
+        Retorna uma cópia da matriz. As duas matrizes compartilham os elementos até que uma delas seja alterada.
+        """
+        return self.__copy()
+
+    @classmethod
+    def from_buffer(cls, rows, columns, values):
+        """
+        Cria uma matriz a partir de uma lista com todos os seus valores, em ordem de linhas (row-major).
+        """
+        matrix = cls(rows, columns)
+
+        if len(values) != rows * columns:
+            raise ValueError("Expected {} values, not {}".format(rows * columns, len(values)))
+
+        # Verifica se a lista é formada apenas por números.
+        number_array, value_index, value_type = matrix.__is_number_array(values)
+        if not number_array: raise TypeError("Value must be a number (int, float or complex), not '{}'".format(value_type.__name__))
+
+        matrix.__load_values(values)
+        return matrix
 
     def get(self, row, column):
         """
@@ -365,35 +717,39 @@ class Matrix(object):
         Retorna toda a coluna da matriz em uma determinada posição (coluna).
         """
         column = self.__verify_position(column, row = False)
-        return [self[row: column] for row in range(self.__rows)]
+        return [self[index] for index in range(column, self.__rows * self.__columns, self.__columns)]
 
-    def get_determinant(self):
+    def get_determinant(self, *, exact = False):
         """
-        Retorna o determinante da matriz.
+        Retorna o determinante da matriz, calculado por eliminação gaussiana com pivoteamento parcial.
+        Caso exact seja True, o cálculo é feito com frações (não suportado para matrizes complexas).
         """
         if not self.is_square():
             raise MatrixOrderError("Matrix must be a square matrix")
 
-        # O determinante de uma matriz de ordem 0 é 1.
-        if self.__rows == 0: return 1
+        exact = self.__is_exact(exact)
 
-        # O determinante de uma matriz de ordem 1 é o próprio valor.
-        if self.__rows == 1:
-            return self[0] if self[0] != 0 else 0
+        # Caso o determinante já tenha sido calculado, ele é reaproveitado.
+        if ("determinant", exact) in self.__cache: return self.__cache[("determinant", exact)]
+        determinant = self.__get_determinant(exact)
 
-        # Caso a matriz seja de ordem 2, basta utilizar a fórmula (AD - BC)
-        if self.__rows == 2:
-            determinant = self[0] * self[3] - self[1] * self[2]
-            return determinant if determinant != 0 else 0
+        self.__cache[("determinant", exact)] = determinant
+        return determinant
 
-        determinant = 0
+    def get_echelon_form(self, *, reduced = False, exact = False):
+        """
+        Retorna uma tupla (matriz, passos) com a forma escalonada da matriz, ou a forma escalonada reduzida
+        (reduced = True), e a lista de operações elementares realizadas. Caso exact seja True, os elementos
+        e escalares de matrizes reais são retornados como frações.
 
-        # Calcula o determinante multiplicando os elementos da primeira
-        # linha pelos seus cofatores e os somando.
-        for column in range(self.__columns):
-            determinant += self[0: column] * self.get_cofactor(1, column + 1)
-            
-        return determinant if determinant != 0 else 0
+        Os escalares de matrizes com apenas inteiros e frações são sempre retornados como frações (inclusive os
+        inteiros), já que elas são escalonadas de forma exata. Assim, os passos podem ser reaplicados sem arredondamentos.
+        """
+        rows, pivots, steps = self.__get_echelon_form(reduced, exact)
+        values = [value for row in rows for value in row]
+
+        if self.__is_exact(exact): return self.__from_values(*self.get_order(), values), list(steps)
+        return self.__from_values(*self.get_order(), self.__to_inexact(values)), [tuple(self.__normalize(value) if type(value) is float else value for value in step) for step in steps]
 
     def get_matrix_minor(self, row, column):
         """
@@ -419,15 +775,70 @@ class Matrix(object):
                 
         return new_matrix
 
-    def get_matrix_inverse(self):
+    def get_matrix_inverse(self, *, exact = False):
         """
-        Retorna a matriz inversa.
+        Retorna a matriz inversa, calculada por eliminação de Gauss-Jordan com pivoteamento parcial.
+        Caso exact seja True, o cálculo é feito com frações (não suportado para matrizes complexas).
         """
-        determinant = self.get_determinant()
+        if not self.is_square():
+            raise MatrixOrderError("Must be a square matrix")
+
+        exact = self.__is_exact(exact)
+
+        # Matrizes de inteiros ou frações são sempre invertidas de forma exata (Bareiss), sendo
+        # convertidas para ponto flutuante somente no final, caso não se peça aritmética exata.
+        rational = not self.is_complex() and (exact or self.__is_rational())
+
+        # Caso o backend NumPy esteja em uso, a inversa das demais matrizes é calculada por ele.
+        if not rational and backend.accepts(self.__get_values()):
+            return self.__from_values(*self.get_order(), backend.inverse(self.__get_values(), self.get_order()))
+
+        key = ("inverse", exact)
+
+        # Se a decomposição LU da matriz já estiver salva, ela é reaproveitada para obter a inversa.
+        if not key in self.__cache:
+            if ("lu", True) in self.__cache or (("lu", exact) in self.__cache and not rational):
+                (rows, permutation, sign), lu_exact = self.__get_lu(exact)
+                rows = invert_from_lu(rows, permutation, exact = lu_exact)
+            elif rational:
+                rows = invert_bareiss(self.__get_rows())
+            else:
+                rows = invert(self.__get_rows(), exact = exact)
+
+            values = [value for row in rows for value in row]
+            self.__cache[key] = values if exact else self.__to_inexact(values)
+
+        return self.__from_values(*self.get_order(), self.__cache[key])
+
+    def get_non_zero_elements(self):
+        """
+        Retorna uma lista de tuplas (linha, coluna, valor) com os elementos não nulos da matriz. (OBS: As posições aqui começam de 0)
+        """
+        return [(*divmod(index, self.__columns), value) for index, value in sorted(self.__iter_non_zero())]
+
+    def get_null_space(self, *, exact = False):
+        """
+        Retorna uma matriz cujas colunas formam uma base do espaço nulo (núcleo) da matriz,
+        ou None caso o espaço nulo seja apenas o vetor nulo.
+        """
+        rows, pivots, steps = self.__get_echelon_form(reduced = True, exact = exact)
+        free_columns = [column for column in range(self.__columns) if not column in set(pivots)]
+
+        if not free_columns: return None
+        vectors = []
 
-        # Retorna a matriz se o determinante for diferente de zero.
-        if determinant == 0: raise NonInvertibleMatrixError("Matrix is not invertible because its determinant is zero")
-        return self.get_adjugate_matrix() / determinant
+        # Cada variável livre gera um vetor da base, com 1 na sua posição e, nas posições das variáveis
+        # dos pivôs, o oposto dos elementos da sua coluna na forma escalonada reduzida.
+        for free_column in free_columns:
+            vector = [0,] * self.__columns
+            vector[free_column] = 1
+
+            for row, pivot_column in enumerate(pivots):
+                vector[pivot_column] = -rows[row][free_column]
+            vectors.append(vector)
+
+        values = [value for row in zip(*vectors) for value in row]
+        return self.__from_values(self.__columns, len(vectors), values if self.__is_exact(exact) else self.__to_inexact(values))
 
     def get_order(self):
         """
@@ -435,12 +846,44 @@ class Matrix(object):
         """
         return (self.__rows, self.__columns)
 
+    def get_properties(self):
+        """
+        Retorna um dicionário com todas as propriedades da matriz, obtidas percorrendo os seus elementos uma única vez.
+        Normal, ortogonal e determinante só são calculados quando as demais propriedades não os decidem.
+        """
+        def get_properties():
+            properties = analyze(self.__iter_non_zero(), self.__getitem__, self.__rows, self.__columns, self.is_complex())
+
+            # Salva as propriedades obtidas, para que os métodos is_* não percorram a matriz novamente.
+            for name in ("diagonal", "hermitian", "identity", "lower_triangular", "normal", "orthogonal", "scalar",
+                         "skew_hermitian", "skew_symmetric", "symmetric", "upper_triangular"):
+                if name in properties: self.__cache[("is_" + name,)] = properties[name]
+
+            if not properties["square"]: return properties
+            self.__cache[("trace",)] = properties["trace"]
+
+            if not "normal" in properties: properties["normal"] = self.is_normal()
+            if not "orthogonal" in properties: properties["orthogonal"] = self.is_orthogonal()
+
+            if "determinant" in properties: properties["determinant"] = self.__normalize(properties["determinant"])
+            else: properties["determinant"] = self.get_determinant()
+            return properties
+
+        return self.__get_cached(("properties",), get_properties).copy()
+
+    def get_rank(self):
+        """
+        Retorna o posto da matriz, que é o número de pivôs da sua forma escalonada.
+        """
+        rows, pivots, steps = self.__get_echelon_form()
+        return len(pivots)
+
     def get_row(self, row):
         """
         Retorna toda a linha da matriz em uma determinada posição (linha).
         """
         row = self.__verify_position(row)
-        return self.__matrix[row].copy()
+        return [self[index] for index in range(row * self.__columns, (row + 1) * self.__columns)]
 
     def get_trace(self):
         """
@@ -449,11 +892,13 @@ class Matrix(object):
         if not self.is_square():
             raise MatrixOrderError("Must be a square matrix")
         
-        value = 0
-        
-        for index in range(self.__rows):
-            value += self[index: index]
-        return value
+        return self.__get_cached(("trace",), lambda: sum(self[index: index] for index in range(self.__rows)))
+
+    def get_version(self):
+        """
+        Retorna a versão da matriz, que é incrementada sempre que a matriz é alterada.
+        """
+        return self.__version
 
     def interchange_rows(self, row1, row2):
         """
@@ -462,11 +907,13 @@ class Matrix(object):
         row1 = self.__verify_position(row1)
         row2 = self.__verify_position(row2)
 
-        # Percorre as linhas trocando o valor de suas colunas.
-        for column in range(self.__columns):
-            row1_value, row2_value = self[row1: column], self[row2: column]
-            self[row1: column] = row2_value
-            self[row2: column] = row1_value
+        # Troca os valores das linhas.
+        row1_values, row2_values = self.get_row(row1 + 1), self.get_row(row2 + 1)
+        self.__set_row_values(row1, row2_values)
+        self.__set_row_values(row2, row1_values)
+
+        # Trocar duas linhas (distintas) de posição inverte o sinal do determinante.
+        self.__invalidate(determinant_factor = -1 if row1 != row2 else 1)
 
     def is_column(self):
         """
@@ -484,37 +931,37 @@ class Matrix(object):
         """
         Verifica se a matriz é uma matriz diagonal.
         """
-        for row, column, element in self:
-            if row != column and element != 0:
-                return False
-        return True
+        def check():
+            for index, element in self.__iter_non_zero():
+                row, column = divmod(index, self.__columns)
+                if row != column: return False
+            return True
+        return self.__get_cached(("is_diagonal",), check)
 
     def is_hermitian(self):
         """
         Verifica se a matriz é uma matriz hermitiana.
         """
-        return self.__check_symmetry(conjugate = True)
+        return self.__get_cached(("is_hermitian",), lambda: self.__check_symmetry(conjugate = True))
 
     def is_identity(self):
         """
         Verifica se a matriz é uma matriz identidade.
         """
-        return self.__check_diagonal(value = 1)
+        return self.__get_cached(("is_identity",), lambda: self.__check_diagonal(value = 1))
 
     def is_lower_triangular(self):
         """
         Verifica se a matriz é uma matriz triangular inferior.
         """
-        return self.__check_triangular(lower = True)
+        return self.__get_cached(("is_lower_triangular",), lambda: self.__check_triangular(lower = True))
 
     def is_normal(self):
         """
         Verifica se a matriz é uma matriz normal.
         """
         if not self.is_square(): return False
-        
-        ct_matrix = self.conjugate_transpose()
-        return ct_matrix * self == self * ct_matrix
+        return self.__get_cached(("is_normal",), lambda: self.__get_product(left = True) == self.__get_product(left = False))
 
     def is_null(self):
         """
@@ -527,11 +974,11 @@ class Matrix(object):
         Verifica se a matriz é uma matriz ortogonal.
         """
         if not self.is_square(): return False
-        
-        t_matrix = self.transpose()
-        result = t_matrix * self
-        
-        return (result == self * t_matrix) and result.is_identity()
+
+        def check():
+            result = self.__get_product(conjugate = False, left = True)
+            return (result == self.__get_product(conjugate = False, left = False)) and result.is_identity()
+        return self.__get_cached(("is_orthogonal",), check)
 
     def is_row(self):
         """
@@ -543,19 +990,25 @@ class Matrix(object):
         """
         Verifica se a matriz é uma matriz escalar.
         """
-        return self.__check_diagonal(value = self[0])
+        return self.__get_cached(("is_scalar",), lambda: self.__check_diagonal(value = self[0]))
         
     def is_skew_hermitian(self):
         """
         Verifica se a matriz é uma matriz anti-hermitiana.
         """
-        return self.__check_symmetry(skew = True, conjugate = True)
+        return self.__get_cached(("is_skew_hermitian",), lambda: self.__check_symmetry(skew = True, conjugate = True))
 
     def is_skew_symmetric(self):
         """
         Verifica se a matriz é uma matriz anti-simétrica.
         """
-        return self.__check_symmetry(skew = True)
+        return self.__get_cached(("is_skew_symmetric",), lambda: self.__check_symmetry(skew = True))
+
+    def is_sparse(self):
+        """
+        Verifica se a matriz está armazenada de forma esparsa.
+        """
+        return self.__entries is not None
 
     def is_square(self):
         """
@@ -567,13 +1020,50 @@ class Matrix(object):
         """
         Verifica se a matriz é uma matriz simétrica.
         """
-        return self.__check_symmetry()
+        return self.__get_cached(("is_symmetric",), lambda: self.__check_symmetry())
 
     def is_upper_triangular(self):
         """
         Verifica se a matriz é uma matriz triangular superior.
         """
-        return self.__check_triangular(lower = False)
+        return self.__get_cached(("is_upper_triangular",), lambda: self.__check_triangular(lower = False))
+
+    @classmethod
+    def linear_combination(cls, terms):
+        """
+        Retorna a matriz resultante da combinação linear (escalar1 * matriz1 + escalar2 * matriz2 + ...)
+        de uma lista de tuplas (escalar, matriz), calculada percorrendo os elementos uma única vez.
+        """
+        terms = list(terms)
+        if not terms: raise ValueError("Expected at least one term")
+
+        order = terms[0][1].get_order() if isinstance(terms[0][1], Matrix) else None
+
+        for scalar, matrix in terms:
+            if not isinstance(matrix, Matrix):
+                raise TypeError("Expected a Matrix object, not '{}'".format(type(matrix).__name__))
+            if not matrix.__is_number(scalar):
+                raise TypeError("Value must be a number (int, float or complex), not '{}'".format(type(scalar).__name__))
+            if matrix.get_order() != order:
+                raise MatrixOrderError("Matrix must have the same order: {}x{}".format(*order))
+
+        terms = [(matrix.__to_scalar(scalar), matrix) for scalar, matrix in terms]
+
+        # Caso todas as matrizes sejam esparsas, apenas os seus elementos não nulos são acumulados.
+        if all(matrix.__entries is not None for scalar, matrix in terms):
+            entries = dict()
+
+            for scalar, matrix in terms:
+                for index, value in matrix.__entries.items():
+                    entries[index] = entries.get(index, 0) + scalar * value
+            return cls.__from_entries(*order, entries)
+
+        # Percorre os buffers de uma só vez, acumulando os termos de cada elemento.
+        scalars, buffers = [scalar for scalar, matrix in terms], [matrix.__get_values() for scalar, matrix in terms]
+
+        if len(terms) == 1: values = [scalars[0] * value for value in buffers[0]]
+        else: values = [sum(map(mul, scalars, elements)) for elements in zip(*buffers)]
+        return cls.__from_values(*order, values)
 
     def multiply(self, value, *, div = False):
         """
@@ -588,10 +1078,19 @@ class Matrix(object):
         """
         row = self.__verify_position(row)
 
-        # Percorre a linha multiplicando os seus elementos pelo escalar. 
-        for column in range(self.__columns):
-            if div: self[row: column] = self[row: column] / value
-            else: self[row: column] = self[row: column] * value
+        # Verifica se o valor é um número.
+        if not self.__is_number(value):
+            raise TypeError("Value must be a number (int, float or complex), not '{}'".format(type(value).__name__))
+
+        # Multiplica os elementos da linha pelo escalar.
+        value = self.__to_scalar(value, div = div)
+
+        if div: self.__set_row_values(row, [element / value for element in self.get_row(row + 1)])
+        else: self.__set_row_values(row, [element * value for element in self.get_row(row + 1)])
+
+        # Multiplicar uma linha por um escalar multiplica o determinante pelo mesmo escalar.
+        # No modo exato, o divisor já foi convertido para fração, então o fator também é exato.
+        self.__invalidate(determinant_factor = 1 / value if div else value)
 
     def set(self, row, column, value):
         """
@@ -628,14 +1127,80 @@ class Matrix(object):
         for column in range(self.__columns):
             self[row: column] = iterable[column]
 
+    def solve(self, matrix, *, exact = False):
+        """
+        Retorna a matriz X que resolve o sistema AX = B, no qual B é a matriz recebida.
+        A decomposição LU da matriz é salva, para que ela seja reaproveitada em outros sistemas.
+        """
+        if not self.is_square():
+            raise MatrixOrderError("Must be a square matrix")
+
+        # Verifica se o argumento é uma matriz com o mesmo número de linhas.
+        if not self.__is_matrix(matrix):
+            raise TypeError("Expected a Matrix object, not '{}'".format(type(matrix).__name__))
+        if matrix.get_order()[0] != self.__rows:
+            raise MatrixOrderError("Matrix must have {} rows".format(self.__rows))
+
+        exact = self.__is_exact(exact) and not matrix.is_complex()
+        (rows, permutation, sign), lu_exact = self.__get_lu(exact)
+        columns = matrix.get_order()[1]
+
+        # Resolve o sistema para cada coluna de B.
+        solutions = [solve_lu(rows, permutation, matrix.__get_values()[column::columns], exact = lu_exact) for column in range(columns)]
+        values = [value for row in zip(*solutions) for value in row]
+        return self.__from_values(self.__rows, columns, values if exact else self.__to_inexact(values))
+
+    def solve_system(self, matrix, *, exact = False):
+        """
+        Resolve o sistema AX = B, no qual B é a matriz recebida, por eliminação de Gauss-Jordan sobre a matriz
+        aumentada [A | B]. A matriz A pode ser retangular ou singular. Retorna uma tupla (solução, núcleo),
+        na qual a solução é uma solução particular (com as variáveis livres iguais a zero) e o núcleo é
+        o retorno de get_null_space(). Caso o sistema não possua solução, InconsistentSystemError é lançado.
+        """
+        if not self.__is_matrix(matrix):
+            raise TypeError("Expected a Matrix object, not '{}'".format(type(matrix).__name__))
+        if matrix.get_order()[0] != self.__rows:
+            raise MatrixOrderError("Matrix must have {} rows".format(self.__rows))
+
+        columns, solution_columns = self.__columns, matrix.__columns
+        augmented_rows = [row + other_row for row, other_row in zip(self.__get_rows(), matrix.__get_rows())]
+
+        complex_values = self.is_complex() or matrix.is_complex()
+        rows, pivots, steps = reduce_rows(augmented_rows, reduced = True, exact = not complex_values and (exact or (self.__is_rational() and matrix.__is_rational())))
+        exact = self.__is_exact(exact)
+
+        # Um pivô em uma coluna de B corresponde a uma equação 0 = b, com b diferente de zero.
+        if pivots and pivots[-1] >= columns: raise InconsistentSystemError("The system has no solution")
+        values = [0,] * (columns * solution_columns)
+
+        # Cada variável de pivô recebe o elemento de B da sua linha. As variáveis livres são zero.
+        for row, pivot_column in enumerate(pivots):
+            values[pivot_column * solution_columns: (pivot_column + 1) * solution_columns] = rows[row][columns:]
+
+        solution = self.__from_values(columns, solution_columns, values if exact else self.__to_inexact(values))
+        return solution, self.get_null_space(exact = exact)
+
+    def to_exact(self):
+        """
+        Retorna uma cópia da matriz com os números reais de ponto flutuante convertidos para frações,
+        a partir da sua representação decimal (ex: 0.1 é convertido para 1/10).
+        """
+        return self.__map(lambda value: to_exact(value) if type(value) is float and isfinite(value) else value)
+
+    def to_float(self):
+        """
+        Retorna uma cópia da matriz com as frações convertidas para números de ponto flutuante.
+        """
+        return self.__map(lambda value: float(value) if type(value) is Fraction else value)
+
     def to_list(self):
         """
         Retorna uma lista com todos os valores da matriz.
         """
-        return [value for row in self.__matrix for value in row]
+        return self.__get_values().copy()
 
     def transpose(self):
         """
         Retorna a matriz transposta.
         """
-        return self.__conjugate_transpose(conjugate = False)
+        return self.__get_transpose().__copy()
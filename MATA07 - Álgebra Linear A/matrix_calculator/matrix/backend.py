@@ -0,0 +1,95 @@
+from . import numeric
+from .errors import BackendNotAvailableError, NonInvertibleMatrixError
+from fractions import Fraction
+
+try: import numpy
+except ImportError: numpy = None
+
+__all__ = ("NUMPY", "PYTHON", "get_backend", "get_backends", "is_available", "set_backend")
+
+NUMPY = "numpy"
+PYTHON = "python"
+
+# Backend utilizado pelas operações da classe Matrix. Por padrão, o NumPy é utilizado se estiver instalado.
+current_backend = NUMPY if numpy is not None else PYTHON
+
+def get_backend():
+    """
+    Retorna o nome do backend em uso.
+    """
+    return current_backend
+
+def get_backends():
+    """
+    Retorna uma lista com o nome de todos os backends.
+    """
+    return [NUMPY, PYTHON]
+
+def is_available(name):
+    """
+    Verifica se um backend pode ser utilizado.
+    """
+    return name == PYTHON or (name == NUMPY and numpy is not None)
+
+def set_backend(name):
+    """
+    Define o backend a ser utilizado pelas operações da classe Matrix.
+    """
+    global current_backend
+
+    if not name in get_backends(): raise ValueError("Backend must be one of {}, not '{}'".format(get_backends(), name))
+    if not is_available(name): raise BackendNotAvailableError("Backend '{}' is not installed".format(name))
+    current_backend = name
+
+def accepts(*buffers):
+    """
+    Verifica se as operações sobre os buffers devem ser delegadas ao NumPy. Buffers com frações, assim
+    como todas as operações no modo exato, permanecem no backend Python, já que o NumPy não possui um tipo numérico exato.
+    Buffers formados apenas por inteiros também permanecem no backend Python, onde os inteiros não possuem limite de
+    tamanho, já que to_array os converteria para números de ponto flutuante.
+    """
+    if current_backend != NUMPY or numeric.is_exact(): return False
+    types = {type(value) for values in buffers for value in values}
+    return not Fraction in types and (float in types or complex in types)
+
+def to_array(values, order):
+    """
+    Converte um buffer (row-major) para um numpy.ndarray de números reais ou complexos.
+    """
+    dtype = complex if any(isinstance(value, complex) for value in values) else float
+    return numpy.array(values, dtype = dtype).reshape(order)
+
+def to_values(array):
+    """
+    Converte um numpy.ndarray para um buffer (row-major) de números do Python.
+    """
+    return array.ravel().tolist()
+
+def add(x, y, order, sub = False):
+    x, y = to_array(x, order), to_array(y, order)
+    return to_values(x - y if sub else x + y)
+
+def conjugate_transpose(x, order, conjugate = True, transpose = True):
+    array = to_array(x, order)
+
+    if transpose: array = array.T
+    if conjugate: array = array.conj()
+    return to_values(array)
+
+def determinant(x, order):
+    return numpy.linalg.det(to_array(x, order)).item()
+
+def inverse(x, order):
+    try: return to_values(numpy.linalg.inv(to_array(x, order)))
+    except numpy.linalg.LinAlgError: raise NonInvertibleMatrixError("Matrix is not invertible because its determinant is zero")
+
+def multiply(x, y, x_order, y_order):
+    return to_values(to_array(x, x_order) @ to_array(y, y_order))
+
+def multiply_by_number(x, order, value, div = False):
+    array = to_array(x, order)
+    return to_values(array / value if div else array * value)
+
+def power(x, order, exponent):
+    try: return to_values(numpy.linalg.matrix_power(to_array(x, order), exponent))
+    except numpy.linalg.LinAlgError: raise NonInvertibleMatrixError("Matrix is not invertible because its determinant is zero")
@@ -0,0 +1,359 @@
+from .errors import NonInvertibleMatrixError
+from fractions import Fraction
+from math import gcd
+
+__all__ = (
+    "decompose_lu", "get_determinant_bareiss", "get_determinant_bareiss_gaussian", "get_determinant_from_lu", "invert", "invert_bareiss",
+    "invert_from_lu", "is_gaussian_integer", "reduce_rows", "solve_lu", "to_exact_rows"
+)
+
+# Em aritmética de ponto flutuante, valores com módulo menor que a tolerância são considerados nulos no escalonamento.
+# Na inversão, a tolerância é relativa ao maior módulo da matriz, para que pivôs que são apenas resíduos de
+# arredondamento de um zero não sejam usados.
+tolerance = 1e-12
+
+def is_negligible(value, scale, exact = False):
+    """
+    Verifica se um pivô deve ser considerado nulo. Em aritmética exata, apenas o zero é nulo.
+    """
+    if exact: return value == 0
+    return abs(value) <= tolerance * scale
+
+def to_exact(value):
+    """
+    Converte um número real para fração. Números de ponto flutuante são convertidos a partir
+    da sua representação decimal, para que 0.1 seja 1/10 e não a sua aproximação binária.
+    """
+    if isinstance(value, (int, Fraction)): return Fraction(value)
+    if isinstance(value, complex): raise TypeError("Exact arithmetic does not support complex numbers")
+    return Fraction(str(value))
+
+def to_exact_rows(rows):
+    """
+    Converte todos os elementos de uma lista de linhas para frações.
+    """
+    return [[to_exact(value) for value in row] for row in rows]
+
+def to_integer_rows(rows):
+    """
+    Multiplica cada linha pelo mínimo múltiplo comum dos denominadores dos seus elementos, retornando
+    uma tupla (linhas, escalas) na qual as linhas possuem apenas inteiros e as escalas são os multiplicadores.
+    """
+    rows, scales = to_exact_rows(rows), []
+
+    for row in rows:
+        scale = 1
+        for value in row: scale = scale * value.denominator // gcd(scale, value.denominator)
+        scales.append(scale)
+
+    return [[int(value * scale) for value in row] for row, scale in zip(rows, scales)], scales
+
+def choose_pivot(rows, column, start, exact = False):
+    """
+    Retorna a linha do pivô de uma coluna, a partir de uma linha inicial. Em aritmética exata,
+    basta que ele seja diferente de zero. Caso contrário, é escolhido o de maior módulo, para
+    reduzir o erro de arredondamento.
+    """
+    if exact: return next((i for i in range(start, len(rows)) if rows[i][column] != 0), start)
+    return max(range(start, len(rows)), key = lambda i: abs(rows[i][column]))
+
+def decompose_lu(rows, exact = False):
+    """
+    Realiza a decomposição LU, com pivoteamento parcial (PA = LU), de uma matriz quadrada
+    dada como uma lista de linhas. A lista de linhas é modificada e passa a conter os fatores
+    L (abaixo da diagonal, sem a diagonal unitária) e U (diagonal e acima dela).
+
+    Retorna uma tupla (linhas, permutação, sinal), na qual a permutação é a lista com a linha
+    original de cada linha do resultado e o sinal é o sinal da permutação (1 ou -1).
+    """
+    if exact: rows = to_exact_rows(rows)
+
+    size = len(rows)
+    permutation = list(range(size))
+    sign = 1
+
+    for k in range(size):
+        pivot_row = choose_pivot(rows, k, k, exact = exact)
+
+        # Se a coluna for nula a partir da diagonal, não há o que eliminar (a matriz é singular).
+        pivot = rows[pivot_row][k]
+        if pivot == 0: continue
+
+        # Troca as linhas, registrando a permutação e invertendo o sinal.
+        if pivot_row != k:
+            rows[k], rows[pivot_row] = rows[pivot_row], rows[k]
+            permutation[k], permutation[pivot_row] = permutation[pivot_row], permutation[k]
+            sign = -sign
+
+        pivot_tail = rows[k][k + 1:]
+
+        # Elimina os elementos abaixo do pivô, guardando o multiplicador no lugar do elemento eliminado.
+        for i in range(k + 1, size):
+            row = rows[i]
+            factor = row[k] / pivot
+            row[k] = factor
+
+            if factor == 0: continue
+            row[k + 1:] = [value - factor * pivot_value for value, pivot_value in zip(row[k + 1:], pivot_tail)]
+
+    return rows, permutation, sign
+
+def get_determinant_from_lu(rows, sign):
+    """
+    Retorna o determinante a partir da decomposição LU, que é o produto da diagonal de U
+    multiplicado pelo sinal da permutação.
+    """
+    determinant = sign
+
+    for index in range(len(rows)):
+        determinant *= rows[index][index]
+        if determinant == 0: return 0
+
+    # Frações inteiras são retornadas como inteiros.
+    if isinstance(determinant, Fraction) and determinant.denominator == 1:
+        return int(determinant)
+    return determinant
+
+def get_determinant_bareiss(rows):
+    """
+    Retorna o determinante exato de uma matriz real, dada como uma lista de linhas, pelo algoritmo de Bareiss.
+    A eliminação é feita apenas com inteiros: cada elemento é atualizado por (p * a - b * c) / p', no qual p' é o
+    pivô anterior, e a divisão é sempre exata. Assim, os elementos crescem no máximo como os menores da matriz,
+    sem o custo de normalizar frações a cada operação.
+    """
+    rows, scales = to_integer_rows(rows)
+    size, sign, previous = len(rows), 1, 1
+
+    for k in range(size - 1):
+        # Caso o pivô seja zero, é trocado por um elemento não nulo abaixo dele, invertendo o sinal.
+        if rows[k][k] == 0:
+            pivot_row = next((i for i in range(k + 1, size) if rows[i][k] != 0), None)
+            if pivot_row is None: return 0
+
+            rows[k], rows[pivot_row] = rows[pivot_row], rows[k]
+            sign = -sign
+
+        pivot, pivot_tail = rows[k][k], rows[k][k + 1:]
+
+        for i in range(k + 1, size):
+            row = rows[i]
+            factor = row[k]
+            row[k + 1:] = [(pivot * value - factor * pivot_value) // previous for value, pivot_value in zip(row[k + 1:], pivot_tail)]
+
+        previous = pivot
+
+    # O determinante das linhas originais é o das linhas multiplicadas, dividido pelas escalas.
+    determinant = Fraction(sign * rows[-1][-1])
+    for scale in scales: determinant /= scale
+
+    return int(determinant) if determinant.denominator == 1 else determinant
+
+def is_gaussian_integer(value):
+    """
+    Verifica se um número possui partes real e imaginária inteiras.
+    """
+    if isinstance(value, complex): return value.real.is_integer() and value.imag.is_integer()
+    if isinstance(value, float): return value.is_integer()
+    return isinstance(value, int) or (isinstance(value, Fraction) and value.denominator == 1)
+
+def get_determinant_bareiss_gaussian(rows):
+    """
+    Retorna o determinante exato de uma matriz de inteiros gaussianos (números complexos com partes real e
+    imaginária inteiras) pelo algoritmo de Bareiss. Cada elemento é representado por um par de inteiros
+    (real, imaginário), e as divisões pelo pivô anterior continuam exatas, como nos inteiros.
+    """
+    rows = [[(int(value.real), int(value.imag)) for value in row] for row in rows]
+    size, sign, previous = len(rows), 1, (1, 0)
+
+    def multiply(x, y):
+        return (x[0] * y[0] - x[1] * y[1], x[0] * y[1] + x[1] * y[0])
+
+    def divide(x, y):
+        # Divisão exata: x / y = x * conj(y) / |y|².
+        norm = y[0] * y[0] + y[1] * y[1]
+        real, imag = multiply(x, (y[0], -y[1]))
+        return (real // norm, imag // norm)
+
+    for k in range(size - 1):
+        # Caso o pivô seja zero, é trocado por um elemento não nulo abaixo dele, invertendo o sinal.
+        if rows[k][k] == (0, 0):
+            pivot_row = next((i for i in range(k + 1, size) if rows[i][k] != (0, 0)), None)
+            if pivot_row is None: return 0
+
+            rows[k], rows[pivot_row] = rows[pivot_row], rows[k]
+            sign = -sign
+
+        pivot, pivot_tail = rows[k][k], rows[k][k + 1:]
+
+        for i in range(k + 1, size):
+            row = rows[i]
+            factor = row[k]
+            row[k + 1:] = [
+                divide(tuple(a - b for a, b in zip(multiply(pivot, value), multiply(factor, pivot_value))), previous)
+                for value, pivot_value in zip(row[k + 1:], pivot_tail)
+            ]
+
+        previous = pivot
+
+    real, imag = rows[-1][-1]
+    return complex(sign * real, sign * imag) if real or imag else 0
+
+def invert(rows, exact = False):
+    """
+    Retorna a inversa de uma matriz quadrada, dada como uma lista de linhas, através
+    da eliminação de Gauss-Jordan com pivoteamento parcial sobre a matriz aumentada [A | I].
+    """
+    if exact: rows = to_exact_rows(rows)
+    size = len(rows)
+    scale = max(abs(value) for row in rows for value in row)
+
+    # Cria a matriz aumentada, sem modificar a lista recebida.
+    rows = [row + [1 if column == index else 0 for column in range(size)] for index, row in enumerate(rows)]
+
+    for k in range(size):
+        pivot_row = choose_pivot(rows, k, k, exact = exact)
+        pivot = rows[pivot_row][k]
+
+        if is_negligible(pivot, scale, exact): raise NonInvertibleMatrixError("Matrix is not invertible because its determinant is zero")
+        rows[k], rows[pivot_row] = rows[pivot_row], rows[k]
+
+        # Divide a linha do pivô pelo pivô. As colunas anteriores a K já são nulas nessa linha.
+        pivot_tail = [value / pivot for value in rows[k][k:]]
+        rows[k][k:] = pivot_tail
+
+        # Zera a coluna K em todas as outras linhas.
+        for i in range(size):
+            row = rows[i]
+            factor = row[k]
+
+            if i == k or factor == 0: continue
+            row[k:] = [value - factor * pivot_value for value, pivot_value in zip(row[k:], pivot_tail)]
+
+    return [row[size:] for row in rows]
+
+def invert_bareiss(rows):
+    """
+    Retorna a inversa exata de uma matriz real, dada como uma lista de linhas, pela eliminação de Gauss-Jordan
+    livre de frações (Bareiss) sobre a matriz aumentada [A | I]. Ao final, a diagonal de A é o determinante
+    (a menos do sinal) e o restante da matriz aumentada é a adjunta, de forma que apenas a última divisão
+    gera frações, já simplificadas pelo mdc.
+    """
+    rows, scales = to_integer_rows(rows)
+    size, previous = len(rows), 1
+
+    # Cria a matriz aumentada, sem modificar a lista recebida.
+    rows = [row + [1 if column == index else 0 for column in range(size)] for index, row in enumerate(rows)]
+
+    for k in range(size):
+        pivot_row = next((i for i in range(k, size) if rows[i][k] != 0), None)
+
+        if pivot_row is None: raise NonInvertibleMatrixError("Matrix is not invertible because its determinant is zero")
+        rows[k], rows[pivot_row] = rows[pivot_row], rows[k]
+
+        pivot, pivot_values = rows[k][k], rows[k]
+
+        for i in range(size):
+            if i == k: continue
+
+            row = rows[i]
+            factor = row[k]
+            row[:] = [(pivot * value - factor * pivot_value) // previous for value, pivot_value in zip(row, pivot_values)]
+
+        previous = pivot
+
+    # Sendo D a matriz diagonal das escalas, a inversa das linhas originais é a inversa das linhas multiplicadas vezes D.
+    return [[Fraction(value * scales[column], row[index]) for column, value in enumerate(row[size:])] for index, row in enumerate(rows)]
+
+def solve_lu(rows, permutation, values, exact = False):
+    """
+    Resolve o sistema Ax = b a partir da decomposição LU de A, retornando a lista x.
+    """
+    size = len(rows)
+    diagonal = [rows[index][index] for index in range(size)]
+
+    # O sistema não possui solução única se algum elemento da diagonal de U for zero. Em ponto flutuante,
+    # a tolerância é relativa ao maior elemento da diagonal, já que o pivoteamento parcial os mantém na mesma escala.
+    scale = max(abs(value) for value in diagonal)
+    if any(is_negligible(value, scale, exact) for value in diagonal):
+        raise NonInvertibleMatrixError("Matrix is not invertible because its determinant is zero")
+
+    # Aplica a permutação das linhas ao vetor b.
+    result = [values[index] for index in permutation]
+    if exact: result = [to_exact(value) for value in result]
+
+    # Substituição progressiva (Ly = Pb), sendo a diagonal de L unitária.
+    for i in range(1, size):
+        row = rows[i]
+        result[i] -= sum(row[j] * result[j] for j in range(i))
+
+    # Substituição regressiva (Ux = y).
+    for i in range(size - 1, -1, -1):
+        row = rows[i]
+        result[i] = (result[i] - sum(row[j] * result[j] for j in range(i + 1, size))) / row[i]
+
+    return result
+
+def invert_from_lu(rows, permutation, exact = False):
+    """
+    Retorna a inversa de uma matriz a partir da sua decomposição LU,
+    resolvendo o sistema para cada coluna da matriz identidade.
+    """
+    size = len(rows)
+    columns = [solve_lu(rows, permutation, [1 if i == j else 0 for i in range(size)], exact = exact) for j in range(size)]
+    return [list(row) for row in zip(*columns)]
+
+def reduce_rows(rows, reduced = False, exact = False):
+    """
+    Escalona uma matriz, dada como uma lista de linhas, por eliminação gaussiana ou, caso reduced seja True,
+    por eliminação de Gauss-Jordan (forma escalonada reduzida). Cada operação elementar é aplicada à linha
+    inteira de uma só vez, a partir da coluna do pivô. A lista de linhas recebida não é modificada.
+
+    Retorna uma tupla (linhas, pivôs, passos), na qual os pivôs são as colunas dos pivôs de cada linha não nula
+    e os passos são as operações elementares realizadas, com as linhas começando de 1, no formato
+    ("<>", linha1, linha2), ("/=", linha, escalar) ou ("-=", linha1, escalar, linha2).
+    """
+    rows = to_exact_rows(rows) if exact else [list(row) for row in rows]
+    is_zero = (lambda value: value == 0) if exact else (lambda value: abs(value) < tolerance)
+
+    pivots, steps = [], []
+    row_count, k = len(rows), 0
+
+    for column in range(len(rows[0])):
+        if k == row_count: break
+        pivot_row = choose_pivot(rows, column, k, exact = exact)
+
+        # Se a coluna for nula a partir da linha K, ela não possui pivô.
+        if is_zero(rows[pivot_row][column]): continue
+
+        if pivot_row != k:
+            rows[k], rows[pivot_row] = rows[pivot_row], rows[k]
+            steps.append(("<>", k + 1, pivot_row + 1))
+
+        pivot_tail = rows[k][column:]
+        pivot = pivot_tail[0]
+
+        # Na forma reduzida, a linha do pivô é dividida pelo pivô, para que ele seja 1.
+        if reduced and pivot != 1:
+            pivot_tail = [value / pivot for value in pivot_tail]
+            rows[k][column:] = pivot_tail
+            steps.append(("/=", k + 1, pivot))
+            pivot = 1
+
+        # Zera a coluna do pivô nas linhas abaixo dele (e acima, na forma reduzida).
+        for i in range(0 if reduced else k + 1, row_count):
+            row = rows[i]
+            if i == k or row[column] == 0: continue
+
+            factor = row[column] / pivot
+
+            if exact: row[column:] = [value - factor * pivot_value for value, pivot_value in zip(row[column:], pivot_tail)]
+            else: row[column:] = [0 if is_zero(value) else value for value in (value - factor * pivot_value for value, pivot_value in zip(row[column:], pivot_tail))]
+
+            # O elemento da coluna do pivô é zerado explicitamente, evitando resíduos de arredondamento.
+            row[column] = 0
+            steps.append(("-=", i + 1, factor, k + 1))
+
+        pivots.append(column)
+        k += 1
+
+    return rows, pivots, steps
@@ -3,3 +3,9 @@ class MatrixOrderError(Exception):
 
 class NonInvertibleMatrixError(Exception):
     pass
+
+class BackendNotAvailableError(Exception):
+    pass
+
+class InconsistentSystemError(Exception):
+    pass
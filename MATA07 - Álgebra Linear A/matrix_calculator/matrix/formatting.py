@@ -0,0 +1,63 @@
+__all__ = ("format_matrix", "format_value", "set_print_options")
+
+# Matrizes com mais elementos que o limite são resumidas: apenas as edge_items primeiras e últimas
+# linhas e colunas são mostradas, e as demais são substituídas por reticências (como no NumPy).
+threshold = 1000
+edge_items = 3
+
+ellipsis = "..."
+
+def set_print_options(max_size = None, edges = None):
+    """
+    Define o número máximo de elementos de uma matriz mostrada por completo e o número de
+    linhas e colunas mostradas em cada extremidade das matrizes maiores que esse limite.
+    """
+    global threshold, edge_items
+
+    if max_size is not None:
+        if not isinstance(max_size, int) or max_size < 1: raise ValueError("Threshold must be a positive integer")
+        threshold = max_size
+
+    if edges is not None:
+        if not isinstance(edges, int) or edges < 1: raise ValueError("Edge items must be a positive integer")
+        edge_items = edges
+
+def format_value(value):
+    """
+    Retorna a string de um elemento. Números complexos são escritos sem parênteses e com
+    a letra "i" no lugar de "j", e frações no formato "numerador/denominador".
+    """
+    if isinstance(value, complex): return str(value).replace("(", "").replace(")", "").replace("j", "i")
+    return str(value)
+
+def get_positions(length, summarize):
+    # Retorna as posições mostradas de uma dimensão e a posição na qual as reticências são inseridas (ou None).
+    if not summarize or length <= edge_items * 2: return list(range(length)), None
+    return list(range(edge_items)) + list(range(length - edge_items, length)), edge_items
+
+def format_matrix(rows, columns, get_value):
+    """
+    Retorna a string de uma matriz, dada a sua ordem e uma função que recebe o índice de um
+    elemento (linha * colunas + coluna) e retorna o seu valor. Cada elemento mostrado é obtido
+    e convertido para string uma única vez, e as linhas são unidas com str.join.
+    """
+    summarize = rows * columns > threshold
+    row_positions, row_ellipsis = get_positions(rows, summarize)
+    column_positions, column_ellipsis = get_positions(columns, summarize)
+
+    strings = [[format_value(get_value(row * columns + column)) for column in column_positions] for row in row_positions]
+
+    # Todos os elementos são alinhados à direita na largura do maior deles.
+    width = max(len(string) for row_strings in strings for string in row_strings)
+    if row_ellipsis is not None or column_ellipsis is not None: width = max(width, len(ellipsis))
+
+    lines = [[string.rjust(width) for string in row_strings] for row_strings in strings]
+
+    if column_ellipsis is not None:
+        for line in lines: line.insert(column_ellipsis, ellipsis)
+
+    if row_ellipsis is not None:
+        lines.insert(row_ellipsis, [ellipsis.rjust(width)] * len(column_positions))
+        if column_ellipsis is not None: lines[row_ellipsis].insert(column_ellipsis, ellipsis)
+
+    return "\n".join("|" + " ".join(line) + "|" for line in lines)
@@ -0,0 +1,92 @@
+from operator import mul
+
+__all__ = ("multiply", "set_strassen_threshold")
+
+# Tamanho mínimo (linhas, colunas e dimensão interna) a partir do qual o produto é
+# dividido recursivamente pelo algoritmo de Strassen.
+strassen_threshold = 128
+
+def set_strassen_threshold(value):
+    """
+    Define o tamanho a partir do qual o algoritmo de Strassen é utilizado.
+    """
+    global strassen_threshold
+
+    if not isinstance(value, int) or value < 1:
+        raise ValueError("Threshold must be a positive integer")
+    strassen_threshold = value
+
+def multiply_rows(x_rows, y_rows):
+    """
+    Multiplica duas matrizes dadas como listas de linhas. As colunas da segunda matriz são obtidas
+    uma única vez, de forma que cada elemento do resultado é o produto escalar entre duas listas
+    contíguas, acumulado localmente e escrito uma única vez.
+    """
+    y_columns = list(zip(*y_rows))
+    return [[sum(map(mul, row, column)) for column in y_columns] for row in x_rows]
+
+def add_rows(x_rows, y_rows, sub = False):
+    """
+    Soma, ou subtrai (sub = True), duas matrizes dadas como listas de linhas.
+    """
+    if sub: return [[x - y for x, y in zip(x_row, y_row)] for x_row, y_row in zip(x_rows, y_rows)]
+    return [[x + y for x, y in zip(x_row, y_row)] for x_row, y_row in zip(x_rows, y_rows)]
+
+def split_rows(rows, row_half, column_half):
+    """
+    Divide uma matriz, dada como lista de linhas, em quatro blocos (11, 12, 21, 22).
+    """
+    top, bottom = rows[:row_half], rows[row_half:]
+    return (
+        [row[:column_half] for row in top], [row[column_half:] for row in top],
+        [row[:column_half] for row in bottom], [row[column_half:] for row in bottom]
+    )
+
+def pad_rows(rows, n_rows, n_columns):
+    """
+    Completa uma matriz, dada como lista de linhas, com zeros até a ordem (n_rows, n_columns).
+    """
+    rows = [row + [0,] * (n_columns - len(row)) for row in rows]
+    return rows + [[0,] * n_columns for index in range(n_rows - len(rows))]
+
+def strassen(x_rows, y_rows):
+    """
+    Multiplica duas matrizes, dadas como listas de linhas, pelo algoritmo de Strassen: o produto
+    de blocos é feito com 7 multiplicações, ao invés de 8, recursivamente até o limite definido.
+    """
+    m, n, p = len(x_rows), len(y_rows), len(y_rows[0])
+
+    if min(m, n, p) < strassen_threshold: return multiply_rows(x_rows, y_rows)
+
+    # Dimensões ímpares são completadas com zeros para que as matrizes possam ser divididas ao meio.
+    m_half, n_half, p_half = (m + 1) // 2, (n + 1) // 2, (p + 1) // 2
+
+    a11, a12, a21, a22 = split_rows(pad_rows(x_rows, m_half * 2, n_half * 2), m_half, n_half)
+    b11, b12, b21, b22 = split_rows(pad_rows(y_rows, n_half * 2, p_half * 2), n_half, p_half)
+
+    m1 = strassen(add_rows(a11, a22), add_rows(b11, b22))
+    m2 = strassen(add_rows(a21, a22), b11)
+    m3 = strassen(a11, add_rows(b12, b22, sub = True))
+    m4 = strassen(a22, add_rows(b21, b11, sub = True))
+    m5 = strassen(add_rows(a11, a12), b22)
+    m6 = strassen(add_rows(a21, a11, sub = True), add_rows(b11, b12))
+    m7 = strassen(add_rows(a12, a22, sub = True), add_rows(b21, b22))
+
+    c11 = add_rows(add_rows(m1, m4), add_rows(m7, m5, sub = True))
+    c12 = add_rows(m3, m5)
+    c21 = add_rows(m2, m4)
+    c22 = add_rows(add_rows(m1, m2, sub = True), add_rows(m3, m6))
+
+    # Junta os blocos e remove os zeros que foram adicionados.
+    rows = [left + right for left, right in zip(c11, c12)] + [left + right for left, right in zip(c21, c22)]
+    return [row[:p] for row in rows[:m]]
+
+def multiply(x, y, rows, inner, columns):
+    """
+    Multiplica duas matrizes armazenadas em buffers contíguos (row-major), de ordens
+    (rows, inner) e (inner, columns), e retorna o buffer da matriz resultante.
+    """
+    x_rows = [x[index: index + inner] for index in range(0, rows * inner, inner)]
+    y_rows = [y[index: index + columns] for index in range(0, inner * columns, columns)]
+
+    return [value for row in strassen(x_rows, y_rows) for value in row]
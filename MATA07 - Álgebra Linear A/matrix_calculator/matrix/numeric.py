@@ -0,0 +1,35 @@
+__all__ = ("EXACT", "FLOAT", "get_numeric_mode", "get_numeric_modes", "is_exact", "set_numeric_mode")
+
+EXACT = "exact"
+FLOAT = "float"
+
+# Modo numérico utilizado pela classe Matrix. No modo exato, os números reais são armazenados como frações,
+# as divisões são exatas e o determinante, a inversa e os sistemas são calculados com aritmética exata.
+current_mode = FLOAT
+
+def get_numeric_mode():
+    """
+    Retorna o nome do modo numérico em uso.
+    """
+    return current_mode
+
+def get_numeric_modes():
+    """
+    Retorna uma lista com o nome de todos os modos numéricos.
+    """
+    return [EXACT, FLOAT]
+
+def is_exact():
+    """
+    Verifica se o modo exato está em uso.
+    """
+    return current_mode == EXACT
+
+def set_numeric_mode(name):
+    """
+    Define o modo numérico a ser utilizado pelas operações da classe Matrix.
+    """
+    global current_mode
+
+    if not name in get_numeric_modes(): raise ValueError("Numeric mode must be one of {}, not '{}'".format(get_numeric_modes(), name))
+    current_mode = name
@@ -0,0 +1,86 @@
+__all__ = ("analyze",)
+
+def analyze(non_zero, get, rows, columns, is_complex = False):
+    """
+    Analisa as propriedades estruturais de uma matriz percorrendo uma única vez os seus elementos não nulos.
+
+    Param non_zero: Iterável de tuplas (índice, valor) com os elementos não nulos da matriz (buffer row-major).
+    Param get: Função que recebe um índice do buffer e retorna o elemento daquela posição.
+    Param is_complex: Indica se algum elemento armazenado é complexo, inclusive os nulos (ex: 0j).
+
+    Retorna um dicionário com as propriedades. Normal, ortogonal e determinante só estão presentes
+    no dicionário quando as demais propriedades já são suficientes para decidi-las.
+    """
+    square = rows == columns
+
+    properties = {
+        "column": columns == 1, "row": rows == 1, "square": square,
+        "complex": is_complex, "null": True, "diagonal": True,
+        "lower_triangular": square, "upper_triangular": square,
+        "symmetric": square, "skew_symmetric": square,
+        "hermitian": square, "skew_hermitian": square
+    }
+
+    # Elementos não nulos da diagonal, linhas e colunas que possuem algum elemento não nulo.
+    diagonal = []
+    non_zero_rows, non_zero_columns = set(), set()
+
+    for index, element in non_zero:
+        row, column = divmod(index, columns)
+
+        properties["null"] = False
+        non_zero_rows.add(row)
+        non_zero_columns.add(column)
+
+        # Uma matriz retangular também pode ser diagonal, mas as demais propriedades exigem que ela seja quadrada.
+        if row == column: diagonal.append(element)
+        else: properties["diagonal"] = False
+
+        if not square: continue
+
+        if row < column: properties["lower_triangular"] = False
+        if row > column: properties["upper_triangular"] = False
+
+        # Compara o elemento com o da posição (coluna, linha), de uma só vez, para as quatro simetrias.
+        mirror = get(column * columns + row)
+        conjugate = mirror.conjugate()
+
+        if element != mirror: properties["symmetric"] = False
+        if element != -mirror: properties["skew_symmetric"] = False
+        if element != conjugate: properties["hermitian"] = False
+        if element != -conjugate: properties["skew_hermitian"] = False
+
+    # Uma matriz é escalar se for diagonal e todos os elementos da diagonal forem iguais ao primeiro.
+    # Se a matriz for nula, todos eles são zero. Caso contrário, todos devem estar entre os não nulos.
+    first = get(0)
+    properties["scalar"] = square and properties["diagonal"] and (properties["null"] or (len(diagonal) == rows and all(element == first for element in diagonal)))
+    properties["identity"] = properties["scalar"] and first == 1
+
+    if not square:
+        properties["normal"] = properties["orthogonal"] = False
+        return properties
+
+    properties["trace"] = sum(get(index * (columns + 1)) for index in range(rows))
+
+    # Matrizes diagonais, hermitianas e anti-hermitianas comutam com a sua transconjugada.
+    if properties["diagonal"] or properties["hermitian"] or properties["skew_hermitian"]:
+        properties["normal"] = True
+
+    # Uma matriz diagonal é ortogonal se, e somente se, os elementos da diagonal forem 1 ou -1.
+    # Uma matriz com uma linha ou coluna nula nunca é ortogonal, e o seu determinante é zero.
+    if len(non_zero_rows) < rows or len(non_zero_columns) < columns:
+        properties["orthogonal"] = False
+        properties["determinant"] = 0
+
+    elif properties["diagonal"]:
+        properties["orthogonal"] = all(element == 1 or element == -1 for element in diagonal)
+
+    # O determinante de uma matriz triangular é o produto da sua diagonal.
+    if "determinant" not in properties and (properties["lower_triangular"] or properties["upper_triangular"]):
+        determinant = 1
+
+        for index in range(rows):
+            determinant *= get(index * (columns + 1))
+        properties["determinant"] = determinant if determinant != 0 else 0
+
+    return properties
@@ -0,0 +1,81 @@
+__all__ = ("add", "conjugate_transpose", "multiply", "set_sparse_options", "should_be_dense", "should_be_sparse")
+
+# Uma matriz é armazenada de forma esparsa (dicionário {índice: valor} apenas com os elementos
+# não nulos) quando possui pelo menos min_size elementos e no máximo a fração density deles
+# é diferente de zero. Uma matriz esparsa volta a ser densa quando passa do dobro dessa fração.
+min_size = 256
+density = 0.1
+
+def set_sparse_options(size = None, max_density = None):
+    """
+    Define o tamanho mínimo e a densidade máxima para que uma matriz seja armazenada de forma esparsa.
+    """
+    global min_size, density
+
+    if size is not None:
+        if not isinstance(size, int) or size < 1: raise ValueError("Minimum size must be a positive integer")
+        min_size = size
+
+    if max_density is not None:
+        if not 0 <= max_density <= 1: raise ValueError("Density must be between 0 and 1")
+        density = max_density
+
+def should_be_sparse(non_zero_values, size):
+    """
+    Verifica se uma matriz, com uma dada quantidade de elementos não nulos, deve ser esparsa.
+    """
+    return size >= min_size and non_zero_values <= size * density
+
+def should_be_dense(non_zero_values, size):
+    """
+    Verifica se uma matriz esparsa já possui elementos não nulos demais e deve passar a ser densa.
+    """
+    return size < min_size or non_zero_values > size * density * 2
+
+def add(x, y, sub = False):
+    """
+    Soma, ou subtrai (sub = True), os elementos não nulos de duas matrizes esparsas.
+    """
+    entries = x.copy()
+
+    for index, value in y.items():
+        entries[index] = entries.get(index, 0) + (-value if sub else value)
+    return entries
+
+def conjugate_transpose(entries, rows, columns, conjugate = True, transpose = True):
+    """
+    Retorna os elementos não nulos da matriz transposta e/ou conjugada.
+    """
+    if not transpose:
+        return {index: value.conjugate() for index, value in entries.items()} if conjugate else entries.copy()
+
+    new_entries = dict()
+
+    # O elemento (linha, coluna) passa para a posição (coluna, linha), na matriz de ordem (colunas, linhas).
+    for index, value in entries.items():
+        row, column = divmod(index, columns)
+        new_entries[column * rows + row] = value.conjugate() if conjugate else value
+    return new_entries
+
+def multiply(x, y, inner, columns):
+    """
+    Multiplica duas matrizes esparsas, de ordens (M, inner) e (inner, columns), percorrendo
+    apenas os pares de elementos não nulos que contribuem para o resultado.
+    """
+    # Agrupa os elementos não nulos da segunda matriz por linha.
+    y_rows = dict()
+
+    for index, value in y.items():
+        row, column = divmod(index, columns)
+        y_rows.setdefault(row, []).append((column, value))
+
+    entries = dict()
+
+    # Cada elemento X(i, k) contribui com X(i, k) * Y(k, j) para os elementos não nulos Y(k, j).
+    for index, x_value in x.items():
+        row, k = divmod(index, inner)
+        offset = row * columns
+
+        for column, y_value in y_rows.get(k, ()):
+            entries[offset + column] = entries.get(offset + column, 0) + x_value * y_value
+    return entries
@@ -40,7 +40,7 @@ from relacao.classe import obter_classe_de_equivalencia
 from relacao.conversor import relacao_para_ciclica, relacao_para_matricial, verificar_permutabilidade
 from relacao.diagrama import gerar_diagrama
 from relacao.ordenador import ordenar_relacao
-from relacao.propriedades import ANTI_SIMETRICA, CONGRUENCIA, REFLEXIVA, SIMETRICA, TRANSITIVA, obter_propriedades
+from relacao.propriedades import ANTI_SIMETRICA, CONGRUENCIA, REFLEXIVA, SIMETRICA, TRANSITIVA, obter_fecho, obter_propriedades
 from json.decoder import JSONDecodeError
 import os, sys
 
@@ -128,6 +128,12 @@ if propriedades[SIMETRICA][0] and propriedades[REFLEXIVA][0] and propriedades[TR
         conjunto = obter_classe_de_equivalencia(relacao, elemento if type(relacao[0][0]) is str else float(elemento))
         salvar_conjunto(conjunto, os.path.join(diretorio_do_arquivo, "Classe de Equivalência {}.txt".format(elemento)))
 
+# Para cada propriedade que a relação não possui, pergunta ao usuário se ele quer gerar o seu fecho.
+for propriedade, nome_do_fecho in [(REFLEXIVA, "Reflexivo"), (SIMETRICA, "Simétrico"), (TRANSITIVA, "Transitivo")]:
+    if not propriedades[propriedade][0] and input("\nGerar fecho {} da relação? (Y/N): ".format(nome_do_fecho.lower())).upper().startswith("Y"):
+        fecho = ordenar_relacao(obter_fecho(relacao, propriedade))
+        salvar_relacao(fecho, os.path.join(diretorio_do_arquivo, "Fecho {}.txt".format(nome_do_fecho)), "UTF-8")
+
 # Pergunta ao usuário se o mesmo quer que a relação ordenada seja gerada em um arquivo.
 if input("\nGerar relação em ordem lexicográfica? (Y/N): ").upper().startswith("Y"):
     salvar_relacao(relacao, os.path.join(diretorio_do_arquivo, "Relação Ordenada.txt"), "UTF-8")
@@ -0,0 +1,140 @@
+def menor_bit(valor) -> int:
+    """
+    Retorna a posição do bit menos significativo diferente de zero.
+    """
+    return (valor & -valor).bit_length() - 1
+
+def obter_bits(valor):
+    """
+    Função geradora que retorna as posições dos bits diferentes de zero, da menor para a maior.
+    """
+    while valor:
+        bit = valor & -valor
+        yield bit.bit_length() - 1
+        valor ^= bit
+
+class MatrizDeBits(object):
+    """
+    Relação sobre um domínio finito, armazenada como uma matriz n x n de bits. Cada linha é um inteiro
+    do Python usado como conjunto de bits: o bit j da linha i indica que o par (elemento i, elemento j)
+    pertence à relação. Assim, as propriedades e fechos são calculados com operações sobre linhas inteiras.
+    """
+
+    def __init__(self, relacao, elementos = None):
+
+        # Os elementos são todos os valores que aparecem na relação, na ordem em que aparecem.
+        if elementos is None: elementos = dict.fromkeys(valor for par in relacao for valor in par)
+
+        self.elementos = list(elementos)
+        self.indices = {elemento: indice for indice, elemento in enumerate(self.elementos)}
+        self.linhas = [0] * len(self.elementos)
+
+        # Elementos que aparecem como X, usados nas verificações de reflexividade.
+        self.dominio = 0
+
+        for x, y in relacao:
+            i = self.indices[x]
+            self.linhas[i] |= 1 << self.indices[y]
+            self.dominio |= 1 << i
+
+    def __copiar(self, linhas):
+        # Retorna uma nova matriz, com os mesmos elementos e as linhas recebidas.
+        matriz = MatrizDeBits([], self.elementos)
+        matriz.linhas, matriz.dominio = linhas, self.dominio
+        return matriz
+
+    def __obter_par(self, i, j):
+        return (self.elementos[i], self.elementos[j])
+
+    def obter_transposta(self) -> list:
+        """
+        Retorna as linhas da matriz transposta, na qual o bit i da linha j indica o par (elemento i, elemento j).
+        """
+        transposta = [0] * len(self.linhas)
+
+        for i, linha in enumerate(self.linhas):
+            for j in obter_bits(linha): transposta[j] |= 1 << i
+        return transposta
+
+    def para_relacao(self) -> list:
+        """
+        Retorna a relação como uma lista de pares.
+        """
+        return [self.__obter_par(i, j) for i, linha in enumerate(self.linhas) for j in obter_bits(linha)]
+
+    def prop_reflexiva(self):
+        for i in obter_bits(self.dominio):
+            if not self.linhas[i] >> i & 1:
+                return False, [False, self.__obter_par(i, i)]
+        return [True, None]
+
+    def prop_irreflexiva(self):
+        for i in obter_bits(self.dominio):
+            if self.linhas[i] >> i & 1:
+                return False, [True, self.__obter_par(i, i)]
+        return [True, None]
+
+    def prop_simetrica(self, transposta = None):
+        transposta = transposta or self.obter_transposta()
+
+        # Os bits da linha que não estão na transposta são pares (x, y) sem o par (y, x).
+        for i, (linha, coluna) in enumerate(zip(self.linhas, transposta)):
+            if linha & ~coluna:
+                return False, [False, self.__obter_par(menor_bit(linha & ~coluna), i)]
+        return [True, None]
+
+    def prop_anti_simetrica(self, transposta = None):
+        transposta = transposta or self.obter_transposta()
+
+        # Os bits presentes na linha e na transposta, fora da diagonal, são pares (x, y) e (y, x) com x != y.
+        for i, (linha, coluna) in enumerate(zip(self.linhas, transposta)):
+            if linha & coluna & ~(1 << i):
+                return False, [True, self.__obter_par(menor_bit(linha & coluna & ~(1 << i)), i)]
+        return [True, None]
+
+    def prop_assimetrica(self, transposta = None):
+        transposta = transposta or self.obter_transposta()
+
+        for i, (linha, coluna) in enumerate(zip(self.linhas, transposta)):
+            if linha & coluna:
+                return False, [True, self.__obter_par(menor_bit(linha & coluna), i)]
+        return [True, None]
+
+    def prop_transitiva(self):
+        linhas = self.linhas
+
+        # A composição da linha i é a união das linhas dos seus sucessores. Os bits da composição
+        # que não estão na linha são pares (x, z) que faltam na relação.
+        for i, linha in enumerate(linhas):
+            composicao = 0
+            for j in obter_bits(linha): composicao |= linhas[j]
+
+            if composicao & ~linha:
+                return False, [False, self.__obter_par(i, menor_bit(composicao & ~linha))]
+        return [True, None]
+
+    def obter_fecho_reflexivo(self):
+        """
+        Retorna o fecho reflexivo, adicionando o par (x, x) para todos os elementos da relação.
+        """
+        return self.__copiar([linha | 1 << i for i, linha in enumerate(self.linhas)])
+
+    def obter_fecho_simetrico(self):
+        """
+        Retorna o fecho simétrico, que é a união da relação com a sua transposta.
+        """
+        return self.__copiar([linha | coluna for linha, coluna in zip(self.linhas, self.obter_transposta())])
+
+    def obter_fecho_transitivo(self):
+        """
+        Retorna o fecho transitivo pelo algoritmo de Warshall: para cada elemento k, toda linha que
+        alcança k passa a alcançar também tudo o que k alcança, com uma única operação OR por linha.
+        """
+        linhas = self.linhas.copy()
+
+        for k in range(len(linhas)):
+            linha_k = linhas[k]
+            if not linha_k: continue
+
+            linhas = [linha | linha_k if linha >> k & 1 else linha for linha in linhas]
+        return self.__copiar(linhas)
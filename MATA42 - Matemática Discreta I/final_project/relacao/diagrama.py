@@ -1,102 +1,243 @@
+from .bits import MatrizDeBits, obter_bits
 from PIL import Image, ImageDraw
 import math
 
-def criar_diagrama(relacao, comprimento_de_linha = 100):
+def obter_reducao_transitiva(relacao):
     """
-    Obtém uma relação parcialmente ordenada e cria o seu Diagrama de Hasse, retornando
-    um dicionário com as posições dos seus pontos, uma lista com as coordenadas
-    de todas as linhas do diagrama e o tamanho (largura, altura) do diagrama.
+    Obtém uma relação parcialmente ordenada e retorna uma tupla (elementos, coberturas), na qual os elementos
+    estão em ordem topológica e as coberturas são um dicionário {x: [y1, y2...]} com os pares da redução
+    transitiva, isto é, os pares (x, y), com x diferente de y, tais que não existe z com x < z < y.
+
+    Os alcances de cada elemento são calculados uma única vez, como conjuntos de bits, em ordem
+    topológica inversa. Assim, as coberturas de x são os seus sucessores que não são alcançados
+    a partir de outro sucessor, obtidas com uma operação por par.
     """
+    matriz = MatrizDeBits(relacao)
+    elementos = matriz.elementos
+
+    # Remove a diagonal (pares (x, x)), que não aparece no diagrama.
+    sucessores = [linha & ~(1 << i) for i, linha in enumerate(matriz.linhas)]
+
+    # Ordena os elementos topologicamente (algoritmo de Kahn), mantendo a ordem original entre os independentes.
+    entradas = [0] * len(elementos)
+
+    for linha in sucessores:
+        for j in obter_bits(linha): entradas[j] += 1
+
+    ordem = [i for i, total in enumerate(entradas) if total == 0]
+
+    for i in ordem:
+        for j in obter_bits(sucessores[i]):
+            entradas[j] -= 1
+            if entradas[j] == 0: ordem.append(j)
+
+    if len(ordem) != len(elementos):
+        raise ValueError("A relação deve ser anti-simétrica para gerar o seu diagrama")
 
-    # Ordena a relação com base na quantidade de pares com um determinado X.
-    relacao = ordenar_relacao(relacao)
+    # Calcula os alcances em ordem topológica inversa, de forma que os alcances dos sucessores já estejam prontos.
+    alcances = [0] * len(elementos)
+    coberturas = dict()
 
-    # Mantém na relação apenas os pares que não possuem conexão com outros pares.
-    relacao = [(x, y) for x, y in relacao if not existe_conexao(relacao, x, y)]
+    for i in reversed(ordem):
+        alcance_dos_sucessores = 0
+        for j in obter_bits(sucessores[i]): alcance_dos_sucessores |= alcances[j]
 
-    menor_pos_x, maior_pos_x = 0, 0
-    menor_pos_y, maior_pos_y = 0, 0
+        alcances[i] = sucessores[i] | alcance_dos_sucessores
+        coberturas[elementos[i]] = [elementos[j] for j in obter_bits(sucessores[i] & ~alcance_dos_sucessores)]
 
-    posicoes = dict()
-    linhas = []
-    atual_x = None
-    roots = 0
+    return [elementos[i] for i in ordem], coberturas
 
-    # Percorre todos os pares (x, y) da relação para criar as linhas do diagrama.
-    for x, y in relacao:
+def obter_camadas(elementos, coberturas) -> dict:
+    """
+    Retorna a camada de cada elemento, dados os elementos em ordem topológica e as coberturas. A camada
+    de um elemento é o tamanho do maior caminho que termina nele, de forma que os elementos minimais
+    ficam na camada zero e todo par (x, y) do diagrama vai de uma camada para outra acima dela.
+    """
+    camadas = dict.fromkeys(elementos, 0)
 
-        # Caso o laço de repetição esteja iterando pares com um X diferente, o ângulo
-        # será resetado e uma nova razão para o ângulo será calculada.
-        if atual_x != x:
+    for x in elementos:
+        for y in coberturas[x]: camadas[y] = max(camadas[y], camadas[x] + 1)
+    return camadas
 
-            # Se o X não possuir uma raíz, a sua posição no diagrama
-            # será a coordenada raíz (0, 0) com a posição X somada à um comprimento N.
-            if not x in posicoes:
-                posicoes[x] = [0 + comprimento_de_linha * math.ceil(roots / 2) * ((-1) ** roots), 0]
-                roots += 1
+class VerticeAuxiliar(object):
+    """
+    Vértice sem valor, inserido em cada camada intermediária de uma linha que atravessa mais de uma camada.
+    """
 
-                menor_pos_x = min([posicoes[x][0], menor_pos_x])
-                maior_pos_x = max([posicoes[x][0], maior_pos_x])
-                menor_pos_y = min([posicoes[x][1], menor_pos_y])
-                maior_pos_y = max([posicoes[x][1], maior_pos_y])
+def obter_grafo_em_camadas(elementos, coberturas, camadas):
+    """
+    Divide as linhas que atravessam mais de uma camada com vértices auxiliares, de forma que toda linha
+    ligue duas camadas vizinhas. Retorna uma tupla (ordens, abaixo, acima, cadeias), na qual as ordens são
+    as listas de vértices de cada camada, abaixo e acima são dicionários com os vizinhos de cada vértice
+    nas camadas vizinhas e as cadeias são as listas de vértices percorridos por cada linha do diagrama.
+    """
+    ordens = [[] for camada in range(max(camadas.values()) + 1)]
+    abaixo, acima, cadeias = dict(), dict(), []
 
-            # Define o X e a posição atual no diagrama.
-            atual_x, posicao_atual = x, posicoes[x]
+    for elemento in elementos:
+        ordens[camadas[elemento]].append(elemento)
 
-            # Calcula a razão do ângulo e reseta o ângulo atual.
-            razao_do_angulo = 180 / obter_total_de_pares(relacao, x)
-            angulo, contador = 90, 0
+    for x in elementos:
+        for y in coberturas[x]:
+            cadeia = [x]
 
-        # Se o Y não tiver uma posição registrada, sua posição será calculada.
-        if not y in posicoes:
+            for camada in range(camadas[x] + 1, camadas[y]):
+                vertice = VerticeAuxiliar()
+                ordens[camada].append(vertice)
+                cadeia.append(vertice)
 
-            # Calcula um novo ângulo para a sua posição.
-            angulo += razao_do_angulo * contador * (1 if contador % 2 == 0 else -1)
-            contador += 1
+            cadeia.append(y)
+            cadeias.append(cadeia)
 
-            # Calcula a coordenada do Y, com base na coordenada atual.
-            posicoes[y] = obter_coordenada(*posicao_atual, angulo, comprimento_de_linha)
+            for u, v in zip(cadeia, cadeia[1:]):
+                acima.setdefault(u, []).append(v)
+                abaixo.setdefault(v, []).append(u)
 
-            menor_pos_x = min([posicoes[y][0], menor_pos_x])
-            maior_pos_x = max([posicoes[y][0], maior_pos_x])
-            menor_pos_y = min([posicoes[y][1], menor_pos_y])
-            maior_pos_y = max([posicoes[y][1], maior_pos_y])
+    return ordens, abaixo, acima, cadeias
 
-        # Adiciona à lista a linha, no formato [x1, y1, x2, y2].
-        linhas.append([*posicao_atual, *posicoes[y]])
+def contar_cruzamentos(ordens, acima) -> int:
+    """
+    Retorna o número de cruzamentos entre as linhas do diagrama. Entre duas camadas vizinhas, as linhas são
+    ordenadas pela posição do vértice de baixo, e cada par de linhas com posições de cima invertidas é um
+    cruzamento. As inversões são contadas com uma árvore de Fenwick.
+    """
+    total = 0
 
-    # Move o diagrama para que o menor XY seja zero.
-    for linha in linhas:
-        linha[0] += abs(menor_pos_x)
-        linha[2] += abs(menor_pos_x)
-        linha[1] += abs(menor_pos_y)
-        linha[3] += abs(menor_pos_y)
+    for camada in range(len(ordens) - 1):
+        posicoes = {vertice: indice for indice, vertice in enumerate(ordens[camada + 1])}
+        linhas = sorted((i, posicoes[v]) for i, u in enumerate(ordens[camada]) for v in acima.get(u, []))
+        arvore, inseridas = [0] * (len(ordens[camada + 1]) + 1), 0
 
-    for value in posicoes:
-        posicoes[value][0] += abs(menor_pos_x)
-        posicoes[value][1] += abs(menor_pos_y)
+        for i, j in linhas:
+            # Conta as linhas já inseridas cuja posição de cima é maior que j.
+            k, menores_ou_iguais = j + 1, 0
 
-    # Retorna os pontos e linhas do diagrama, e seu tamanho.
-    return posicoes, linhas, [math.ceil(maior_pos_x - menor_pos_x), math.ceil(maior_pos_y - menor_pos_y)]
+            while k > 0:
+                menores_ou_iguais += arvore[k]
+                k -= k & -k
+
+            total += inseridas - menores_ou_iguais
+            inseridas += 1
+            k = j + 1
 
-def existe_conexao(relacao, x, y, atual_x = None):
+            while k < len(arvore):
+                arvore[k] += 1
+                k += k & -k
+
+    return total
+
+def ordenar_por_baricentro(ordem, vizinhos, posicoes) -> list:
+    """
+    Ordena os vértices de uma camada pela média das posições dos seus vizinhos na camada anterior.
+    Os vértices sem vizinhos mantêm a sua posição atual.
     """
-    Verifica se a relação possui algum par, com um determinado Y,
-    que faça uma conexão com o par inicial.
+    chaves = dict()
+
+    for indice, vertice in enumerate(ordem):
+        posicoes_dos_vizinhos = [posicoes[vizinho] for vizinho in vizinhos.get(vertice, [])]
+        chaves[vertice] = sum(posicoes_dos_vizinhos) / len(posicoes_dos_vizinhos) if posicoes_dos_vizinhos else indice
+
+    return sorted(ordem, key = chaves.get)
+
+def reduzir_cruzamentos(ordens, abaixo, acima, iteracoes = 8) -> list:
+    """
+    Reduz os cruzamentos pelo método do baricentro, percorrendo as camadas alternadamente de baixo para
+    cima (ordenando pelos vizinhos abaixo) e de cima para baixo (pelos vizinhos acima). Retorna as
+    ordens com o menor número de cruzamentos encontrado.
+    """
+    ordens = [ordem.copy() for ordem in ordens]
+    melhores_ordens, menor_total = [ordem.copy() for ordem in ordens], contar_cruzamentos(ordens, acima)
+
+    for iteracao in range(iteracoes):
+        if menor_total == 0: break
+
+        subindo = iteracao % 2 == 0
+        camadas = range(1, len(ordens)) if subindo else range(len(ordens) - 2, -1, -1)
+
+        for camada in camadas:
+            vizinha = ordens[camada - 1 if subindo else camada + 1]
+            posicoes = {vertice: indice for indice, vertice in enumerate(vizinha)}
+            ordens[camada] = ordenar_por_baricentro(ordens[camada], abaixo if subindo else acima, posicoes)
 
-    Exemplo: Dado a relação [(1,1), (1,2), (1,5), (1,6), (2,2), (2,6)],
-    pela transitividade, existe uma conexão para o par (1,6), pois os
-    pares (1,2) e (2,6) existem na relação. O mesmo não pode ser dito
-    para o par (1,5).
+        total = contar_cruzamentos(ordens, acima)
+
+        if total < menor_total:
+            melhores_ordens, menor_total = [ordem.copy() for ordem in ordens], total
+
+    return melhores_ordens
+
+def atribuir_coordenadas(ordens, abaixo, acima, distancia, iteracoes = 4) -> dict:
     """
-    if atual_x is None: atual_x = x
-    if atual_x == y: return False
+    Retorna a coordenada horizontal de cada vértice. Os vértices começam igualmente espaçados e, a cada
+    iteração, são aproximados da média das coordenadas dos seus vizinhos, mantendo a ordem da camada e uma
+    distância mínima entre vizinhos (metade dela quando algum deles for um vértice auxiliar).
+    """
+    coordenadas = {vertice: indice * distancia for ordem in ordens for indice, vertice in enumerate(ordem)}
+
+    def obter_distancia(u, v):
+        return distancia if not isinstance(u, VerticeAuxiliar) and not isinstance(v, VerticeAuxiliar) else distancia / 2
+
+    for iteracao in range(iteracoes):
+        subindo = iteracao % 2 == 0
+        vizinhos = abaixo if subindo else acima
+
+        for ordem in (ordens if subindo else reversed(ordens)):
+            desejadas = []
+
+            for vertice in ordem:
+                coordenadas_dos_vizinhos = [coordenadas[vizinho] for vizinho in vizinhos.get(vertice, [])]
+                desejadas.append(sum(coordenadas_dos_vizinhos) / len(coordenadas_dos_vizinhos) if coordenadas_dos_vizinhos else coordenadas[vertice])
+
+            # Posiciona os vértices o mais próximo possível da coordenada desejada, da esquerda para a direita
+            # e da direita para a esquerda, e usa a média das duas, que também respeita as distâncias mínimas.
+            esquerda, direita = desejadas.copy(), desejadas.copy()
+
+            for i in range(1, len(ordem)):
+                esquerda[i] = max(esquerda[i], esquerda[i - 1] + obter_distancia(ordem[i - 1], ordem[i]))
+
+            for i in range(len(ordem) - 2, -1, -1):
+                direita[i] = min(direita[i], direita[i + 1] - obter_distancia(ordem[i], ordem[i + 1]))
 
-    for par in relacao:
-        if par[0] != atual_x or par[0] == par[1]: continue
-        if atual_x != x and par[1] == y: return True
-        if existe_conexao(relacao, x, y, par[1]): return True
-    return False
+            for vertice, x1, x2 in zip(ordem, esquerda, direita):
+                coordenadas[vertice] = (x1 + x2) / 2
+
+    # Move o diagrama para que a menor coordenada seja zero.
+    menor = min(coordenadas.values())
+    return {vertice: x - menor for vertice, x in coordenadas.items()}
+
+def criar_diagrama(relacao, comprimento_de_linha = 100):
+    """
+    Obtém uma relação parcialmente ordenada e cria o seu Diagrama de Hasse, retornando
+    um dicionário com as posições dos seus pontos, uma lista com as coordenadas
+    de todas as linhas do diagrama e o tamanho (largura, altura) do diagrama.
+
+    O diagrama é desenhado em camadas (método de Sugiyama): redução transitiva, atribuição das camadas
+    pelo maior caminho, redução de cruzamentos pelo baricentro e atribuição das coordenadas.
+    """
+
+    # Mantém apenas os pares que não são obtidos pela transitividade de outros pares.
+    elementos, coberturas = obter_reducao_transitiva(relacao)
+
+    # Uma relação vazia gera um diagrama vazio, sem pontos e sem linhas.
+    if not elementos: return dict(), [], [0, 0]
+
+    # Distribui os elementos em camadas pelo maior caminho, com os elementos minimais embaixo.
+    camadas = obter_camadas(elementos, coberturas)
+    maior_camada = max(camadas.values())
+
+    ordens, abaixo, acima, cadeias = obter_grafo_em_camadas(elementos, coberturas, camadas)
+    ordens = reduzir_cruzamentos(ordens, abaixo, acima)
+    coordenadas = atribuir_coordenadas(ordens, abaixo, acima, comprimento_de_linha)
+
+    # Obtém a posição de todos os vértices, incluindo os auxiliares, que são usados apenas nas linhas.
+    vertices = {vertice: [coordenadas[vertice], (maior_camada - camada) * comprimento_de_linha] for camada, ordem in enumerate(ordens) for vertice in ordem}
+    posicoes = {elemento: vertices[elemento] for elemento in elementos}
+
+    # Cria as linhas do diagrama, no formato [x1, y1, x2, y2]. Linhas que atravessam mais de uma camada são divididas em segmentos.
+    linhas = [[*vertices[u], *vertices[v]] for cadeia in cadeias for u, v in zip(cadeia, cadeia[1:])]
+
+    # Retorna os pontos e linhas do diagrama, e seu tamanho.
+    return posicoes, linhas, [math.ceil(max(coordenadas.values())), math.ceil(maior_camada * comprimento_de_linha)]
 
 def gerar_diagrama(nome_do_arquivo, relacao, comprimento_de_linha = 100, raio_do_ponto = 5, cores = [(255, 255, 255), (0, 0, 0)], texto = True):
     """
@@ -108,9 +249,25 @@ def gerar_diagrama(nome_do_arquivo, relacao, comprimento_de_linha = 100, raio_do
 
     # Obtém todos os pontos e linhas do diagrama.
     pontos, linhas, tamanho = criar_diagrama(relacao, comprimento_de_linha = comprimento_de_linha)
+    pontos = {valor: [v + raio_do_ponto + espaco for v in coord] for valor, coord in pontos.items()}
+
+    largura = tamanho[0] + raio_do_ponto * 2 + espaco * 2
+    altura = tamanho[1] + raio_do_ponto * 2 + espaco * 2
+    textos = dict()
+
+    # Mede todos os textos antes de criar a imagem, para que ela seja criada uma única vez, já com o tamanho final.
+    if texto:
+        medidor = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+
+        for valor, coord in pontos.items():
+            posicao = [coord[0] + raio_do_ponto + distancia_de_texto, coord[1]]
+            textos[valor] = posicao
+
+            esquerda, topo, direita, base = medidor.textbbox(posicao, str(valor))
+            largura, altura = max(largura, math.ceil(direita) + espaco), max(altura, math.ceil(base) + espaco)
 
     # Cria uma nova imagem RGB, e um canvas para desenhar na imagem.
-    imagem = Image.new("RGB", [v + raio_do_ponto * 2 + espaco * 2 for v in tamanho], cores[0])
+    imagem = Image.new("RGB", (largura, altura), cores[0])
     canvas = ImageDraw.Draw(imagem)
 
     # Desenha todas as linhas do diagrama.
@@ -118,37 +275,10 @@ def gerar_diagrama(nome_do_arquivo, relacao, comprimento_de_linha = 100, raio_do
         linha = [v + raio_do_ponto + espaco for v in linha]
         canvas.line(linha, fill = cores[1])
 
-    # Desenha todos os pontos do diagrama.
+    # Desenha todos os pontos do diagrama e, se a opção de texto estiver habilitada, o valor de cada ponto.
     for valor, coord in pontos.items():
-        coord = [v + raio_do_ponto + espaco for v in coord]
-        valor = str(valor)
-
-        # Se a opção de texto estiver habilitada, o valor de cada ponto será desenhado na imagem.
-        if texto:
+        if texto: canvas.text(textos[valor], str(valor), fill = cores[1])
 
-            # Obtém o tamanho do texto e o tamanho da imagem.
-            tamanho_de_texto = canvas.textsize(valor)
-            largura, altura = imagem.size
-
-            # Verifica se a largura da imagem será maior, caso o texto seja desenhado.
-            if tamanho_de_texto[0] + coord[0] + raio_do_ponto + distancia_de_texto > largura:
-                largura = math.ceil(tamanho_de_texto[0] + coord[0] + raio_do_ponto + distancia_de_texto)
-
-            # Se o texto ultrapassar a imagem, o tamanho da imagem será aumentada.
-            if imagem.size[0] != largura:
-
-                # Cria uma nova imagem, com um tamanho maior, copiando o conteúdo da imagem atual.
-                nova_imagem = Image.new("RGB", (largura + espaco, altura), cores[0])
-                nova_imagem.paste(imagem)
-
-                # Substitui a imagem atual pela nova imagem.
-                imagem = nova_imagem
-                canvas = ImageDraw.Draw(imagem)
-
-            # Desenha o texto na imagem.
-            canvas.text([coord[0] + raio_do_ponto + distancia_de_texto, coord[1]], valor, fill = cores[1])
-
-        # Desenha o ponto na imagem.
         canvas.ellipse(
             (
                 coord[0] - raio_do_ponto,
@@ -161,53 +291,3 @@ def gerar_diagrama(nome_do_arquivo, relacao, comprimento_de_linha = 100, raio_do
 
     # Salva a imagem.
     imagem.save(nome_do_arquivo)
-
-def obter_coordenada(x1, y1, angulo, distancia):
-    """
-    Obtém um coordenada inicial (x, y) e retorna uma
-    nova coordenada, dado um ângulo e uma distância.
-    """
-    y2 = distancia * math.sin(math.radians(angulo))
-    x2 = distancia * math.sin(math.radians(90 - angulo))
-    return [x1 + x2, y1 - y2]
-
-def obter_total_de_pares(relacao, x):
-    """
-    Retorna a quantidade de pares que a relação possui
-    com um determinado X.
-    """
-    contador = 0
-
-    for par in relacao:
-        if par[0] == x: contador += 1
-    return contador
-
-def ordenar_relacao(relacao):
-    """
-    Obtém uma relação e a ordena com base na quantidade
-    de pares com um determinado X.
-    """
-    relacao_original = relacao.copy()
-    relacao = relacao.copy()
-
-    relacao_ordenada = []
-    total_de_pares = {}
-
-    for i in range(len(relacao)):
-        maior, par_maior = 0, (0, 0)
-
-        for par in relacao:
-            # Se o total de pares para um determinado X não tiver sido obtido,
-            # ele será calculado e registrado no dicionário.
-            if not par[0] in total_de_pares:
-                total_de_pares[par[0]] = obter_total_de_pares(relacao_original, par[0])
-
-            # Verifica se a quantidade é maior e registra o par.
-            if total_de_pares[par[0]] > maior:
-                maior = total_de_pares[par[0]]
-                par_maior = par
-
-        # Adiciona o par à lista e o remove da relação.
-        relacao_ordenada.append(par_maior)
-        relacao.remove(par_maior)
-    return relacao_ordenada
@@ -0,0 +1,36 @@
+class Relacao(object):
+    """
+    Relação indexada: além dos pares, na ordem original, possui um conjunto dos pares e
+    dicionários com os sucessores e antecessores de cada elemento. Assim, verificar se um par
+    pertence à relação ou obter os pares que saem de um elemento não exige percorrer a lista.
+    """
+
+    def __init__(self, relacao):
+        self.pares = [tuple(par) for par in relacao]
+        self.conjunto = set(self.pares)
+
+        # Elementos que aparecem como X, na ordem em que aparecem na relação.
+        self.dominio = list(dict.fromkeys(x for x, y in self.pares))
+
+        self.sucessores = dict()
+        self.antecessores = dict()
+
+        # Os pares repetidos são indexados apenas uma vez, mantendo a ordem original.
+        for x, y in dict.fromkeys(self.pares):
+            self.sucessores.setdefault(x, []).append(y)
+            self.antecessores.setdefault(y, []).append(x)
+
+    def __contains__(self, par):
+        return tuple(par) in self.conjunto
+
+    def __iter__(self):
+        return iter(self.pares)
+
+    def __len__(self):
+        return len(self.pares)
+
+def indexar(relacao) -> Relacao:
+    """
+    Retorna a relação indexada. Caso ela já esteja indexada, é retornada sem alteração.
+    """
+    return relacao if isinstance(relacao, Relacao) else Relacao(relacao)
@@ -1,3 +1,6 @@
+from .bits import MatrizDeBits
+from .indice import indexar
+
 REFLEXIVA = "Reflexiva"
 IRREFLEXIVA = "Irreflexiva"
 SIMETRICA = "Simétrica"
@@ -7,50 +10,66 @@ TRANSITIVA = "Transitiva"
 CONGRUENCIA = "Congruência"
 
 def prop_reflexiva(relacao):
-    for x in set(x for x, y in relacao):
-        if relacao.count((x, x)) == 0:
+    relacao = indexar(relacao)
+
+    for x in relacao.dominio:
+        if not (x, x) in relacao.conjunto:
             return False, [False, (x, x)]
     return [True, None]
 
 def prop_irreflexiva(relacao):
-    for x in set(x for x, y in relacao):
-        if relacao.count((x, x)) == 1:
+    relacao = indexar(relacao)
+
+    for x in relacao.dominio:
+        if (x, x) in relacao.conjunto:
             return False, [True, (x, x)]
     return [True, None]
 
 def prop_simetrica(relacao):
-    for x, y in relacao:
-        if (y, x) not in relacao:
+    relacao = indexar(relacao)
+
+    for x, y in relacao.pares:
+        if (y, x) not in relacao.conjunto:
             return False, [False, (y, x)]
     return [True, None]
 
 def prop_anti_simetrica(relacao):
-    for x, y in relacao:
-        if (y, x) in relacao:
+    relacao = indexar(relacao)
+
+    for x, y in relacao.pares:
+        if (y, x) in relacao.conjunto:
             if x != y:
                 return False,[True, (y, x)]
     return [True, None]
 
 def prop_assimetrica(relacao):
-    for x, y in relacao:
-        if (y, x) in relacao:
+    relacao = indexar(relacao)
+
+    for x, y in relacao.pares:
+        if (y, x) in relacao.conjunto:
             return False, [True, (y, x)]
     return [True, None]
 
 def prop_transitiva(relacao):
-    for x, y in relacao:
-        for par in relacao:
-            if par[0] == y and not (x, par[1]) in relacao:
-                return False, [False, (x, par[1])]
+    relacao = indexar(relacao)
+
+    # Para cada par (x, y), apenas os pares que saem de y são verificados.
+    for x, y in relacao.pares:
+        for z in relacao.sucessores.get(y, []):
+            if not (x, z) in relacao.conjunto:
+                return False, [False, (x, z)]
     return [True, None]
 
 def prop_congruencia(relacao, modulo):
-    for x, y in relacao:
+    for x, y in indexar(relacao).pares:
         if (x - y) % modulo != 0:
             return False, [True, (x, y)]
     return [True, None]
 
 def obter_propriedades(relacao, modulo = None):
+    # A relação é indexada uma única vez e compartilhada por todas as verificações.
+    relacao = indexar(relacao)
+
     propriedades = {
         REFLEXIVA: prop_reflexiva(relacao),
         IRREFLEXIVA: prop_irreflexiva(relacao),
@@ -63,3 +82,36 @@ def obter_propriedades(relacao, modulo = None):
     if modulo:
         propriedades[CONGRUENCIA] = prop_congruencia(relacao, modulo)
     return propriedades
+
+def obter_propriedades_por_bits(relacao, modulo = None):
+    """
+    Equivalente a obter_propriedades(), porém com a relação armazenada como matriz de bits,
+    o que é mais rápido para relações densas sobre domínios com milhares de elementos.
+    """
+    matriz = MatrizDeBits(relacao)
+    transposta = matriz.obter_transposta()
+
+    propriedades = {
+        REFLEXIVA: matriz.prop_reflexiva(),
+        IRREFLEXIVA: matriz.prop_irreflexiva(),
+        SIMETRICA: matriz.prop_simetrica(transposta),
+        ANTI_SIMETRICA: matriz.prop_anti_simetrica(transposta),
+        ASSIMETRICA: matriz.prop_assimetrica(transposta),
+        TRANSITIVA: matriz.prop_transitiva()
+    }
+
+    if modulo:
+        propriedades[CONGRUENCIA] = prop_congruencia(relacao, modulo)
+    return propriedades
+
+def obter_fecho(relacao, propriedade) -> list:
+    """
+    Retorna o fecho reflexivo, simétrico ou transitivo da relação, como uma lista de pares.
+    """
+    matriz = MatrizDeBits(relacao)
+
+    if propriedade == REFLEXIVA: return matriz.obter_fecho_reflexivo().para_relacao()
+    if propriedade == SIMETRICA: return matriz.obter_fecho_simetrico().para_relacao()
+    if propriedade == TRANSITIVA: return matriz.obter_fecho_transitivo().para_relacao()
+
+    raise ValueError("Não é possível gerar o fecho da propriedade \"{}\"".format(propriedade))